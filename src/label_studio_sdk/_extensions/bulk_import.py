@@ -0,0 +1,450 @@
+"""
+Bulk task import for `client.projects.bulk_import`.
+
+A single POST to /api/projects/{id}/import is limited to 250K tasks / 200 MB, so large imports are streamed from
+their source, packed into size-bounded chunks and uploaded concurrently. On editions that import asynchronously,
+the returned imports are polled together. Progress is kept in an optional checkpoint file, so an interrupted
+import can be started again with the same arguments and only uploads the chunks that did not complete.
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from label_studio_sdk.core.api_error import ApiError
+
+if typing.TYPE_CHECKING:
+    from label_studio_sdk.projects.client import AsyncProjectsClient, ProjectsClient
+    from label_studio_sdk.tasks.client import AsyncTasksClient, TasksClient
+
+logger = logging.getLogger(__name__)
+
+TaskSource = typing.Union[str, "os.PathLike[str]", typing.Iterable[typing.Dict[str, typing.Any]]]
+
+DEFAULT_CHUNK_SIZE = 5000
+# well below the 200 MB per request accepted by the server
+DEFAULT_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+DEFAULT_CONCURRENCY = 4
+DEFAULT_POLL_INTERVAL = 1.0
+
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+_CSV_DELIMITERS = {".csv": ",", ".tsv": "\t"}
+
+
+class BulkImportFailedError(ApiError):
+    """Raised when chunks failed to upload or import; `failed` maps their indexes to the errors."""
+
+    def __init__(self, failed: typing.Dict[int, str]):
+        self.failed = failed
+        # the chunks failed for different reasons, there is no single HTTP status to report
+        super().__init__(
+            body=(
+                f"Bulk import failed for {len(failed)} chunk(s): {failed}. "
+                f"Run the import again with the same checkpoint to retry only these chunks."
+            ),
+        )
+
+
+@dataclass
+class BulkImportResult:
+    chunks: int = 0
+    task_count: int = 0
+    # chunks already imported by a previous run with the same checkpoint
+    skipped_chunks: int = 0
+    import_ids: typing.List[int] = field(default_factory=list)
+
+
+def iter_source_tasks(source: TaskSource) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Yield tasks one by one from a JSON array, NDJSON, CSV or TSV file, or from any iterable of task dicts."""
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix in _NDJSON_SUFFIXES:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix in _CSV_DELIMITERS:
+        # rows are imported as flat tasks, the server maps the columns to task data like for uploaded CSV files
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f, delimiter=_CSV_DELIMITERS[suffix])
+    elif suffix == ".json":
+        import ijson
+
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        raise ValueError(f"Unsupported task file format: {path}. Use .json, .ndjson, .jsonl, .csv or .tsv")
+
+
+def iter_task_chunks(
+    tasks: typing.Iterable[typing.Dict[str, typing.Any]], chunk_size: int, max_chunk_bytes: int
+) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+    """
+    Pack tasks into chunks of at most `chunk_size` tasks and about `max_chunk_bytes` of JSON.
+    A single task larger than `max_chunk_bytes` is sent in a chunk of its own.
+    Chunk boundaries only depend on the tasks and the limits, which is what makes checkpoints reusable.
+    """
+    chunk: typing.List[typing.Dict[str, typing.Any]] = []
+    chunk_bytes = 2
+    for task in tasks:
+        # the compact encoding plus the separating comma
+        task_bytes = len(json.dumps(task, ensure_ascii=False, separators=(",", ":")).encode("utf-8")) + 1
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + task_bytes > max_chunk_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 2
+        chunk.append(task)
+        chunk_bytes += task_bytes
+    if chunk:
+        yield chunk
+
+
+def _source_identity(source: TaskSource) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    # a file that changed since the checkpoint was written would be chunked differently
+    if not isinstance(source, (str, os.PathLike)):
+        return None
+    stat = os.stat(source)
+    return {"path": str(Path(source).resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _chunk_digest(chunk: typing.List[typing.Dict[str, typing.Any]]) -> str:
+    return hashlib.sha256(json.dumps(chunk, ensure_ascii=False, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+class _Checkpoint:
+    """
+    JSON file recording which chunks are imported ("completed") and which were uploaded
+    and are still being processed by the server ("pending": chunk index -> import id).
+    The import settings, the source file and the digest of the first chunk identify the import it belongs to.
+    It is rewritten atomically after each change, so it is consistent even if the process is killed.
+    """
+
+    def __init__(self, path: typing.Optional[typing.Union[str, "os.PathLike[str]"]], settings: typing.Dict[str, typing.Any]):
+        self.path = Path(path) if path is not None else None
+        self.settings = settings
+        self.completed: typing.Dict[int, int] = {}
+        self.pending: typing.Dict[int, int] = {}
+        self.first_chunk: typing.Optional[str] = None
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            state = json.loads(self.path.read_text())
+            if state.get("settings") != settings:
+                raise ValueError(
+                    f"Checkpoint {self.path} was written for a different import ({state.get('settings')}), "
+                    f"remove it or pass another checkpoint path"
+                )
+            self.completed = {int(index): count for index, count in state.get("completed", {}).items()}
+            self.pending = {int(index): import_id for index, import_id in state.get("pending", {}).items()}
+            self.first_chunk = state.get("first_chunk")
+
+    def check_first_chunk(self, chunk: typing.List[typing.Dict[str, typing.Any]]) -> None:
+        # iterable sources have no file to identify them, their first chunk must match instead
+        digest = _chunk_digest(chunk)
+        with self._lock:
+            if self.first_chunk is None:
+                self.first_chunk = digest
+                self._save()
+            elif self.first_chunk != digest:
+                raise ValueError(
+                    f"Checkpoint {self.path} was written for an import of different tasks, "
+                    f"remove it or pass another checkpoint path"
+                )
+
+    def mark_pending(self, index: int, import_id: int) -> None:
+        with self._lock:
+            self.pending[index] = import_id
+            self._save()
+
+    def mark_completed(self, index: int, task_count: int) -> None:
+        with self._lock:
+            self.pending.pop(index, None)
+            self.completed[index] = task_count
+            self._save()
+
+    def mark_failed(self, index: int) -> None:
+        with self._lock:
+            self.pending.pop(index, None)
+            self._save()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        state = {
+            "settings": self.settings,
+            "first_chunk": self.first_chunk,
+            "completed": self.completed,
+            "pending": self.pending,
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.path)
+
+
+def _import_options(import_kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # the import id is read from the response model, even if the client uses the "raw" response mode
+    request_options = {**(import_kwargs.get("request_options") or {}), "response_mode": "model"}
+    return {**import_kwargs, "request_options": request_options}
+
+
+class _BulkImportState:
+    """Bookkeeping shared by the sync and async importers."""
+
+    def __init__(
+        self,
+        project_id: int,
+        source: TaskSource,
+        chunk_size: int,
+        max_chunk_bytes: int,
+        checkpoint: typing.Optional[typing.Union[str, "os.PathLike[str]"]],
+    ):
+        self.project_id = project_id
+        settings = {
+            "project": project_id,
+            "chunk_size": chunk_size,
+            "max_chunk_bytes": max_chunk_bytes,
+            "source": _source_identity(source),
+        }
+        self.checkpoint = _Checkpoint(checkpoint, settings)
+        self.chunk_sizes: typing.Dict[int, int] = {}
+        self.failed: typing.Dict[int, str] = {}
+        self.result = BulkImportResult()
+
+    def should_upload(self, index: int, chunk: typing.List[typing.Dict[str, typing.Any]]) -> bool:
+        if index == 0 and self.checkpoint.path is not None:
+            self.checkpoint.check_first_chunk(chunk)
+        self.result.chunks += 1
+        self.chunk_sizes[index] = len(chunk)
+        if index in self.checkpoint.completed:
+            self.result.skipped_chunks += 1
+            self.result.task_count += self.checkpoint.completed[index]
+            return False
+        if index in self.checkpoint.pending:
+            # uploaded by a previous run, the import is polled instead of being uploaded twice
+            self.result.import_ids.append(self.checkpoint.pending[index])
+            return False
+        return True
+
+    def on_uploaded(self, index: int, response: typing.Any) -> None:
+        import_id = getattr(response, "import_", None)
+        if import_id is None:
+            # Community edition imports synchronously and reports the created tasks right away
+            task_count = response.task_count if response.task_count is not None else self.chunk_sizes[index]
+            self.checkpoint.mark_completed(index, task_count)
+            self.result.task_count += task_count
+        else:
+            self.checkpoint.mark_pending(index, import_id)
+            self.result.import_ids.append(import_id)
+
+    def on_status(self, index: int, status: typing.Any) -> None:
+        if status.status == "completed":
+            task_count = status.task_count if status.task_count is not None else self.chunk_sizes.get(index, 0)
+            self.checkpoint.mark_completed(index, task_count)
+            self.result.task_count += task_count
+        elif status.status == "failed":
+            logger.error(f"Import {self.checkpoint.pending[index]} of chunk {index} failed: {status.error}")
+            self.failed[index] = status.error or "failed"
+            self.checkpoint.mark_failed(index)
+
+    def on_upload_error(self, index: int, error: BaseException) -> None:
+        logger.error(f"Upload of chunk {index} failed: {error}")
+        self.failed[index] = str(error)
+
+    def on_status_error(self, index: int, error: BaseException) -> None:
+        # a transient error (5xx, dropped connection) must not abort the import, the next poll checks it again
+        logger.warning(f"Status check of import {self.checkpoint.pending[index]} of chunk {index} failed: {error}")
+
+    def poll_timed_out(self, poll_timeout: typing.Optional[float], started: float) -> bool:
+        if poll_timeout is None or time.monotonic() - started < poll_timeout:
+            return False
+        # the imports stay pending in the checkpoint, so running the import again resumes polling them
+        for index, import_id in self.checkpoint.pending.items():
+            logger.error(f"Import {import_id} of chunk {index} still pending after {poll_timeout}s")
+            self.failed[index] = f"import {import_id} still pending after {poll_timeout}s"
+        return True
+
+    def finish(self) -> BulkImportResult:
+        if self.failed:
+            raise BulkImportFailedError(self.failed)
+        return self.result
+
+
+class BulkImporter:
+
+    def __init__(self, projects: "ProjectsClient", tasks: "TasksClient"):
+        self._projects = projects
+        self._tasks = tasks
+
+    def run(
+        self,
+        project_id: int,
+        source: TaskSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: typing.Optional[typing.Union[str, "os.PathLike[str]"]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: typing.Optional[float] = None,
+        **import_kwargs: typing.Any,
+    ) -> BulkImportResult:
+        state = _BulkImportState(project_id, source, chunk_size, max_chunk_bytes, checkpoint)
+        import_kwargs = _import_options(import_kwargs)
+        concurrency = max(concurrency, 1)
+
+        def _upload(chunk: typing.List[typing.Dict[str, typing.Any]]) -> typing.Any:
+            return self._projects.import_tasks(project_id, request=chunk, **import_kwargs)
+
+        in_flight: typing.Dict[Future, int] = {}
+
+        def _collect(done: typing.Iterable[Future]) -> None:
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    state.on_uploaded(index, future.result())
+                except Exception as e:
+                    state.on_upload_error(index, e)
+
+        last_poll = time.monotonic()
+        # uploads and status polls get their own workers, so polling doesn't wait for upload slots
+        with ThreadPoolExecutor(concurrency) as executor, ThreadPoolExecutor(concurrency) as poll_executor:
+            try:
+                chunks = iter_task_chunks(iter_source_tasks(source), chunk_size, max_chunk_bytes)
+                for index, chunk in enumerate(chunks):
+                    if not state.should_upload(index, chunk):
+                        continue
+                    # keep the source streaming: never hold more chunks than there are upload slots
+                    while len(in_flight) >= concurrency:
+                        done, _ = wait(in_flight, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                        _collect(done)
+                        if time.monotonic() - last_poll >= poll_interval:
+                            self._poll(state, poll_executor)
+                            last_poll = time.monotonic()
+                    in_flight[executor.submit(_upload, chunk)] = index
+                wait(in_flight)
+            except BaseException:
+                # interrupted (Ctrl-C, a bad row in the source): the uploads that didn't start are dropped
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            finally:
+                # the uploads already sent are recorded in the checkpoint, so a resume doesn't import them twice
+                _collect([future for future in in_flight if not future.cancelled()])
+
+            poll_started = time.monotonic()
+            while state.checkpoint.pending:
+                self._poll(state, poll_executor)
+                if not state.checkpoint.pending or state.poll_timed_out(poll_timeout, poll_started):
+                    break
+                time.sleep(poll_interval)
+        return state.finish()
+
+    def _poll(self, state: _BulkImportState, executor: ThreadPoolExecutor) -> None:
+        pending = list(state.checkpoint.pending.items())
+        futures = [
+            executor.submit(
+                self._tasks.create_many_status,
+                id=state.project_id,
+                import_pk=import_id,
+                request_options={"response_mode": "model"},
+            )
+            for _, import_id in pending
+        ]
+        for (index, _), future in zip(pending, futures):
+            try:
+                status = future.result()
+            except Exception as e:
+                state.on_status_error(index, e)
+            else:
+                state.on_status(index, status)
+
+
+class AsyncBulkImporter:
+
+    def __init__(self, projects: "AsyncProjectsClient", tasks: "AsyncTasksClient"):
+        self._projects = projects
+        self._tasks = tasks
+
+    async def run(
+        self,
+        project_id: int,
+        source: TaskSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: typing.Optional[typing.Union[str, "os.PathLike[str]"]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: typing.Optional[float] = None,
+        **import_kwargs: typing.Any,
+    ) -> BulkImportResult:
+        state = _BulkImportState(project_id, source, chunk_size, max_chunk_bytes, checkpoint)
+        import_kwargs = _import_options(import_kwargs)
+        concurrency = max(concurrency, 1)
+        in_flight: typing.Dict["asyncio.Task[typing.Any]", int] = {}
+
+        def _collect(done: typing.Iterable["asyncio.Task[typing.Any]"]) -> None:
+            for task in done:
+                index = in_flight.pop(task)
+                try:
+                    state.on_uploaded(index, task.result())
+                except Exception as e:
+                    state.on_upload_error(index, e)
+
+        last_poll = time.monotonic()
+        try:
+            chunks = iter_task_chunks(iter_source_tasks(source), chunk_size, max_chunk_bytes)
+            for index, chunk in enumerate(chunks):
+                if not state.should_upload(index, chunk):
+                    continue
+                while len(in_flight) >= concurrency:
+                    done, _ = await asyncio.wait(in_flight, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+                    _collect(done)
+                    if time.monotonic() - last_poll >= poll_interval:
+                        await self._poll(state)
+                        last_poll = time.monotonic()
+                upload = self._projects.import_tasks(project_id, request=chunk, **import_kwargs)
+                in_flight[asyncio.ensure_future(upload)] = index
+            if in_flight:
+                _collect((await asyncio.wait(in_flight))[0])
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        poll_started = time.monotonic()
+        while state.checkpoint.pending:
+            await self._poll(state)
+            if not state.checkpoint.pending or state.poll_timed_out(poll_timeout, poll_started):
+                break
+            await asyncio.sleep(poll_interval)
+        return state.finish()
+
+    async def _poll(self, state: _BulkImportState) -> None:
+        pending = list(state.checkpoint.pending.items())
+        statuses = await asyncio.gather(
+            *(
+                self._tasks.create_many_status(
+                    id=state.project_id, import_pk=import_id, request_options={"response_mode": "model"}
+                )
+                for _, import_id in pending
+            ),
+            # one failed status check must neither abort the others nor leave them running
+            return_exceptions=True,
+        )
+        for (index, _), status in zip(pending, statuses):
+            if isinstance(status, Exception):
+                state.on_status_error(index, status)
+            elif isinstance(status, BaseException):
+                raise status
+            else:
+                state.on_status(index, status)
@@ -0,0 +1,253 @@
+"""asyncio versions of get_local_path and download_and_cache for ML backends serving predictions with asyncio
+
+URLs are resolved like in io.py and files are downloaded to the same paths, so sync and async callers
+share cached files (including the `get_media_cache()` budget and its locks).
+"""
+import asyncio
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import httpx
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_POOL_SIZE,
+    VERIFY_SSL,
+    _build_headers,
+    _cache_filepath,
+    _check_partial_size,
+    _discard_partial,
+    _fallback_filepath,
+    _finish_partial,
+    _partial_paths,
+    _resolve_local_path,
+    _resume_headers,
+    _start_partial,
+    get_cache_dir,
+    get_media_cache,
+)
+from label_studio_sdk._extensions.label_studio_tools.core.utils.params import get_env
+
+# downloads running at the same time in one event loop, concurrent requests for the same file count once
+ASYNC_DOWNLOAD_CONCURRENCY = int(get_env("ASYNC_DOWNLOAD_CONCURRENCY", default=DOWNLOAD_POOL_SIZE))
+
+logger = logging.getLogger(__name__)
+
+# threads waiting for media cache locks held by other processes, separate from the default executor
+# so a download holding a lock never waits for a thread taken by a lock waiter
+_lock_waits = ThreadPoolExecutor(max_workers=64, thread_name_prefix="media-cache-lock")
+
+
+def create_async_download_client(pool_size=DOWNLOAD_POOL_SIZE, retries=3):
+    """httpx.AsyncClient for downloading many media files: keeps up to pool_size connections,
+    follows redirects (presign URLs redirect to the storage) and retries failed connections.
+    Unlike `create_download_session` it doesn't retry 429/5xx responses.
+    """
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = httpx.AsyncHTTPTransport(verify=VERIFY_SSL, retries=retries, limits=limits)
+    return httpx.AsyncClient(transport=transport, follow_redirects=True, timeout=httpx.Timeout(60.0))
+
+
+class _LoopDownloads:
+    """Downloads of one event loop, asyncio objects and httpx clients can't be shared between loops"""
+
+    def __init__(self):
+        self.client = None
+        self.semaphore = asyncio.Semaphore(ASYNC_DOWNLOAD_CONCURRENCY)
+        # filepath -> task downloading it
+        self.inflight = {}
+        # media cache lock file -> asyncio.Lock, so one task per lock file waits for other processes
+        self.lock_files = {}
+
+
+_loop_downloads = weakref.WeakKeyDictionary()
+
+
+def _downloads():
+    loop = asyncio.get_running_loop()
+    state = _loop_downloads.get(loop)
+    if state is None:
+        state = _loop_downloads[loop] = _LoopDownloads()
+    return state
+
+
+def get_async_download_client():
+    """AsyncClient of the running event loop used when no client is passed, created on first use
+    with a pool of ASYNC_DOWNLOAD_CONCURRENCY connections. Close it with `close_async_download_client()` on shutdown.
+    """
+    state = _downloads()
+    if state.client is None:
+        state.client = create_async_download_client(pool_size=ASYNC_DOWNLOAD_CONCURRENCY)
+    return state.client
+
+
+async def close_async_download_client():
+    state = _downloads()
+    if state.client is not None:
+        client, state.client = state.client, None
+        await client.aclose()
+
+
+async def async_get_local_path(
+    url,
+    cache_dir=None,
+    project_dir=None,
+    hostname=None,
+    image_dir=None,
+    access_token=None,
+    download_resources=True,
+    task_id=None,
+    client=None,
+):
+    """`get_local_path` for asyncio: resolves url with the same rules and downloads it to the same path
+
+    Concurrent calls for the same file share one download, at most ASYNC_DOWNLOAD_CONCURRENCY
+    downloads run at the same time in an event loop.
+
+    :param client: httpx.AsyncClient to download with, `get_async_download_client()` if None
+    :return: filepath
+    """
+    # may copy a local file into the cache dir
+    filepath, download_args = await asyncio.to_thread(
+        _resolve_local_path, url, cache_dir, project_dir, hostname, image_dir, access_token, download_resources, task_id
+    )
+    if filepath is not None:
+        return filepath
+    return await async_download_and_cache(**download_args, client=client)
+
+
+async def async_download_and_cache(
+    url,
+    cache_dir,
+    download_resources,
+    hostname,
+    access_token,
+    is_local_storage_file,
+    is_cloud_storage_file,
+    is_storage_data_file,
+    storage_filepath,
+    fallback_upload_url=None,
+    client=None,
+):
+    # the media cache index is an sqlite database, it is opened and queried in a thread like the other file I/O
+    media_cache = await asyncio.to_thread(get_media_cache) if not cache_dir and download_resources else None
+    if media_cache is not None:
+        cache_dir = media_cache.cache_dir
+    cache_dir = cache_dir or get_cache_dir()
+    filepath = _cache_filepath(
+        cache_dir, url, is_local_storage_file, is_cloud_storage_file, is_storage_data_file, storage_filepath
+    )
+
+    if media_cache is not None:
+        if await asyncio.to_thread(media_cache.get, filepath):
+            return filepath
+    elif os.path.exists(filepath) or not download_resources:
+        return filepath
+
+    state = _downloads()
+    task = state.inflight.get(filepath)
+    if task is None:
+        task = asyncio.ensure_future(
+            _download(state, media_cache, filepath, url, cache_dir, hostname, access_token, fallback_upload_url, client)
+        )
+        state.inflight[filepath] = task
+        task.add_done_callback(lambda done: _download_done(state, filepath, done))
+    # a cancelled caller doesn't cancel the download others wait for
+    return await asyncio.shield(task)
+
+
+def _download_done(state, filepath, task):
+    state.inflight.pop(filepath, None)
+    if not task.cancelled():
+        # retrieved, even if every caller was cancelled
+        task.exception()
+
+
+async def _download(state, media_cache, filepath, url, cache_dir, hostname, access_token, fallback_upload_url, client):
+    if media_cache is None:
+        return await _fetch(state, filepath, url, cache_dir, hostname, access_token, fallback_upload_url, client)
+    # processes and threads downloading the same file wait for the first one
+    async with _media_cache_lock(state, media_cache, filepath):
+        if await asyncio.to_thread(media_cache.get, filepath):
+            return filepath
+        filepath = await _fetch(state, filepath, url, cache_dir, hostname, access_token, fallback_upload_url, client)
+        # indexing the file can evict others
+        await asyncio.to_thread(media_cache.add, filepath)
+        return filepath
+
+
+@asynccontextmanager
+async def _media_cache_lock(state, media_cache, path):
+    async with state.lock_files.setdefault(media_cache.lock_path(path), asyncio.Lock()):
+        lock = media_cache.lock(path)
+        await asyncio.get_running_loop().run_in_executor(_lock_waits, lock.__enter__)
+        try:
+            yield
+        finally:
+            lock.__exit__(None, None, None)
+
+
+async def _fetch(state, filepath, url, cache_dir, hostname, access_token, fallback_upload_url, client):
+    http = client or get_async_download_client()
+    async with state.semaphore:
+        try:
+            r = await _get_resumable(http, url, _build_headers(url, hostname, access_token), filepath)
+        except httpx.HTTPStatusError as e:
+            if not fallback_upload_url:
+                raise e
+            logger.info("Download failed for proxy URL, retrying legacy upload path: %s", fallback_upload_url)
+            fb_filepath = _fallback_filepath(cache_dir, fallback_upload_url)
+            if os.path.exists(fb_filepath):
+                return fb_filepath
+            fb_headers = _build_headers(fallback_upload_url, hostname, access_token)
+            try:
+                r = await _get_resumable(http, fallback_upload_url, fb_headers, fb_filepath)
+            except Exception:
+                raise e
+            filepath = fb_filepath
+        try:
+            await async_save_response(r, filepath)
+        finally:
+            await r.aclose()
+    logger.info(f"File downloaded to {filepath}")
+    return filepath
+
+
+async def _get_resumable(client, url, headers, filepath):
+    """Streamed GET of url like io._get_resumable, raises httpx.HTTPStatusError on error responses"""
+    resume_headers = _resume_headers(headers, filepath)
+    r = await client.send(client.build_request("GET", url, headers=resume_headers), stream=True)
+    if r.status_code == 416 and resume_headers is not headers:
+        # the partial file is longer than the resource now
+        await r.aclose()
+        logger.info(f"Can't resume download of {url}, downloading it again")
+        _discard_partial(filepath)
+        r = await client.send(client.build_request("GET", url, headers=headers), stream=True)
+    if r.is_error:
+        await r.aclose()
+        r.raise_for_status()
+    return r
+
+
+async def async_save_response(r, filepath, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """`save_response` for a streamed httpx.Response: writes filepath.part as chunks arrive,
+    checks its size and renames it to filepath, an interrupted download is resumed next time
+    """
+    part_path, _ = _partial_paths(filepath)
+    offset, expected_size, resumable = _start_partial(r.status_code, r.headers, filepath)
+    try:
+        with open(part_path, mode="ab" if offset else "wb") as fout:
+            async for chunk in r.aiter_bytes(chunk_size):
+                fout.write(chunk)
+            fout.flush()
+            await asyncio.to_thread(os.fsync, fout.fileno())
+        _check_partial_size(filepath, expected_size)
+    except BaseException:
+        if not resumable:
+            _discard_partial(filepath)
+        raise
+    # reads the whole file with VERIFY_DOWNLOAD_ETAG
+    await asyncio.to_thread(_finish_partial, filepath, r.headers.get("ETag"))
@@ -3,7 +3,9 @@ import hashlib
 import io
 import logging
 import os
+import re
 import shutil
+import threading
 from contextlib import contextmanager
 from tempfile import mkdtemp
 from urllib.parse import parse_qs, urlparse
@@ -11,7 +13,10 @@ from urllib.parse import parse_qs, urlparse
 import jwt
 import requests
 from appdirs import user_cache_dir, user_data_dir
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from label_studio_sdk._extensions.label_studio_tools.core.utils.media_cache import MediaCache
 from label_studio_sdk._extensions.label_studio_tools.core.utils.params import get_env
 
 _DIR_APP_NAME = "label-studio"
@@ -19,6 +24,11 @@ LOCAL_FILES_DOCUMENT_ROOT = get_env(
     "LOCAL_FILES_DOCUMENT_ROOT", default=os.path.abspath(os.sep)
 )
 VERIFY_SSL = get_env("VERIFY_SSL", default=True, is_bool=True)
+# compare downloads with an MD5 ETag (S3 single part uploads, plain web servers use other ETags)
+VERIFY_DOWNLOAD_ETAG = get_env("VERIFY_DOWNLOAD_ETAG", default=False, is_bool=True)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# connections per host kept by the shared download session, set it to the number of downloading threads
+DOWNLOAD_POOL_SIZE = int(get_env("DOWNLOAD_POOL_SIZE", default=10))
 
 logger = logging.getLogger(__name__)
 
@@ -90,10 +100,216 @@ def _build_headers(target_url, hostname, access_token):
     return headers
 
 
+def create_download_session(pool_size=10, retries=3):
+    """requests.Session for downloading many media files: keeps up to pool_size connections per host
+    and retries connection errors and 429/5xx responses with backoff.
+    After the last retry the response is returned as is, so `raise_for_status` behaves like a plain requests.get.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_download_session = None
+# pid the shared session was created in, None for a session set with set_download_session
+_download_session_pid = None
+_download_session_lock = threading.Lock()
+
+
+def get_download_session():
+    """Session shared by get_local_path, download_and_cache and get_base64_content when no session is passed
+
+    Created on first use with `create_download_session(pool_size=DOWNLOAD_POOL_SIZE)`, so connections
+    to Label Studio and storage hosts are kept alive between downloads. Forked processes create their own.
+    """
+    global _download_session, _download_session_pid
+    session = _download_session
+    if session is not None and _download_session_pid in (None, os.getpid()):
+        return session
+    with _download_session_lock:
+        if _download_session is None or _download_session_pid not in (None, os.getpid()):
+            _download_session = create_download_session(pool_size=DOWNLOAD_POOL_SIZE)
+            _download_session_pid = os.getpid()
+        return _download_session
+
+
+def set_download_session(session):
+    """Use session for downloads without an explicit session, None goes back to the default one
+
+    For example an ML backend predicting in 32 threads:
+        set_download_session(create_download_session(pool_size=32))
+    """
+    global _download_session, _download_session_pid
+    with _download_session_lock:
+        _download_session = session
+        _download_session_pid = None
+
+
+_media_cache = None
+_media_cache_pid = None
+_media_cache_lock = threading.Lock()
+
+
+def get_media_cache():
+    """MediaCache of `get_cache_dir()`, where get_local_path downloads files when no cache_dir is passed
+
+    Its size is bounded by MEDIA_CACHE_MAX_BYTES (10 GiB by default, 0 for unlimited), least recently used
+    downloads are removed over it. Hit, miss and eviction counts are in `get_media_cache().metrics()`.
+    """
+    global _media_cache, _media_cache_pid
+    cache_dir = os.path.abspath(get_cache_dir())
+    with _media_cache_lock:
+        if _media_cache is None or _media_cache_pid != os.getpid() or _media_cache.cache_dir != cache_dir:
+            _media_cache = MediaCache(cache_dir)
+            _media_cache_pid = os.getpid()
+        return _media_cache
+
+
 def _build_cache_path(cache_dir, target_url, filename):
     return os.path.join(cache_dir, hashlib.md5(target_url.encode(), usedforsecurity=False).hexdigest()[:8] + "__" + filename)
 
 
+class IncompleteDownloadError(IOError):
+    """Downloaded file doesn't match the size or ETag the server announced"""
+
+
+def _partial_paths(filepath):
+    # the partial file and the ETag or Last-Modified it was downloaded with, a resume must match it
+    return filepath + ".part", filepath + ".part.validator"
+
+
+def _resume_headers(headers, filepath):
+    """headers continuing an interrupted download of filepath with a Range request, if it can be resumed"""
+    part_path, validator_path = _partial_paths(filepath)
+    try:
+        offset = os.path.getsize(part_path)
+        with open(validator_path) as f:
+            validator = f.read()
+    except OSError:
+        return headers
+    if not offset or not validator:
+        return headers
+    return dict(headers, Range=f"bytes={offset}-", **{"If-Range": validator})
+
+
+def _discard_partial(filepath):
+    for path in _partial_paths(filepath):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _get_resumable(http, url, headers, filepath):
+    """GET url as a stream, asking only for the missing part of an interrupted download of filepath"""
+    resume_headers = _resume_headers(headers, filepath)
+    r = http.get(url, stream=True, headers=resume_headers, verify=VERIFY_SSL)
+    if r.status_code == 416 and resume_headers is not headers:
+        # the partial file is longer than the resource now
+        logger.info(f"Can't resume download of {url}, downloading it again")
+        _discard_partial(filepath)
+        r = http.get(url, stream=True, headers=headers, verify=VERIFY_SSL)
+    return r
+
+
+def save_response(r, filepath, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """Stream a response of `_get_resumable` to filepath without buffering it in memory
+
+    Chunks are written to filepath.part, which is fsynced and renamed to filepath only when complete,
+    so filepath is never a truncated file. A partial file stays for the next attempt to resume if the
+    transfer fails, or if the size (or, with VERIFY_DOWNLOAD_ETAG, the MD5 ETag) doesn't match.
+    """
+    part_path, _ = _partial_paths(filepath)
+    offset, expected_size, resumable = _start_partial(r.status_code, r.headers, filepath)
+    try:
+        with io.open(part_path, mode="ab" if offset else "wb") as fout:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                fout.write(chunk)
+            fout.flush()
+            os.fsync(fout.fileno())
+        _check_partial_size(filepath, expected_size)
+    except BaseException:
+        if not resumable:
+            _discard_partial(filepath)
+        raise
+    _finish_partial(filepath, r.headers.get("ETag"))
+
+
+def _start_partial(status_code, headers, filepath):
+    """Prepare filepath.part for the body of a response: (offset to append at, expected size, resumable)"""
+    part_path, validator_path = _partial_paths(filepath)
+    offset = 0
+    if status_code == 206:
+        # Content-Range: bytes <start>-<end>/<total or *>
+        content_range = headers.get("Content-Range", "")
+        match = re.match(r"bytes (\d+)-\d+/(\d+|\*)$", content_range)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if not match or int(match.group(1)) != offset:
+            _discard_partial(filepath)
+            raise IncompleteDownloadError(f"Unexpected Content-Range {content_range!r} resuming {filepath}")
+        expected_size = int(match.group(2)) if match.group(2).isdigit() else None
+        logger.debug(f"Resume download of {filepath} at {offset} bytes")
+    else:
+        # requests decodes compressed bodies, their length isn't the Content-Length
+        length = headers.get("Content-Length")
+        expected_size = int(length) if length and length.isdigit() and not headers.get("Content-Encoding") else None
+
+    # If-Range takes a strong ETag or a date, without one the partial file is removed on errors
+    etag = headers.get("ETag")
+    validator = etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+    if not offset:
+        _discard_partial(filepath)
+        if validator:
+            with open(validator_path, "w") as f:
+                f.write(validator)
+    return offset, expected_size, bool(offset or validator)
+
+
+def _check_partial_size(filepath, expected_size):
+    size = os.path.getsize(_partial_paths(filepath)[0])
+    if expected_size is not None and size != expected_size:
+        if size > expected_size:
+            # can't be resumed
+            _discard_partial(filepath)
+        raise IncompleteDownloadError(f"Downloaded {size} of {expected_size} bytes to {filepath}")
+
+
+def _finish_partial(filepath, etag):
+    part_path, _ = _partial_paths(filepath)
+    if VERIFY_DOWNLOAD_ETAG:
+        _verify_etag(part_path, etag, filepath)
+    try:
+        os.replace(part_path, filepath)
+    except FileNotFoundError:
+        # a concurrent download of the same file into the same dir finished first
+        if not os.path.exists(filepath):
+            raise
+    _discard_partial(filepath)
+
+
+def _verify_etag(part_path, etag, filepath):
+    etag = (etag or "").strip('"')
+    if len(etag) != 32 or any(c not in "0123456789abcdef" for c in etag.lower()):
+        # not an MD5 ETag (multipart uploads, other servers)
+        return
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(part_path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    if digest.hexdigest() != etag.lower():
+        _discard_partial(filepath)
+        raise IncompleteDownloadError(f"MD5 of {filepath} doesn't match ETag {etag}")
+
+
 def get_local_path(
     url,
     cache_dir=None,
@@ -103,6 +319,7 @@ def get_local_path(
     access_token=None,
     download_resources=True,
     task_id=None,
+    session=None,
 ):
     f"""This helper function is used to download (cache) url and return local path to it.
 
@@ -128,7 +345,8 @@ def get_local_path(
       - http(s)://example.com/1.jpg (downloaded directly; auth only if host matches hostname)
 
     :param url: File URL to download, it can be a uploaded file, local storage, cloud storage file or just http(s) url
-    :param cache_dir: Cache directory to download or copy files
+    :param cache_dir: Cache directory to download or copy files, if None files are downloaded
+      to the size-bounded `get_media_cache()` in the user cache dir
     :param project_dir: Project directory
     :param hostname: Label Studio Hostname, it will be used for uploaded files, local storage files and cloud storage files
       if not provided, it will be taken from LABEL_STUDIO_URL env variable
@@ -138,6 +356,10 @@ def get_local_path(
     :param download_resources: Download and cache a file from URL
     :param task_id: Label Studio Task ID, required for cloud storage files 
       because the URL will be rebuilt to `{hostname}/tasks/{task_id}/presign/?fileuri={url}` 
+    :param session: requests.Session to download with, `get_download_session()` if None
+
+    Downloads are streamed to disk and become visible in cache_dir only when complete,
+    an interrupted download of a large file is resumed with a Range request (see `save_response`).
 
     :return: filepath
     """
@@ -150,6 +372,18 @@ def get_local_path(
           f"  download_resources: {download_resources}\n"
           f"  task_id: {task_id}")
     
+    filepath, download_args = _resolve_local_path(
+        url, cache_dir, project_dir, hostname, image_dir, access_token, download_resources, task_id
+    )
+    if filepath is not None:
+        return filepath
+    return download_and_cache(**download_args, session=session)
+
+
+def _resolve_local_path(url, cache_dir, project_dir, hostname, image_dir, access_token, download_resources, task_id):
+    """URL resolution of get_local_path: (local filepath, None) if url is available locally,
+    otherwise (None, keyword arguments of download_and_cache)
+    """
     # get environment variables
     hostname = (
         hostname
@@ -204,8 +438,8 @@ def get_local_path(
                 cache_path = _build_cache_path(cache_dir, url, os.path.basename(filepath))
                 if not os.path.exists(cache_path):
                     shutil.copy(filepath, cache_path)
-                return cache_path
-            return filepath
+                return cache_path, None
+            return filepath, None
 
     # try to get local directories
     if image_dir is None:
@@ -225,7 +459,7 @@ def get_local_path(
             if cache_dir and download_resources:
                 shutil.copy(filepath, cache_dir)
             logger.debug(f"Uploaded file: Path exists in image_dir: {filepath}")
-            return filepath
+            return filepath, None
 
     # Export snapshots can contain raw upload keys (upload/<project>/<file>), while the
     # web app/API may expose them via the authenticated storage proxy endpoint
@@ -303,19 +537,40 @@ def get_local_path(
                 "set LABEL_STUDIO_API_KEY environment variable."
             )
 
-    filepath = download_and_cache(
-        url,
-        cache_dir,
-        download_resources,
-        hostname,
-        access_token,
-        is_local_storage_file,
-        is_cloud_storage_file,
-        is_storage_data_file,
-        storage_filepath,
-        fallback_upload_url,
+    return None, dict(
+        url=url,
+        cache_dir=cache_dir,
+        download_resources=download_resources,
+        hostname=hostname,
+        access_token=access_token,
+        is_local_storage_file=is_local_storage_file,
+        is_cloud_storage_file=is_cloud_storage_file,
+        is_storage_data_file=is_storage_data_file,
+        storage_filepath=storage_filepath,
+        fallback_upload_url=fallback_upload_url,
     )
-    return filepath
+
+
+def _cache_filepath(cache_dir, url, is_local_storage_file, is_cloud_storage_file, is_storage_data_file, storage_filepath):
+    """Path in cache_dir a file resolved by get_local_path is downloaded to"""
+    parsed = urlparse(url)
+    if is_local_storage_file:
+        filename = os.path.basename(url.split("?d=")[1])
+    elif is_cloud_storage_file:
+        # Prefer original cloud URI — download URL is a base64 /presign/ endpoint.
+        filename = os.path.basename(storage_filepath or url)
+    elif is_storage_data_file:
+        sfp = storage_filepath or parse_qs(parsed.query).get("filepath", [None])[0]
+        filename = os.path.basename(sfp or "") or os.path.basename(parsed.path)
+    else:
+        filename = os.path.basename(parsed.path)
+    # Stable cache keys for cloud: hash the original gs://|s3://|azure-blob:// URI.
+    hash_key = storage_filepath if is_cloud_storage_file and storage_filepath else url
+    return _build_cache_path(cache_dir, hash_key, filename)
+
+
+def _fallback_filepath(cache_dir, fallback_upload_url):
+    return _build_cache_path(cache_dir, fallback_upload_url, os.path.basename(urlparse(fallback_upload_url).path))
 
 
 def download_and_cache(
@@ -329,28 +584,38 @@ def download_and_cache(
     is_storage_data_file,
     storage_filepath,
     fallback_upload_url=None,
+    session=None,
 ):
-    def _filename_for(target_url, storage_fp=None):
-        parsed = urlparse(target_url)
-        if is_local_storage_file:
-            return os.path.basename(target_url.split("?d=")[1])
-        if is_cloud_storage_file:
-            # Prefer original cloud URI — download URL is a base64 /presign/ endpoint.
-            return os.path.basename(storage_fp or target_url)
-        if is_storage_data_file:
-            sfp = storage_fp or parse_qs(parsed.query).get("filepath", [None])[0]
-            name = os.path.basename(sfp or "")
-            return name or os.path.basename(parsed.path)
-        return os.path.basename(parsed.path)
-
-    def _cache_path(target_url, fname):
-        # Stable cache keys for cloud: hash the original gs://|s3://|azure-blob:// URI.
-        hash_key = storage_filepath if is_cloud_storage_file and storage_filepath else target_url
-        return _build_cache_path(cache_dir, hash_key, fname)
+    http = session or get_download_session()
 
+    media_cache = get_media_cache() if not cache_dir and download_resources else None
     cache_dir = cache_dir or get_cache_dir()
-    current_filename = _filename_for(url, storage_filepath)
-    current_filepath = _cache_path(url, current_filename)
+    current_filepath = _cache_filepath(
+        cache_dir, url, is_local_storage_file, is_cloud_storage_file, is_storage_data_file, storage_filepath
+    )
+
+    if media_cache is not None:
+        if media_cache.get(current_filepath):
+            return current_filepath
+        # processes and threads downloading the same file wait for the first one
+        with media_cache.lock(current_filepath):
+            if media_cache.get(current_filepath):
+                return current_filepath
+            filepath = download_and_cache(
+                url,
+                media_cache.cache_dir,
+                download_resources,
+                hostname,
+                access_token,
+                is_local_storage_file,
+                is_cloud_storage_file,
+                is_storage_data_file,
+                storage_filepath,
+                fallback_upload_url,
+                session,
+            )
+            media_cache.add(filepath)
+            return filepath
 
     if os.path.exists(current_filepath):
         return current_filepath
@@ -360,7 +625,7 @@ def download_and_cache(
 
     headers = _build_headers(url, hostname, access_token)
     try:
-        r = requests.get(url, stream=True, headers=headers, verify=VERIFY_SSL)
+        r = _get_resumable(http, url, headers, current_filepath)
         r.raise_for_status()
         target_url = url
         target_filepath = current_filepath
@@ -374,21 +639,20 @@ def download_and_cache(
         if not fallback_upload_url:
             raise e
         logger.info("Download failed for proxy URL, retrying legacy upload path: %s", fallback_upload_url)
-        fb_filename = os.path.basename(urlparse(fallback_upload_url).path)
-        fb_filepath = _cache_path(fallback_upload_url, fb_filename)
+        fb_filepath = _fallback_filepath(cache_dir, fallback_upload_url)
         if os.path.exists(fb_filepath):
             return fb_filepath
         fb_headers = _build_headers(fallback_upload_url, hostname, access_token)
         try:
-            r = requests.get(fallback_upload_url, stream=True, headers=fb_headers, verify=VERIFY_SSL)
+            r = _get_resumable(http, fallback_upload_url, fb_headers, fb_filepath)
             r.raise_for_status()
             target_url = fallback_upload_url
             target_filepath = fb_filepath
         except Exception:
             raise e
-    with io.open(target_filepath, mode="wb") as fout:
-        fout.write(r.content)
-        logger.info(f"File downloaded to {target_filepath}")
+    with r:
+        save_response(r, target_filepath)
+    logger.info(f"File downloaded to {target_filepath}")
     return target_filepath
 
 
@@ -413,6 +677,7 @@ def get_base64_content(
     hostname=None,
     access_token=None,
     task_id=None,
+    session=None,
 ):
     """This helper function is used to download a file and return its base64 representation without saving to filesystem.
 
@@ -423,6 +688,7 @@ def get_base64_content(
       if not provided, it will be taken from LABEL_STUDIO_API_KEY env variable
     :param task_id: Label Studio Task ID, required for cloud storage files
       because the URL will be rebuilt to `{hostname}/tasks/{task_id}/presign/?fileuri={url}`
+    :param session: requests.Session to download with, `get_download_session()` if None
 
     :return: base64 encoded file content
     """
@@ -524,6 +790,7 @@ def get_base64_content(
             )
 
     # Download the content but don't save to filesystem
+    http = session or get_download_session()
     headers = _build_headers(url, hostname, access_token)
 
     fallback_upload_url = None
@@ -536,7 +803,7 @@ def get_base64_content(
             fallback_upload_url = concat_urls(hostname, fallback_path)
 
     try:
-        r = requests.get(url, headers=headers, verify=VERIFY_SSL)
+        r = http.get(url, headers=headers, verify=VERIFY_SSL)
         r.raise_for_status()
         return base64.b64encode(r.content).decode("utf-8")
     except requests.exceptions.SSLError as e:
@@ -553,7 +820,7 @@ def get_base64_content(
             )
             fb_headers = _build_headers(fallback_upload_url, hostname, access_token)
             try:
-                r = requests.get(fallback_upload_url, headers=fb_headers, verify=VERIFY_SSL)
+                r = http.get(fallback_upload_url, headers=fb_headers, verify=VERIFY_SSL)
                 r.raise_for_status()
                 return base64.b64encode(r.content).decode("utf-8")
             except Exception:
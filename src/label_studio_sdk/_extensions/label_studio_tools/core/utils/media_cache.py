@@ -0,0 +1,246 @@
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils.params import get_env
+
+logger = logging.getLogger(__name__)
+
+# size budget of the default media cache, 0 keeps every file
+MEDIA_CACHE_MAX_BYTES = int(get_env("MEDIA_CACHE_MAX_BYTES", default=10 * 1024**3))
+INDEX_FILENAME = ".media_cache.sqlite3"
+# downloads of different files are serialized only if their keys fall into the same lock file
+_LOCK_FILES = 1024
+# hits are written to the index in batches, at least this often (seconds); a hit on a file whose indexed
+# last access is older than that is written right away, so other processes don't evict it as least recently used
+_FLUSH_INTERVAL = 1.0
+_FLUSH_HITS = 256
+# partial downloads (see io._partial_paths) untouched for this long are abandoned and removed,
+# the cache dir is swept for them at most once per _SWEEP_INTERVAL (seconds)
+_PARTIAL_SUFFIXES = (".part", ".part.validator")
+_STALE_PARTIAL_AGE = 24 * 3600
+_SWEEP_INTERVAL = 3600
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        # LK_LOCK retries for 10 seconds only
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class MediaCache:
+    """Size-bounded LRU cache of downloaded media files in a directory, shared by threads and processes
+
+    An SQLite index in the directory keeps the size, last access and hits of every file the cache stored
+    or served. When the files grow over max_bytes, the least recently used ones are removed.
+    Files the index doesn't know (anything not downloaded through the cache) are never removed.
+
+    cache = MediaCache(cache_dir, max_bytes=10 * 1024**3)
+    if cache.get(path) is None:
+        with cache.lock(path):  # one process downloads path, the others wait and find it in the cache
+            if cache.get(path) is None:
+                ...  # download to path
+                cache.add(path)
+    """
+
+    def __init__(self, cache_dir, max_bytes=MEDIA_CACHE_MAX_BYTES):
+        """
+        :param cache_dir: directory of the cached files and the index
+        :param max_bytes: size budget of the cached files, 0 means unlimited
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "evicted_bytes": 0}
+        self._lock = threading.Lock()
+        # key -> (size, last access, hits) not written to the index yet
+        self._pending_hits = {}
+        self._flushed_at = time.monotonic()
+        self._swept_at = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(self.cache_dir, INDEX_FILENAME), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, size INTEGER, last_access REAL, hits INTEGER DEFAULT 0)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        _open_caches.add(self)
+
+    def get(self, path):
+        """path if it is cached, None otherwise; a hit makes path the most recently used file"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+        key = self._key(path)
+        now = time.time()
+        with self._lock:
+            self.stats["hits"] += 1
+            pending = self._pending_hits.get(key)
+            self._pending_hits[key] = (size, now, (pending[2] if pending else 0) + 1)
+            if len(self._pending_hits) >= _FLUSH_HITS or time.monotonic() - self._flushed_at > _FLUSH_INTERVAL:
+                self._flush()
+            elif pending is None:
+                # the first hit of a batch checks the index, later ones are at most _FLUSH_INTERVAL behind it
+                row = self._db.execute("SELECT last_access FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None or row[0] < now - _FLUSH_INTERVAL:
+                    self._flush()
+        return path
+
+    def add(self, path):
+        """Index a file just stored at path and evict least recently used files over the budget"""
+        with self._lock:
+            self.stats["misses"] += 1
+            self._pending_hits.pop(self._key(path), None)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, 0)",
+                (self._key(path), os.path.getsize(path), time.time()),
+            )
+        self.evict(keep=path)
+
+    def evict(self, keep=None):
+        """Remove least recently used files until the cached files fit max_bytes, except keep,
+        and partial downloads abandoned for a day
+        """
+        if self._swept_at is None or time.monotonic() - self._swept_at > _SWEEP_INTERVAL:
+            self._swept_at = time.monotonic()
+            self.remove_stale_partials()
+        if not self.max_bytes:
+            return
+        keep = keep and self._key(keep)
+        with self._lock:
+            self._flush()
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._db.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self.cache_dir, key))
+                    self.stats["evictions"] += 1
+                    self.stats["evicted_bytes"] += size
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # still open on Windows, try again next time
+                    logger.debug(f"Can't evict {key} from {self.cache_dir}", exc_info=True)
+                    continue
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+        logger.debug(f"Media cache {self.cache_dir} evicted files down to {total} bytes")
+
+    def remove_stale_partials(self, max_age=_STALE_PARTIAL_AGE):
+        """Remove partial downloads not written to for max_age seconds, the index doesn't know them"""
+        expired = time.time() - max_age
+        for root, dirs, files in os.walk(self.cache_dir):
+            if root == self.cache_dir and ".locks" in dirs:
+                dirs.remove(".locks")
+            for name in files:
+                if not name.endswith(_PARTIAL_SUFFIXES):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < expired:
+                        os.remove(path)
+                        logger.debug(f"Removed abandoned partial download {path}")
+                except OSError:
+                    pass
+
+    @contextmanager
+    def lock(self, path):
+        """Lock held by one thread of one process at a time per path, to download it only once"""
+        lock_path = self.lock_path(path)
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, "a+") as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def lock_path(self, path):
+        """Lock file of path, other paths share it when their keys fall into the same one"""
+        digest = hashlib.md5(self._key(path).encode(), usedforsecurity=False).digest()
+        index = int.from_bytes(digest[:4], "big") % _LOCK_FILES
+        return os.path.join(self.cache_dir, ".locks", f"{index}.lock")
+
+    def metrics(self):
+        """Hits, misses (files added) and evictions of this process and the size of the whole cache"""
+        with self._lock:
+            self._flush()
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return dict(self.stats, entries=entries, bytes=size, max_bytes=self.max_bytes)
+
+    def close(self):
+        with self._lock:
+            _open_caches.discard(self)
+            self._flush()
+            self._db.close()
+
+    def _flush(self):
+        if self._pending_hits:
+            # files cached before the index existed are indexed on their first hit
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE "
+                "SET last_access = MAX(last_access, excluded.last_access), hits = hits + excluded.hits",
+                [(key, *values) for key, values in self._pending_hits.items()],
+            )
+            self._db.execute("COMMIT")
+            self._pending_hits.clear()
+        self._flushed_at = time.monotonic()
+
+    def _key(self, path):
+        return os.path.relpath(os.path.abspath(path), self.cache_dir)
+
+
+_open_caches = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    # hits batched since the last flush would be lost otherwise
+    for cache in list(_open_caches):
+        # a daemon thread may still hold the lock, exit without its hits then
+        if not cache._lock.acquire(timeout=1):
+            continue
+        try:
+            cache._flush()
+        except sqlite3.Error:
+            logger.debug(f"Can't flush media cache {cache.cache_dir}", exc_info=True)
+        finally:
+            cache._lock.release()
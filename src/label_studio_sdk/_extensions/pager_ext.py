@@ -1,15 +1,126 @@
+import asyncio
+import collections
+import itertools
+import math
+import queue
+import threading
 import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
 from label_studio_sdk.core.pagination import SyncPager, AsyncPager, T
 from label_studio_sdk.core.api_error import ApiError
 
 # This is a custom extension of the autogenerated SyncPager and AsyncPager classes
 # that works with the Label Studio SDK's default pagination behavior
 # that throws 404 errors at the end of the pagination.
+#
+# Both pagers also support an opt-in `prefetch=N` mode: the next N pages are requested
+# in the background (a thread for SyncPagerExt, a task for AsyncPagerExt) while the
+# current page is being consumed. At most N pages are ever buffered ahead of the consumer.
+#
+# For page-number paginated endpoints that report a total (e.g. /api/tasks), SyncConcurrentPagerExt
+# and AsyncConcurrentPagerExt fetch all remaining pages through a bounded worker pool once the
+# first page is known, yielding pages either in page order or as soon as they arrive.
+
+_DONE = object()
+
+
+def prefetch_pages(first: SyncPager, prefetch: int) -> typing.Iterator[SyncPager]:
+    """
+    Iterate over the pages of `first`, fetching up to `prefetch` pages ahead in a background thread.
+    Errors raised while fetching (e.g. the 404 at the end of the pagination) are re-raised
+    in the consumer in the same position where the serial iteration would raise them.
+    """
+    buffer: "queue.Queue[typing.Tuple[typing.Any, typing.Optional[Exception]]]" = queue.Queue()
+    slots = threading.Semaphore(prefetch)
+    stop = threading.Event()
 
+    def _acquire_slot() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
 
+    def _produce() -> None:
+        page = first
+        try:
+            while page.has_next and page.get_next is not None:
+                if not _acquire_slot():
+                    return
+                page = page.get_next()
+                if page is None or page.items is None or len(page.items) == 0:
+                    break
+                buffer.put((page, None))
+        except Exception as exc:
+            buffer.put((None, exc))
+            return
+        buffer.put((_DONE, None))
+
+    worker = threading.Thread(target=_produce, name="label-studio-sdk-pager-prefetch", daemon=True)
+    worker.start()
+    try:
+        yield first
+        while True:
+            page, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if page is _DONE:
+                return
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+
+
+async def async_prefetch_pages(first: AsyncPager, prefetch: int) -> typing.AsyncIterator[AsyncPager]:
+    """
+    Async counterpart of `prefetch_pages`: the next pages are fetched by a background task
+    running on the current event loop.
+    """
+    buffer: "asyncio.Queue[typing.Tuple[typing.Any, typing.Optional[Exception]]]" = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def _produce() -> None:
+        page = first
+        try:
+            while page.has_next and page.get_next is not None:
+                await slots.acquire()
+                page = await page.get_next()
+                if page is None or page.items is None or len(page.items) == 0:
+                    break
+                buffer.put_nowait((page, None))
+        except Exception as exc:
+            buffer.put_nowait((None, exc))
+            return
+        buffer.put_nowait((_DONE, None))
+
+    worker = asyncio.ensure_future(_produce())
+    try:
+        yield first
+        while True:
+            page, exc = await buffer.get()
+            if exc is not None:
+                raise exc
+            if page is _DONE:
+                return
+            slots.release()
+            yield page
+    finally:
+        if not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+
+@dataclass(frozen=True)
 class SyncPagerExt(SyncPager[T, typing.Any], typing.Generic[T]):
+    prefetch: int = 0
+
     @classmethod
-    def from_sync_pager(cls, sync_pager: SyncPager) -> "SyncPagerExt[T]":
+    def from_sync_pager(cls, sync_pager: SyncPager, prefetch: int = 0) -> "SyncPagerExt[T]":
         # Minimal compatibility with newer Fern pagers:
         # SyncPager is a frozen dataclass and now *requires* the `response` field.
         return cls(
@@ -17,8 +128,15 @@ class SyncPagerExt(SyncPager[T, typing.Any], typing.Generic[T]):
             has_next=sync_pager.has_next,
             items=sync_pager.items,
             response=sync_pager.response,
+            prefetch=prefetch,
         )
- 
+
+    def iter_pages(self, prefetch: typing.Optional[int] = None) -> typing.Iterator[SyncPager[T, typing.Any]]:  # type: ignore[override]
+        prefetch = self.prefetch if prefetch is None else prefetch
+        if prefetch <= 0:
+            return super().iter_pages()
+        return prefetch_pages(self, prefetch)
+
     def __iter__(self) -> typing.Iterator[T]:  # type: ignore
         # Extends the iterator to catch 404 errors at the end of the pagination
         try:
@@ -30,16 +148,26 @@ class SyncPagerExt(SyncPager[T, typing.Any], typing.Generic[T]):
             raise
 
 
+@dataclass(frozen=True)
 class AsyncPagerExt(AsyncPager[T, typing.Any], typing.Generic[T]):
+    prefetch: int = 0
+
     @classmethod
-    async def from_async_pager(cls, async_pager: AsyncPager) -> "AsyncPagerExt[T]":
+    async def from_async_pager(cls, async_pager: AsyncPager, prefetch: int = 0) -> "AsyncPagerExt[T]":
         return cls(
             get_next=async_pager.get_next,
             has_next=async_pager.has_next,
             items=async_pager.items,
             response=async_pager.response,
+            prefetch=prefetch,
         )
- 
+
+    def iter_pages(self, prefetch: typing.Optional[int] = None) -> typing.AsyncIterator[AsyncPager[T, typing.Any]]:  # type: ignore[override]
+        prefetch = self.prefetch if prefetch is None else prefetch
+        if prefetch <= 0:
+            return super().iter_pages()
+        return async_prefetch_pages(self, prefetch)
+
     async def __aiter__(self) -> typing.AsyncIterator[T]:  # type: ignore
         # Extends the iterator to catch 404 errors at the end of the pagination
         try:
@@ -49,7 +177,7 @@ class AsyncPagerExt(AsyncPager[T, typing.Any], typing.Generic[T]):
             if exc.status_code == 404:
                 return
             raise
- 
+
     async def __anext__(self) -> T:
         try:
             return await super().__anext__()
@@ -57,3 +185,190 @@ class AsyncPagerExt(AsyncPager[T, typing.Any], typing.Generic[T]):
             if exc.status_code == 404:
                 raise StopAsyncIteration
             raise
+
+
+class _TailTracker:
+    """
+    Remembers the highest page number fetched by the worker pool, so that pages past the total
+    reported by the first response (tasks created meanwhile) can still be read serially afterwards.
+    A missing (404) or empty page means the total shrank and nothing beyond it exists.
+    """
+
+    def __init__(self, first: typing.Any):
+        self.page: typing.Any = first
+        self._number = 0
+        self._exhausted = False
+
+    def add(self, number: int, page: typing.Any) -> bool:
+        if page is None or page.items is None or len(page.items) == 0:
+            self._exhausted = True
+            self.page = None
+            return False
+        if not self._exhausted and number > self._number:
+            self._number = number
+            self.page = page
+        return True
+
+
+def _serial_tail(page: typing.Optional[SyncPager]) -> typing.Iterator[SyncPager]:
+    # pages past the known total (new tasks created meanwhile) are picked up serially
+    while page is not None and page.has_next and page.get_next is not None:
+        page = page.get_next()
+        if page is None or page.items is None or len(page.items) == 0:
+            return
+        yield page
+
+
+async def _async_serial_tail(page: typing.Optional[AsyncPager]) -> typing.AsyncIterator[AsyncPager]:
+    while page is not None and page.has_next and page.get_next is not None:
+        page = await page.get_next()
+        if page is None or page.items is None or len(page.items) == 0:
+            return
+        yield page
+
+
+def _remaining_page_numbers(first: typing.Union[SyncPager, AsyncPager], page: int, page_size: typing.Optional[int]) -> range:
+    total = getattr(first.response, "total", None)
+    page_size = page_size or len(first.items or [])
+    if total is None or not page_size:
+        return range(0)
+    return range(page + 1, math.ceil(total / page_size) + 1)
+
+
+@dataclass(frozen=True)
+class SyncConcurrentPagerExt(SyncPagerExt[T], typing.Generic[T]):
+    fetch_page: typing.Optional[typing.Callable[[int], SyncPager]] = None
+    page_numbers: typing.Sequence[int] = ()
+    concurrency: int = 1
+    ordered: bool = True
+
+    @classmethod
+    def from_first_page(
+        cls,
+        first: SyncPager,
+        fetch_page: typing.Callable[[int], SyncPager],
+        *,
+        page: int = 1,
+        page_size: typing.Optional[int] = None,
+        concurrency: int,
+        ordered: bool = True,
+    ) -> "SyncConcurrentPagerExt[T]":
+        return cls(
+            get_next=first.get_next,
+            has_next=first.has_next,
+            items=first.items,
+            response=first.response,
+            fetch_page=fetch_page,
+            page_numbers=_remaining_page_numbers(first, page, page_size),
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def iter_pages(self, prefetch: typing.Optional[int] = None) -> typing.Iterator[SyncPager[T, typing.Any]]:  # type: ignore[override]
+        if self.fetch_page is None or self.concurrency <= 1 or not self.page_numbers:
+            return super().iter_pages(prefetch)
+        return self._iter_pages_concurrently()
+
+    def _iter_pages_concurrently(self) -> typing.Iterator[SyncPager[T, typing.Any]]:
+        yield self
+        fetch_page = typing.cast(typing.Callable[[int], SyncPager], self.fetch_page)
+        numbers = iter(self.page_numbers)
+        tail = _TailTracker(self)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="label-studio-sdk-pager") as pool:
+            in_flight: "collections.OrderedDict[Future, int]" = collections.OrderedDict()
+            try:
+                for number in itertools.islice(numbers, self.concurrency):
+                    in_flight[pool.submit(fetch_page, number)] = number
+                while in_flight:
+                    if self.ordered:
+                        done = [next(iter(in_flight))]
+                    else:
+                        finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        done = [future for future in in_flight if future in finished]
+                    for future in done:
+                        number = in_flight.pop(future)
+                        try:
+                            page = future.result()
+                        except ApiError as exc:
+                            if exc.status_code != 404:
+                                raise
+                            page = None
+                        for next_number in itertools.islice(numbers, 1):
+                            in_flight[pool.submit(fetch_page, next_number)] = next_number
+                        if tail.add(number, page):
+                            yield page
+            finally:
+                for future in in_flight:
+                    future.cancel()
+        yield from _serial_tail(tail.page)
+
+
+@dataclass(frozen=True)
+class AsyncConcurrentPagerExt(AsyncPagerExt[T], typing.Generic[T]):
+    fetch_page: typing.Optional[typing.Callable[[int], typing.Awaitable[AsyncPager]]] = None
+    page_numbers: typing.Sequence[int] = ()
+    concurrency: int = 1
+    ordered: bool = True
+
+    @classmethod
+    async def from_first_page(
+        cls,
+        first: AsyncPager,
+        fetch_page: typing.Callable[[int], typing.Awaitable[AsyncPager]],
+        *,
+        page: int = 1,
+        page_size: typing.Optional[int] = None,
+        concurrency: int,
+        ordered: bool = True,
+    ) -> "AsyncConcurrentPagerExt[T]":
+        return cls(
+            get_next=first.get_next,
+            has_next=first.has_next,
+            items=first.items,
+            response=first.response,
+            fetch_page=fetch_page,
+            page_numbers=_remaining_page_numbers(first, page, page_size),
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def iter_pages(self, prefetch: typing.Optional[int] = None) -> typing.AsyncIterator[AsyncPager[T, typing.Any]]:  # type: ignore[override]
+        if self.fetch_page is None or self.concurrency <= 1 or not self.page_numbers:
+            return super().iter_pages(prefetch)
+        return self._iter_pages_concurrently()
+
+    async def _iter_pages_concurrently(self) -> typing.AsyncIterator[AsyncPager[T, typing.Any]]:
+        yield self
+        fetch_page = typing.cast(typing.Callable[[int], typing.Awaitable[AsyncPager]], self.fetch_page)
+        numbers = iter(self.page_numbers)
+        tail = _TailTracker(self)
+        in_flight: "collections.OrderedDict[asyncio.Future, int]" = collections.OrderedDict()
+        try:
+            for number in itertools.islice(numbers, self.concurrency):
+                in_flight[asyncio.ensure_future(fetch_page(number))] = number
+            while in_flight:
+                if self.ordered:
+                    done = [next(iter(in_flight))]
+                    await asyncio.wait(done)
+                else:
+                    finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    done = [future for future in in_flight if future in finished]
+                for future in done:
+                    number = in_flight.pop(future)
+                    try:
+                        page = future.result()
+                    except ApiError as exc:
+                        if exc.status_code != 404:
+                            raise
+                        page = None
+                    for next_number in itertools.islice(numbers, 1):
+                        in_flight[asyncio.ensure_future(fetch_page(next_number))] = next_number
+                    if tail.add(number, page):
+                        yield page
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        async for page in _async_serial_tail(tail.page):
+            yield page
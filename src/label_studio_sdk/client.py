@@ -3,13 +3,31 @@ from .tasks.client_ext import TasksClientExt, AsyncTasksClientExt
 from .projects.client_ext import ProjectsClientExt, AsyncProjectsClientExt
 import typing
 
+from .core.raw_response import ResponseMode
+from .core.request_coalescing import RequestCoalescer
+
+_RESPONSE_MODE_DOC = """
+    response_mode : typing.Literal["model", "raw"]
+        "model" (default) returns response models. "raw" returns the decoded JSON instead, so list endpoints
+        and pagers yield plain dicts; this skips model construction and is much cheaper for bulk reads.
+        Per-request `response_mode` in `request_options` takes precedence over this value.
+"""
+
+_COALESCE_REQUESTS_DOC = """
+    coalesce_requests : typing.Union[bool, typing.Sequence[str]]
+        Concurrent identical GET requests (same URL, query parameters and auth) share one in-flight response.
+        True coalesces every endpoint, a list of fnmatch patterns only matching paths, e.g. ["api/projects/*/"].
+        Off by default; `request_coalescer.stats()` counts the requests saved.
+"""
+
 
 class LabelStudio(LabelStudioBase):
     """"""
-    __doc__ += LabelStudioBase.__doc__
+    __doc__ += LabelStudioBase.__doc__ + _RESPONSE_MODE_DOC
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, response_mode: ResponseMode = "model", **kwargs):
         super().__init__(*args, **kwargs)
+        self._client_wrapper._response_mode = response_mode
         self._tasks_ext: typing.Optional[TasksClientExt] = None
         self._projects_ext: typing.Optional[ProjectsClientExt] = None
 
@@ -30,13 +48,29 @@ class LabelStudio(LabelStudioBase):
 
 class AsyncLabelStudio(AsyncLabelStudioBase):
     """"""
-    __doc__ += AsyncLabelStudioBase.__doc__
+    __doc__ += AsyncLabelStudioBase.__doc__ + _RESPONSE_MODE_DOC + _COALESCE_REQUESTS_DOC
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        response_mode: ResponseMode = "model",
+        coalesce_requests: typing.Union[bool, typing.Sequence[str]] = False,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        self._client_wrapper._response_mode = response_mode
+        if coalesce_requests:
+            self._client_wrapper._request_coalescer = RequestCoalescer(
+                endpoints=None if coalesce_requests is True else coalesce_requests
+            )
         self._tasks_ext: typing.Optional[AsyncTasksClientExt] = None
         self._projects_ext: typing.Optional[AsyncProjectsClientExt] = None
 
+    @property
+    def request_coalescer(self) -> typing.Optional[RequestCoalescer]:
+        """RequestCoalescer of the client if it was created with coalesce_requests, None otherwise"""
+        return self._client_wrapper.get_request_coalescer()
+
     @property
     def tasks(self) -> AsyncTasksClientExt:  # type: ignore[override]
         if self._tasks_ext is None:
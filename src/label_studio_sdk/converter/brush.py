@@ -66,12 +66,139 @@ def bytes2bit(data):
     return "".join([str(access_bit(data, i)) for i in range(len(data) * 8)])
 
 
+# literal blocks shorter than this are read word by word, numpy only pays off for longer ones
+_MIN_VECTORIZED_LITERALS = 16
+
+
+class _StreamEnd(Exception):
+    """The RLE stream ran out of bits before all values were decoded"""
+
+
 def decode_rle(rle, print_params: bool = False):
     """from LS RLE to numpy uint8 3d image [width, height, channel]
 
+    Fields are read from the packed bytes through a small integer bit buffer, runs and single words are
+    expanded with one `np.repeat` at the end and long literal blocks are unpacked with numpy.
+    Streams the fast path does not cover (word size above 8 bits, truncated or inconsistent data)
+    go through `_decode_rle_bit_string`, so the result, or the error, is exactly the same.
+
     Args:
         print_params (bool, optional): If true, a RLE parameters print statement is suppressed
     """
+    if isinstance(rle, (bytes, bytearray)):
+        data = bytes(rle)
+    else:
+        array = np.asarray(rle)
+        if array.dtype != np.uint8:
+            # only the low 8 bits of each value were ever read
+            array = array.astype(np.int64).astype(np.uint8)
+        data = array.tobytes()
+    if len(data) < 7:
+        return _decode_rle_bit_string(rle, print_params)
+
+    header = int.from_bytes(data[:7], "big")
+    num = header >> 24
+    word_size = ((header >> 19) & 31) + 1
+    rle_sizes = [((header >> (15 - 4 * k)) & 15) + 1 for k in range(4)]
+
+    if print_params:
+        print(
+            "RLE params:", num, "values", word_size, "word_size", rle_sizes, "rle_sizes"
+        )
+    if word_size > 8:
+        return _decode_rle_bit_string(rle)
+
+    try:
+        return _decode_rle_blocks(data, num, word_size, rle_sizes)
+    except _StreamEnd:
+        return _decode_rle_bit_string(rle)
+
+
+def _decode_rle_blocks(data, num, word_size, rle_sizes):
+    """decode the blocks following the 53 bit header, raise _StreamEnd on truncated or inconsistent data"""
+    word_mask = (1 << word_size) - 1
+    from_bytes = int.from_bytes
+    size = len(data)
+    # `buf` holds the next `nbits` unread bits, data[byte_pos:] has not been loaded yet
+    buf = data[6] & 7
+    nbits = 3
+    byte_pos = 7
+
+    values = []
+    lengths = []
+    literal_blocks = []
+    bits = None
+    i = 0
+    while i < num:
+        if nbits < 32:
+            chunk = data[byte_pos : byte_pos + 8]
+            buf = ((buf & ((1 << nbits) - 1)) << (len(chunk) << 3)) | from_bytes(chunk, "big")
+            nbits += len(chunk) << 3
+            byte_pos += len(chunk)
+        nbits -= 3
+        if nbits < 0:
+            raise _StreamEnd
+        head = (buf >> nbits) & 7
+        count_size = rle_sizes[head & 3]
+        nbits -= count_size
+        if nbits < 0:
+            raise _StreamEnd
+        count = ((buf >> nbits) & ((1 << count_size) - 1)) + 1
+
+        if head >> 2:
+            # run: one word repeated count times
+            nbits -= word_size
+            if nbits < 0:
+                raise _StreamEnd
+            values.append((buf >> nbits) & word_mask)
+            lengths.append(count)
+        elif i + count > num:
+            raise _StreamEnd
+        elif count < _MIN_VECTORIZED_LITERALS:
+            for _ in range(count):
+                if nbits < word_size:
+                    chunk = data[byte_pos : byte_pos + 8]
+                    buf = ((buf & ((1 << nbits) - 1)) << (len(chunk) << 3)) | from_bytes(chunk, "big")
+                    nbits += len(chunk) << 3
+                    byte_pos += len(chunk)
+                    if nbits < word_size:
+                        raise _StreamEnd
+                nbits -= word_size
+                values.append((buf >> nbits) & word_mask)
+                lengths.append(1)
+        else:
+            pos = (byte_pos << 3) - nbits
+            end = pos + count * word_size
+            if end > size << 3:
+                raise _StreamEnd
+            if bits is None:
+                bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+            words = bits[pos:end].reshape(count, word_size)
+            # packbits pads each word on the right up to a full byte
+            literal_blocks.append((i, np.packbits(words, axis=1)[:, 0] >> (8 - word_size)))
+            # placeholder, filled with the block once the runs are expanded
+            values.append(0)
+            lengths.append(count)
+            byte_pos = end >> 3
+            nbits = 0
+            buf = 0
+            if end & 7:
+                buf = data[byte_pos]
+                nbits = 8 - (end & 7)
+                byte_pos += 1
+        i += count
+
+    out = np.repeat(np.array(values, dtype=np.uint8), lengths)
+    if len(out) != num:
+        # the last run reaches past the end, the reference decoder clips it
+        out = out[:num].copy()
+    for start, words in literal_blocks:
+        out[start : start + len(words)] = words
+    return out
+
+
+def _decode_rle_bit_string(rle, print_params: bool = False):
+    """Reference decoder, going through a string of '0'/'1' characters"""
     input = InputStream(bytes2bit(rle))
     num = input.read(32)
     word_size = input.read(5) + 1
@@ -235,6 +362,106 @@ def encode_rle(arr, wordsize=8, rle_sizes=[3, 4, 8, 16]):
     """Encode a 1d array to rle
 
 
+    :param arr: flattened np.array from a 4d image (R, G, B, alpha)
+    :type arr: np.array
+    :param wordsize: wordsize bits for decoding, default is 8
+    :type wordsize: int
+    :param rle_sizes:  list of ints which state how long a series is of the same number
+    :type rle_sizes: list
+    :return rle: run length encoded array
+    :type rle: list
+
+    """
+    return encode_rle_batch([arr], wordsize, rle_sizes)[0]
+
+
+# blocks are packed in slices of this many at a time to bound the memory of the (blocks x 32) bit matrix
+_ENCODE_SLICE_BLOCKS = 2**20
+
+
+def encode_rle_batch(arrays, wordsize=8, rle_sizes=[3, 4, 8, 16]):
+    """Encode many 1d arrays to rle at once
+
+    Runs of all arrays are found and packed with numpy in one pass, the output is the same as
+    `[encode_rle(arr, wordsize, rle_sizes) for arr in arrays]`. Arrays the packed path does not cover
+    (values outside 0..255, non integer data, empty arrays) are encoded by `_encode_rle_bit_string`.
+
+    :param arrays: iterable of flattened np.arrays from 4d images (R, G, B, alpha)
+    :param wordsize: wordsize bits for decoding, default is 8
+    :param rle_sizes:  list of ints which state how long a series is of the same number
+    :return: list of run length encoded arrays (lists of ints)
+    """
+    header = f"{{0:032b}}{wordsize - 1:05b}" + "".join([f"{x - 1:04b}" for x in rle_sizes])
+    results = []
+    packed = []
+    for arr in arrays:
+        array = np.asarray(arr)
+        results.append(None)
+        if (
+            array.ndim == 1
+            and 0 < len(array) < 2**32
+            and array.dtype.kind in "biu"
+            and set(header.format(len(array))) <= {"0", "1"}
+            and (array.dtype.kind == "b" or (array.min() >= 0 and array.max() <= 255))
+        ):
+            packed.append((len(results) - 1, array.astype(np.uint8, copy=False)))
+        else:
+            results[-1] = _encode_rle_bit_string(arr, wordsize, rle_sizes)
+    if not packed:
+        return results
+
+    flat = np.concatenate([array for _, array in packed])
+    offsets = np.cumsum([0] + [len(array) for _, array in packed])
+    run_start = np.ones(len(flat), dtype=bool)
+    run_start[1:] = flat[1:] != flat[:-1]
+    run_start[offsets[:-1]] = True
+    starts = np.flatnonzero(run_start)
+    lengths = np.diff(np.append(starts, len(flat)))
+    values = flat[starts].astype(np.uint32)
+
+    # runs above 2**16 values are written as full 2**16 blocks followed by the rest
+    repeats = (lengths - 1) // 2**16 + 1
+    block_values = np.repeat(values, repeats)
+    block_lengths = np.full(len(block_values), 2**16, dtype=np.int64)
+    block_lengths[np.cumsum(repeats) - 1] = lengths - (repeats - 1) * 2**16
+    # block head (series bit + rle size index) and count bits, by the length of the whole run
+    kind = np.searchsorted([1, 8, 16, 256], lengths)
+    heads = np.repeat(np.array([0b000, 0b100, 0b101, 0b110, 0b111], dtype=np.uint32)[kind], repeats)
+    count_bits = np.repeat(np.array([3, 3, 4, 8, 16], dtype=np.uint32)[kind], repeats)
+    widths = 3 + count_bits + 8
+    codes = (heads << (count_bits + 8)) | ((block_lengths - 1).astype(np.uint32) << 8) | block_values
+
+    stream = np.concatenate(
+        [
+            _pack_codes(codes[i : i + _ENCODE_SLICE_BLOCKS], widths[i : i + _ENCODE_SLICE_BLOCKS])
+            for i in range(0, len(codes), _ENCODE_SLICE_BLOCKS)
+        ]
+    )
+    # split the stream back into arrays: every array starts with a run
+    array_blocks = np.append(0, np.cumsum(repeats))[np.searchsorted(starts, offsets)]
+    bit_offsets = np.append(0, np.cumsum(widths, dtype=np.int64))[array_blocks]
+    for k, (index, array) in enumerate(packed):
+        head_bits = np.frombuffer(header.format(len(array)).encode(), dtype=np.uint8) - ord("0")
+        bits = np.concatenate([head_bits, stream[bit_offsets[k] : bit_offsets[k + 1]]])
+        rle = np.packbits(bits).tolist()
+        if len(bits) % 8 == 0:
+            # encode_rle always pads, a full zero byte when already aligned
+            rle.append(0)
+        results[index] = rle
+    return results
+
+
+def _pack_codes(codes, widths):
+    """bits of variable width codes (up to 32 bits each) written one after another"""
+    aligned = (codes << (32 - widths)).astype(">u4")
+    bits = np.unpackbits(aligned.view(np.uint8)).reshape(-1, 32)
+    return bits[np.arange(32) < widths[:, None]]
+
+
+def _encode_rle_bit_string(arr, wordsize=8, rle_sizes=[3, 4, 8, 16]):
+    """Reference encoder, going through a string of '0'/'1' characters
+
+
     :param arr: flattened np.array from a 4d image (R, G, B, alpha)
     :type arr: np.array
     :param wordsize: wordsize bits for decoding, default is 8
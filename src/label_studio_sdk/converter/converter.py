@@ -6,8 +6,9 @@ import os
 import re
 import xml.dom
 import xml.dom.minidom
-from collections import defaultdict
-from copy import deepcopy
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from enum import Enum
 from glob import glob
@@ -16,15 +17,13 @@ from typing import Optional, List, Tuple
 
 import ijson
 import ujson as json
-from PIL import Image
-from label_studio_sdk.converter import brush
 from label_studio_sdk.converter.audio import convert_to_asr_json_manifest
 from label_studio_sdk.converter.keypoints import process_keypoints_for_coco, build_kp_order, update_categories_for_keypoints, keypoints_in_label_config, get_yolo_categories_for_keypoints
 from label_studio_sdk.converter.exports import csv2
+from label_studio_sdk.converter.exports.coco import COCOWriter
 from label_studio_sdk.converter.utils import (
     parse_config,
     create_tokens_and_tags,
-    get_image_size_and_channels,
     ensure_dir,
     get_polygon_area,
     get_polygon_bounding_box,
@@ -39,6 +38,9 @@ from label_studio_sdk._extensions.label_studio_tools.core.utils.io import (
     is_cloud_storage_uri,
 )
 from label_studio_sdk.converter.exports.yolo import process_and_save_yolo_annotations
+from label_studio_sdk.converter.image_size import ImageSizeCache
+from label_studio_sdk.converter.manifest import CategoryLookups, COCOTasks, ExportManifest, YOLOTasks
+from label_studio_sdk.converter.media import MediaDownloader
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +192,23 @@ class Converter(object):
         },
     }
 
+    # from_name -> tag entries memoized per Converter, from_names are bounded by the Repeater sizes in practice
+    _TAG_MEMO_SIZE = 100000
+    # tasks sent to a worker at once and batches in flight per worker when converting with workers > 1
+    _WORKER_BATCH_SIZE = 64
+    _WORKER_BATCHES_IN_FLIGHT = 4
+    # items read ahead per download thread, so images are downloading while earlier items are converted
+    _DOWNLOAD_READ_AHEAD = 4
+    # formats convert(incremental=True) can update
+    _INCREMENTAL_FORMATS = (
+        Format.COCO,
+        Format.COCO_WITH_IMAGES,
+        Format.YOLO,
+        Format.YOLO_WITH_IMAGES,
+        Format.YOLO_OBB,
+        Format.YOLO_OBB_WITH_IMAGES,
+    )
+
     def all_formats(self):
         return self._FORMAT_INFO
 
@@ -202,6 +221,8 @@ class Converter(object):
         download_resources=True,
         access_token=None,
         hostname=None,
+        download_workers=8,
+        image_size_cache=False,
     ):
         """Initialize Label Studio Converter for Exports
 
@@ -210,15 +231,28 @@ class Converter(object):
         :param output_tags: it will be calculated automatically, contains label names
         :param upload_dir: upload root directory with files that were imported using LS GUI
         :param download_resources: if True, LS will try to download images, audio, etc and include them to export
+        :param download_workers: concurrent image downloads of COCO, YOLO and VOC exports, 1 downloads one by one
+        :param image_size_cache: path of a json file keeping image sizes measured by COCO and VOC exports
+                                 between exports, True for the default file in the SDK cache dir;
+                                 by default sizes are only kept in memory during one converter's exports
         """
         self.project_dir = project_dir
         self.upload_dir = upload_dir
         self.download_resources = download_resources
         self._schema = None
         self._config_string = None
+        self._tag_index = None
+        self._tag_memo = {}
         self.access_token = access_token
         self.hostname = hostname
         self.is_keypoints = None
+        self.download_workers = download_workers
+        self._workers = 1
+        self._media_downloader = None
+        self._image_sizes = ImageSizeCache(
+            path=image_size_cache if isinstance(image_size_cache, str) else None,
+            persistent=bool(image_size_cache),
+        )
 
         if isinstance(config, dict):
             self._schema = config
@@ -243,10 +277,29 @@ class Converter(object):
         )
         self._supported_formats = self._get_supported_formats()
 
-    def convert(self, input_data, output_data, format, is_dir=True, **kwargs):
+    def convert(self, input_data, output_data, format, is_dir=True, workers=1, incremental=False, **kwargs):
+        """Convert Label Studio tasks from input_data (directory or json file) to format in output_data
+
+        :param workers: number of processes converting tasks; with workers > 1 tasks are converted to items
+                        (and for JSON_MIN, CSV, CONLL2003, COCO, YOLO and VOC, prepared: records built,
+                        images downloaded and measured) in a process pool, the output is the same as with workers=1
+        :param incremental: COCO and YOLO only, update a previous export in output_data: only new and changed tasks
+                            are converted, files of deleted tasks are removed, see ExportManifest
+        """
         if isinstance(format, str):
             format = Format.from_string(format)
+        if incremental:
+            if format not in self._INCREMENTAL_FORMATS:
+                raise FormatNotSupportedError(f"Incremental export is not supported for {format.name}")
+            kwargs["incremental"] = True
+
+        self._workers = workers
+        try:
+            self._convert(input_data, output_data, format, is_dir, **kwargs)
+        finally:
+            self._workers = 1
 
+    def _convert(self, input_data, output_data, format, is_dir, **kwargs):
         if format == Format.JSON:
             self.convert_to_json(input_data, output_data, is_dir=is_dir)
         elif format == Format.JSON_MIN:
@@ -269,7 +322,12 @@ class Converter(object):
             image_dir = kwargs.get("image_dir")
             self.download_resources = format == Format.COCO_WITH_IMAGES
             self.convert_to_coco(
-                input_data, output_data, output_image_dir=image_dir, is_dir=is_dir
+                input_data,
+                output_data,
+                output_image_dir=image_dir,
+                is_dir=is_dir,
+                pretty_print=kwargs.get("pretty_print", True),
+                incremental=kwargs.get("incremental", False),
             )
         elif format in [Format.YOLO, Format.YOLO_OBB, Format.YOLO_OBB_WITH_IMAGES, Format.YOLO_WITH_IMAGES]:
             image_dir = kwargs.get("image_dir")
@@ -282,6 +340,7 @@ class Converter(object):
                 output_label_dir=label_dir,
                 is_dir=is_dir,
                 is_obb=(format in [Format.YOLO_OBB, Format.YOLO_OBB_WITH_IMAGES]),
+                incremental=kwargs.get("incremental", False),
             )
         elif format == Format.VOC:
             image_dir = kwargs.get("image_dir")
@@ -289,25 +348,17 @@ class Converter(object):
                 input_data, output_data, output_image_dir=image_dir, is_dir=is_dir
             )
         elif format == Format.BRUSH_TO_NUMPY:
-            items = (
-                self.iter_from_dir(input_data)
-                if is_dir
-                else self.iter_from_json_file(input_data)
-            )
+            items = (item for item, _ in self._iter_items(input_data, is_dir))
+            from label_studio_sdk.converter import brush
+
             brush.convert_task_dir(items, output_data, out_format="numpy")
         elif format == Format.BRUSH_TO_PNG:
-            items = (
-                self.iter_from_dir(input_data)
-                if is_dir
-                else self.iter_from_json_file(input_data)
-            )
+            items = (item for item, _ in self._iter_items(input_data, is_dir))
+            from label_studio_sdk.converter import brush
+
             brush.convert_task_dir(items, output_data, out_format="png")
         elif format == Format.ASR_MANIFEST:
-            items = (
-                self.iter_from_dir(input_data)
-                if is_dir
-                else self.iter_from_json_file(input_data)
-            )
+            items = (item for item, _ in self._iter_items(input_data, is_dir))
             convert_to_asr_json_manifest(
                 items,
                 output_data,
@@ -317,11 +368,7 @@ class Converter(object):
                 download_resources=self.download_resources,
             )
         elif format == Format.BRUSH_TO_COCO:
-            items = (
-                self.iter_from_dir(input_data)
-                if is_dir
-                else self.iter_from_json_file(input_data)
-            )
+            items = (item for item, _ in self._iter_items(input_data, is_dir))
             from label_studio_sdk.converter.exports.brush_to_coco import convert_to_coco
             image_dir = kwargs.get("image_dir")
             convert_to_coco(
@@ -520,6 +567,137 @@ class Converter(object):
                         if item is not None:
                             yield item
 
+    def _iter_items(self, input_data, is_dir, prepare=None, items=True, media=None):
+        """Items of `iter_from_dir` / `iter_from_json_file` in the same order, each paired with its prepared value
+
+        :param prepare: None or (method name, args), the value is `getattr(self, name)(item, *args)`, None otherwise
+        :param items: if False, items are None in the pairs when converting in a process pool,
+                      for callers that only need the prepared values (saves sending items back from the workers)
+        :param media: None or (data key, cache dir, measure): images of the items to download ahead
+                      with a MediaDownloader, and to measure right after download if measure is True
+        """
+        if self._workers > 1:
+            yield from self._iter_items_in_pool(input_data, is_dir, prepare, items)
+            return
+
+        items = self.iter_from_dir(input_data) if is_dir else self.iter_from_json_file(input_data)
+        if media is not None and self.download_resources and self.download_workers > 1:
+            yield from self._iter_items_with_downloads(items, prepare, *media)
+            return
+
+        for item in items:
+            yield item, self._prepare_item(item, prepare)
+
+    def _iter_items_with_downloads(self, items, prepare, data_key, cache_dir, measure):
+        """Prepare items while the images of the next ones are downloading
+
+        Items are read ahead into a bounded window, the image of each one is submitted to a MediaDownloader
+        as it enters the window and `_get_local_path` waits for it when the item is prepared.
+        """
+        fetch = self._download_and_measure if measure else self._download
+        read_ahead = self.download_workers * self._DOWNLOAD_READ_AHEAD
+        # the window holds at most read_ahead + 1 items, older downloads are found in the media cache
+        downloader = MediaDownloader(
+            max_workers=self.download_workers, fetch=fetch, max_urls=read_ahead + 1, cache_dir=cache_dir
+        )
+        window = deque()
+        self._media_downloader = downloader
+        try:
+            for item in items:
+                url = item["input"].get(data_key) if isinstance(item.get("input"), dict) else None
+                # several images: YOLO tries the last one first
+                url = url[-1] if isinstance(url, list) and url else url
+                if isinstance(url, str) and not os.path.exists(url):
+                    downloader.submit(url, item.get("id"))
+                window.append(item)
+                if len(window) > read_ahead:
+                    item = window.popleft()
+                    yield item, self._prepare_item(item, prepare)
+            while window:
+                item = window.popleft()
+                yield item, self._prepare_item(item, prepare)
+        finally:
+            self._media_downloader = None
+            downloader.close()
+
+    def _get_local_path(self, url, cache_dir, task_id):
+        if self._media_downloader is not None:
+            return self._media_downloader.get_local_path(url, task_id)
+        return self._download(url=url, task_id=task_id, cache_dir=cache_dir)
+
+    def _download(self, url, task_id, cache_dir, session=None):
+        return get_local_path(
+            url=url,
+            hostname=self.hostname,
+            project_dir=self.project_dir,
+            image_dir=self.upload_dir,
+            cache_dir=cache_dir,
+            download_resources=self.download_resources,
+            access_token=self.access_token,
+            task_id=task_id,
+            session=session,
+        )
+
+    def _download_and_measure(self, url, task_id, cache_dir, session=None):
+        path = self._download(url=url, task_id=task_id, cache_dir=cache_dir, session=session)
+        try:
+            self._image_sizes.get(path)
+        except Exception:
+            # reported when the item is prepared
+            pass
+        return path
+
+    def _prepare_item(self, item, prepare):
+        if prepare is None:
+            return None
+        name, args = prepare
+        return getattr(self, name)(item, *args)
+
+    def _iter_work(self, input_data, is_dir):
+        """Work for the process pool: json files of a directory, read by the workers themselves,
+        or batches of the tasks of a single json file, read the way `iter_from_json_file` reads them
+        """
+        if is_dir:
+            if not os.path.exists(input_data):
+                raise FileNotFoundError(
+                    "{input_dir} doesn't exist".format(input_dir=input_data)
+                )
+            yield from glob(os.path.join(input_data, "*.json"))
+            return
+
+        data_type = get_json_root_type(input_data)
+        if data_type == "dict":
+            with open(input_data, "r") as f:
+                yield [json.load(f)]
+        elif data_type == "list":
+            with io.open(input_data, "rb") as f:
+                tasks = ijson.items(f, "item", use_float=True)
+                while batch := list(itertools.islice(tasks, self._WORKER_BATCH_SIZE)):
+                    yield batch
+
+    def _iter_items_in_pool(self, input_data, is_dir, prepare, items):
+        """`_iter_items` with tasks converted in a process pool of self._workers processes
+
+        Json files of a directory go to the workers one by one, tasks of a single json file are read here
+        and sent in batches. Results are collected in submission order, so items come out in the serial order
+        and ids assigned by the caller stay the same.
+        """
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self, prepare, items),
+        )
+        pending = deque()
+        try:
+            for work in self._iter_work(input_data, is_dir):
+                pending.append(pool.submit(_convert_tasks, work))
+                if len(pending) >= self._workers * self._WORKER_BATCHES_IN_FLIGHT:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def _maybe_matching_tag_from_schema(self, from_name: str) -> Optional[str]:
         """If the from name exactly matches an output tag from the schema, return that tag.
 
@@ -527,29 +705,46 @@ class Converter(object):
         placeholders like {{idx}}. Such placeholders are mapped to a regex in self._schema.
         For example, if "my_output_tag_{{idx}}" is a tag in the schema,
         then the from_name "my_output_tag_0" should match it, and we should return "my_output_tag_{{idx}}".
+
+        Lookups go through an index built once from the schema (see `_build_tag_index`),
+        results are memoized per from_name.
         """
+        try:
+            return self._tag_memo[from_name]
+        except KeyError:
+            pass
 
-        best_match = None
-        best_match_len = 0
+        if self._tag_index is None:
+            self._tag_index = self._build_tag_index()
+        exact_names, patterns = self._tag_index
 
-        for tag_name, tag_info in self._schema.items():
-            if tag_name == from_name:
-                return tag_name
+        if from_name in exact_names:
+            tag_name = from_name
+        else:
+            tag_name = next((name for name, pattern in patterns if pattern.match(from_name)), None)
 
+        if len(self._tag_memo) < self._TAG_MEMO_SIZE:
+            self._tag_memo[from_name] = tag_name
+        return tag_name
+
+    def _build_tag_index(self):
+        """Exact tag names and compiled placeholder patterns from the schema.
+
+        Patterns are sorted by length, longest first: in some cases there are tags with same prefix
+        and the longest matching pattern wins, ties go to the tag that comes first in the schema.
+        """
+        patterns = []
+        for tag_name, tag_info in self._schema.items():
             if not tag_info.get("regex"):
                 continue
 
             tag_name_pattern = tag_name
             for variable, regex in tag_info["regex"].items():
                 tag_name_pattern = tag_name_pattern.replace(variable, regex)
+            patterns.append((len(tag_name_pattern), tag_name, re.compile(tag_name_pattern)))
 
-            # In some cases there are tags with same prefix - we need to find the best or longest matching pattern
-            if r := re.compile(tag_name_pattern).match(from_name):
-                if match_len := len(tag_name_pattern) > best_match_len:
-                    best_match = tag_name
-                    best_match_len = len(tag_name_pattern)
-
-        return best_match if best_match else None
+        patterns.sort(key=lambda item: -item[0])
+        return set(self._schema), [(tag_name, pattern) for _, tag_name, pattern in patterns]
 
     def annotation_result_from_task(self, task):
         has_annotations = "completions" in task or "annotations" in task
@@ -596,7 +791,8 @@ class Converter(object):
                     else None
                 )
                 if from_name and tag_name:
-                    v = deepcopy(r["value"])
+                    # shallow copy: exporters only add keys to the values, nested lists and dicts stay shared
+                    v = dict(r["value"])
                     v["type"] = self._schema[tag_name]["type"]
                     if "original_width" in r:
                         v["original_width"] = r["original_width"]
@@ -608,7 +804,7 @@ class Converter(object):
                         v['parentID'] = r.get('parentID')
                     
                 elif from_name and r.get("type") == "chatmessage":
-                    v = deepcopy(r.get("value", {}))
+                    v = dict(r.get("value", {}))
                     v["type"] = "chatmessage"
                     outputs[from_name].append(v)
                     
@@ -669,29 +865,12 @@ class Converter(object):
         self._check_format(Format.JSON_MIN)
         ensure_dir(output_dir)
         output_file = os.path.join(output_dir, "result.json")
-        item_iterator = self.iter_from_dir if is_dir else self.iter_from_json_file
 
         with io.open(output_file, mode="w", encoding="utf8") as fout:
             fout.write("[\n")
             first_record = True
 
-            for item in item_iterator(input_data):
-                # SAFE memory optimization: use json serialization/deserialization
-                # This avoids deepcopy but ensures complete isolation of objects
-                record = json.loads(json.dumps(item["input"]))
-
-                if item.get("id") is not None:
-                    record["id"] = item["id"]
-                for name, value in item["output"].items():
-                    record[name] = prettify_result(value)
-                record["annotator"] = get_annotator(item, int_id=True)
-                record["annotation_id"] = item["annotation_id"]
-                record["created_at"] = item["created_at"]
-                record["updated_at"] = item["updated_at"]
-                record["lead_time"] = item["lead_time"]
-                if "agreement" in item:
-                    record["agreement"] = item["agreement"]
-
+            for _, record in self._iter_items(input_data, is_dir, ("_json_min_record", ()), items=False):
                 # Write record to file immediately
                 if not first_record:
                     fout.write(",\n")
@@ -703,9 +882,29 @@ class Converter(object):
 
             fout.write("\n]")
 
+    def _json_min_record(self, item):
+        # only keys are added to the record, task data values are dumped as is
+        record = dict(item["input"])
+
+        if item.get("id") is not None:
+            record["id"] = item["id"]
+        for name, value in item["output"].items():
+            record[name] = prettify_result(value)
+        record["annotator"] = get_annotator(item, int_id=True)
+        record["annotation_id"] = item["annotation_id"]
+        record["created_at"] = item["created_at"]
+        record["updated_at"] = item["updated_at"]
+        record["lead_time"] = item["lead_time"]
+        if "agreement" in item:
+            record["agreement"] = item["agreement"]
+        return record
+
     def convert_to_csv(self, input_data, output_dir, is_dir=True, **kwargs):
         self._check_format(Format.CSV)
-        item_iterator = self.iter_from_dir if is_dir else self.iter_from_json_file
+
+        def item_iterator(input_data):
+            return (item for item, _ in self._iter_items(input_data, is_dir))
+
         return csv2.convert(item_iterator, input_data, output_dir, **kwargs)
 
     def convert_to_conll2003(self, input_data, output_dir, is_dir=True):
@@ -715,28 +914,39 @@ class Converter(object):
         data_key = self._data_keys[0]
         with io.open(output_file, "w", encoding="utf8") as fout:
             fout.write("-DOCSTART- -X- O\n")
-            item_iterator = self.iter_from_dir if is_dir else self.iter_from_json_file
 
-            for item in item_iterator(input_data):
-                filtered_output = list(
-                    filter(
-                        lambda x: x[0]["type"].lower() == "labels",
-                        item["output"].values(),
-                    )
-                )
-                tokens, tags = create_tokens_and_tags(
-                    text=item["input"][data_key],
-                    spans=next(iter(filtered_output), None),
-                )
-                for token, tag in zip(tokens, tags):
-                    fout.write("{token} -X- _ {tag}\n".format(token=token, tag=tag))
-                fout.write("\n")
+            for _, lines in self._iter_items(
+                input_data, is_dir, ("_conll2003_lines", (data_key,)), items=False
+            ):
+                fout.write(lines)
+
+    @staticmethod
+    def _conll2003_lines(item, data_key):
+        filtered_output = list(
+            filter(
+                lambda x: x[0]["type"].lower() == "labels",
+                item["output"].values(),
+            )
+        )
+        tokens, tags = create_tokens_and_tags(
+            text=item["input"][data_key],
+            spans=next(iter(filtered_output), None),
+        )
+        lines = ["{token} -X- _ {tag}\n".format(token=token, tag=tag) for token, tag in zip(tokens, tags)]
+        return "".join(lines) + "\n"
 
     def convert_to_coco(
-        self, input_data, output_dir, output_image_dir=None, is_dir=True
+        self, input_data, output_dir, output_image_dir=None, is_dir=True, pretty_print=True, incremental=False
     ):
-        def add_image(images, width, height, image_id, image_path):
-            images.append(
+        """Convert tasks to COCO result.json in output_dir
+
+        Images and annotations are streamed to disk while converting, so memory doesn't grow with the export.
+        :param pretty_print: if False result.json is written without indents, much smaller and faster to write
+        :param incremental: update a previous export in output_dir: images and annotations of unchanged tasks
+                            are taken from its manifest, only new and changed tasks are converted
+        """
+        def add_image(writer, width, height, image_id, image_path):
+            writer.add_image(
                 {
                     "width": width,
                     "height": height,
@@ -744,7 +954,6 @@ class Converter(object):
                     "file_name": image_path,
                 }
             )
-            return images
 
         self._check_format(Format.COCO)
         ensure_dir(output_dir)
@@ -754,117 +963,90 @@ class Converter(object):
         else:
             output_image_dir = os.path.join(output_dir, "images")
             os.makedirs(output_image_dir, exist_ok=True)
-        images, categories, annotations = [], [], []
         categories, category_name_to_id = self._get_labels()
         categories, category_name_to_id = update_categories_for_keypoints(categories, category_name_to_id, self._schema)
         data_key = self._data_keys[0]
-        item_iterator = (
-            self.iter_from_dir(input_data)
-            if is_dir
-            else self.iter_from_json_file(input_data)
+        item_iterator = self._iter_items(
+            input_data, is_dir, ("_coco_image", (output_dir, output_image_dir, data_key)),
+            media=(data_key, output_image_dir, True),
         )
-        for item_idx, item in enumerate(item_iterator):
-            image_path = item["input"][data_key]
-            task_id = item["id"]
-            image_id = len(images)
-            width = None
-            height = None
-            # download all images of the dataset, including the ones without annotations
-            if not os.path.exists(image_path):
-                try:
-                    image_path = get_local_path(
-                        url=image_path,
-                        hostname=self.hostname,
-                        project_dir=self.project_dir,
-                        image_dir=self.upload_dir,
-                        cache_dir=output_image_dir,
-                        download_resources=self.download_resources,
-                        access_token=self.access_token,
-                        task_id=task_id,
-                    )
-                    # make path relative to output_image_dir
-                    image_path = os.path.relpath(image_path, output_dir)
-                except:
-                    logger.info(
-                        "Unable to download {image_path}. The image of {item} will be skipped".format(
-                            image_path=image_path, item=item
-                        ),
-                        exc_info=True,
-                    )
-            # add image to final images list
-            try:
-                with Image.open(os.path.join(output_dir, image_path)) as img:
-                    width, height = img.size
-                images = add_image(images, width, height, image_id, image_path)
-            except:
-                logger.info(
-                    "Unable to open {image_path}, can't extract width and height for COCO export".format(
-                        image_path=image_path, item=item
-                    ),
-                    exc_info=True,
-                )
-
-            # skip tasks without annotations
-            if not item["output"]:
-                # image wasn't load and there are no labels
-                if not width:
-                    images = add_image(images, width, height, image_id, image_path)
-
-                logger.warning(f"No annotations found for item {task_id=}")
-                continue
-
-            # concatenate results over all tag names
-            labels = []
-            for key in item["output"]:
-                labels += item["output"][key]
+        with COCOWriter(output_file, indent=2 if pretty_print else 0) as writer, self._export_manifest(
+            incremental, output_dir, output_image_dir, format="COCO"
+        ) as manifest:
+            if manifest is not None:
+                category_name_to_id = CategoryLookups(category_name_to_id)
+                tasks = COCOTasks(writer, categories, category_name_to_id, output_dir, output_image_dir)
+                item_iterator = manifest.changed_items(item_iterator, tasks)
+            for item_idx, (item, (image_path, image_size)) in enumerate(item_iterator):
+                task_id = item["id"]
+                image_id = writer.num_images
+                width = None
+                height = None
+                # add image to final images list
+                if image_size is not None:
+                    width, height = image_size
+                    add_image(writer, width, height, image_id, image_path)
+
+                # skip tasks without annotations
+                if not item["output"]:
+                    # image wasn't load and there are no labels
+                    if not width:
+                        add_image(writer, width, height, image_id, image_path)
+
+                    logger.warning(f"No annotations found for item {task_id=}")
+                    continue
 
-            if len(labels) == 0:
-                logger.debug(f'Empty bboxes for {item["output"]} {task_id=}')
-                continue
+                # concatenate results over all tag names
+                labels = []
+                for key in item["output"]:
+                    labels += item["output"][key]
 
-            keypoint_labels = []
-            for label in labels:
-                category_name = None
-                for key in ["rectanglelabels", "polygonlabels", "keypointlabels", "labels"]:
-                    if key in label and len(label[key]) > 0:
-                        category_name = label[key][0]
-                        break
-
-                if category_name is None:
-                    logger.warning("Unknown label type or labels are empty {task_id=}")
+                if len(labels) == 0:
+                    logger.debug(f'Empty bboxes for {item["output"]} {task_id=}')
                     continue
 
-                if not height or not width:
-                    if "original_width" not in label or "original_height" not in label:
-                        logger.debug(
-                            f"original_width or original_height not found in {image_path} {task_id=}"
-                        )
+                keypoint_labels = []
+                for label in labels:
+                    category_name = None
+                    for key in ["rectanglelabels", "polygonlabels", "keypointlabels", "labels"]:
+                        if key in label and len(label[key]) > 0:
+                            category_name = label[key][0]
+                            break
+
+                    if category_name is None:
+                        logger.warning("Unknown label type or labels are empty {task_id=}")
                         continue
 
-                    width, height = label["original_width"], label["original_height"]
-                    images = add_image(images, width, height, image_id, image_path)
+                    if not height or not width:
+                        if "original_width" not in label or "original_height" not in label:
+                            logger.debug(
+                                f"original_width or original_height not found in {image_path} {task_id=}"
+                            )
+                            continue
 
-                if category_name not in category_name_to_id:
-                    category_id = len(categories)
-                    category_name_to_id[category_name] = category_id
-                    categories.append({"id": category_id, "name": category_name})
-                category_id = category_name_to_id[category_name]
+                        width, height = label["original_width"], label["original_height"]
+                        add_image(writer, width, height, image_id, image_path)
 
-                annotation_id = len(annotations)
+                    if category_name not in category_name_to_id:
+                        category_id = len(categories)
+                        category_name_to_id[category_name] = category_id
+                        categories.append({"id": category_id, "name": category_name})
+                    category_id = category_name_to_id[category_name]
 
-                if "rectanglelabels" in label or "labels" in label:
-                    xywh = self.rotated_rectangle(label)
-                    if xywh is None:
-                        continue
+                    annotation_id = writer.num_annotations
 
-                    x, y, w, h = xywh
-                    x = x * label["original_width"] / 100
-                    y = y * label["original_height"] / 100
-                    w = w * label["original_width"] / 100
-                    h = h * label["original_height"] / 100
+                    if "rectanglelabels" in label or "labels" in label:
+                        xywh = self.rotated_rectangle(label)
+                        if xywh is None:
+                            continue
 
-                    annotations.append(
-                        {
+                        x, y, w, h = xywh
+                        x = x * label["original_width"] / 100
+                        y = y * label["original_height"] / 100
+                        w = w * label["original_width"] / 100
+                        h = h * label["original_height"] / 100
+
+                        annotation = {
                             "id": annotation_id,
                             "image_id": image_id,
                             "category_id": category_id,
@@ -874,15 +1056,13 @@ class Converter(object):
                             "iscrowd": 0,
                             "area": w * h,
                         }
-                    )
-                elif "polygonlabels" in label:
-                    points_abs = [
-                        (x / 100 * width, y / 100 * height) for x, y in label["points"]
-                    ]
-                    x, y = zip(*points_abs)
-
-                    annotations.append(
-                        {
+                    elif "polygonlabels" in label:
+                        points_abs = [
+                            (x / 100 * width, y / 100 * height) for x, y in label["points"]
+                        ]
+                        x, y = zip(*points_abs)
+
+                        annotation = {
                             "id": annotation_id,
                             "image_id": image_id,
                             "category_id": category_id,
@@ -894,42 +1074,70 @@ class Converter(object):
                             "iscrowd": 0,
                             "area": get_polygon_area(x, y),
                         }
-                    )
-                elif "keypointlabels" in label:
-                    keypoint_labels.append(label)
-                else:
-                    raise ValueError("Unknown label type")
-
-                if os.getenv("LABEL_STUDIO_FORCE_ANNOTATOR_EXPORT"):
-                    annotations[-1].update({"annotator": get_annotator(item)})
-            if keypoint_labels:
-                kp_order = build_kp_order(self._schema)
-                annotations.append(process_keypoints_for_coco(
-                    keypoint_labels,
-                    kp_order,
-                    annotation_id=len(annotations),
-                    image_id=image_id,
-                    category_name_to_id=category_name_to_id,
-                ))
-
-        with io.open(output_file, mode="w", encoding="utf8") as fout:
-            json.dump(
+                    elif "keypointlabels" in label:
+                        keypoint_labels.append(label)
+                        continue
+                    else:
+                        raise ValueError("Unknown label type")
+
+                    if os.getenv("LABEL_STUDIO_FORCE_ANNOTATOR_EXPORT"):
+                        annotation.update({"annotator": get_annotator(item)})
+                    writer.add_annotation(annotation)
+                if keypoint_labels:
+                    kp_order = build_kp_order(self._schema)
+                    writer.add_annotation(process_keypoints_for_coco(
+                        keypoint_labels,
+                        kp_order,
+                        annotation_id=writer.num_annotations,
+                        image_id=image_id,
+                        category_name_to_id=category_name_to_id,
+                    ))
+
+            writer.write(
+                categories,
                 {
-                    "images": images,
-                    "categories": categories,
-                    "annotations": annotations,
-                    "info": {
-                        "year": datetime.now().year,
-                        "version": "1.0",
-                        "description": "",
-                        "contributor": "Label Studio",
-                        "url": "",
-                        "date_created": str(datetime.now()),
-                    },
+                    "year": datetime.now().year,
+                    "version": "1.0",
+                    "description": "",
+                    "contributor": "Label Studio",
+                    "url": "",
+                    "date_created": str(datetime.now()),
                 },
-                fout,
-                indent=2,
             )
+        self._image_sizes.save()
+
+    def _coco_image(self, item, output_dir, output_image_dir, data_key):
+        """Image path of a COCO item and its (width, height), None if the image can't be opened"""
+        image_path = item["input"][data_key]
+        task_id = item["id"]
+        # download all images of the dataset, including the ones without annotations
+        if not os.path.exists(image_path):
+            try:
+                image_path = self._get_local_path(image_path, output_image_dir, task_id)
+                # make path relative to output_image_dir
+                image_path = os.path.relpath(image_path, output_dir)
+            except:
+                logger.info(
+                    "Unable to download {image_path}. The image of {item} will be skipped".format(
+                        image_path=image_path, item=item
+                    ),
+                    exc_info=True,
+                )
+        # the size Label Studio measured when the image was annotated
+        for labels in item["output"].values():
+            for label in labels:
+                if label.get("original_width") and label.get("original_height"):
+                    return image_path, (label["original_width"], label["original_height"])
+        try:
+            return image_path, self._image_sizes.get(os.path.join(output_dir, image_path))[:2]
+        except:
+            logger.info(
+                "Unable to open {image_path}, can't extract width and height for COCO export".format(
+                    image_path=image_path, item=item
+                ),
+                exc_info=True,
+            )
+            return image_path, None
 
     def convert_to_yolo(
         self,
@@ -940,6 +1148,7 @@ class Converter(object):
         is_dir=True,
         split_labelers=False,
         is_obb=False,
+        incremental=False,
     ):
         """Convert data in a specific format to the YOLO format.
 
@@ -959,6 +1168,9 @@ class Converter(object):
             A boolean indicating whether to create a dedicated subfolder for each labeler in the output label directory.
         obb : bool, optional
             A boolean indicating whether to convert to Oriented Bounding Box (OBB) format.
+        incremental : bool, optional
+            A boolean indicating whether to update a previous export in output_dir, converting only new and changed
+            tasks and removing the files of deleted ones.
         """
         if is_obb:
             self._check_format(Format.YOLO_OBB)
@@ -986,95 +1198,63 @@ class Converter(object):
         else:
             categories, category_name_to_id = self._get_labels()
         data_key = self._data_keys[0]
-        item_iterator = (
-            self.iter_from_dir(input_data)
-            if is_dir
-            else self.iter_from_json_file(input_data)
+        item_iterator = self._iter_items(
+            input_data, is_dir, ("_yolo_image_path", (output_dir, output_image_dir, data_key)),
+            media=(data_key, output_image_dir, False),
         )
-        for item_idx, item in enumerate(item_iterator):
-            # get image path(s) and label file path
-            image_paths = item["input"][data_key]
-            image_paths = [image_paths] if isinstance(image_paths, str) else image_paths
-            # download image(s)
-            resolved_image_path = None
-            task_id = item["id"]
-            # TODO: for multi-page annotation, this code won't produce correct relationships between page and annotated shapes
-            # fixing the issue in RND-84
-            for candidate in reversed(image_paths):
-                try:
-                    if os.path.exists(candidate):
-                        resolved_image_path = candidate
-                    else:
-                        local_path = get_local_path(
-                            url=candidate,
-                            hostname=self.hostname,
-                            project_dir=self.project_dir,
-                            image_dir=self.upload_dir,
-                            cache_dir=output_image_dir,
-                            download_resources=self.download_resources,
-                            access_token=self.access_token,
-                            task_id=task_id,
-                        )
-                        # make path relative to output_image_dir
-                        resolved_image_path = os.path.relpath(local_path, output_dir)
-                    break
-                except Exception:
-                    logger.info(
-                        "Unable to download {image_path}. The item {item} will be skipped".format(
-                            image_path=candidate, item=item
-                        ),
-                        exc_info=True,
-                    )
-                    # FIT-2611: YOLO_*_WITH_IMAGES must not emit orphan labels when cloud
-                    # download fails. For label-only YOLO (or non-cloud paths), keep the
-                    # legacy fallback so label filenames still derive from the URI/path.
-                    if self.download_resources and is_cloud_storage_uri(candidate):
-                        resolved_image_path = None
-                        continue
-                    resolved_image_path = candidate
-                    break
-            if not resolved_image_path:
-                logger.error(f"No image path found for {task_id=}")
-                continue
+        settings = dict(format="YOLO", is_obb=is_obb, split_labelers=split_labelers, label_dir=output_label_dir)
+        with self._export_manifest(incremental, output_dir, output_image_dir, **settings) as manifest:
+            if manifest is not None:
+                category_name_to_id = CategoryLookups(category_name_to_id)
+                tasks = YOLOTasks(
+                    categories,
+                    category_name_to_id,
+                    output_dir,
+                    output_image_dir,
+                    output_label_dir,
+                    lambda item, image_path: self._yolo_label_path(
+                        image_path, output_label_dir, str(item["completed_by"]) if split_labelers else ""
+                    ),
+                )
+                item_iterator = manifest.changed_items(item_iterator, tasks)
+            for item_idx, (item, resolved_image_path) in enumerate(item_iterator):
+                task_id = item["id"]
+                if not resolved_image_path:
+                    logger.error(f"No image path found for {task_id=}")
+                    continue
 
-            image_path = resolved_image_path
+                image_path = resolved_image_path
 
-            # create dedicated subfolder for each labeler if split_labelers=True
-            labeler_subfolder = str(item["completed_by"]) if split_labelers else ""
-            os.makedirs(
-                os.path.join(output_label_dir, labeler_subfolder), exist_ok=True
-            )
+                # create dedicated subfolder for each labeler if split_labelers=True
+                labeler_subfolder = str(item["completed_by"]) if split_labelers else ""
+                os.makedirs(
+                    os.path.join(output_label_dir, labeler_subfolder), exist_ok=True
+                )
 
-            # identify label file path
-            filename = os.path.splitext(os.path.basename(image_path))[0]
-            filename = filename[
-                0 : 255 - 4
-            ]  # urls might be too long, use 255 bytes (-4 for .txt) limit for filenames
-            label_path = os.path.join(
-                output_label_dir, labeler_subfolder, filename + ".txt"
-            )
+                # identify label file path
+                label_path = self._yolo_label_path(image_path, output_label_dir, labeler_subfolder)
 
-            # Skip tasks without annotations
-            if not item["output"]:
-                logger.warning(f"No completions found for {task_id=}")
-                if not os.path.exists(label_path):
-                    with open(label_path, "x"):
-                        pass
-                continue
+                # Skip tasks without annotations
+                if not item["output"]:
+                    logger.warning(f"No completions found for {task_id=}")
+                    if not os.path.exists(label_path):
+                        with open(label_path, "x"):
+                            pass
+                    continue
 
-            # concatenate results over all tag names
-            labels = []
-            for key in item["output"]:
-                labels += item["output"][key]
+                # concatenate results over all tag names
+                labels = []
+                for key in item["output"]:
+                    labels += item["output"][key]
 
-            if len(labels) == 0:
-                logger.warning(f'Empty bboxes for {item["output"]} in {task_id=}')
-                if not os.path.exists(label_path):
-                    with open(label_path, "x"):
-                        pass
-                continue
+                if len(labels) == 0:
+                    logger.warning(f'Empty bboxes for {item["output"]} in {task_id=}')
+                    if not os.path.exists(label_path):
+                        with open(label_path, "x"):
+                            pass
+                    continue
 
-            categories, category_name_to_id = process_and_save_yolo_annotations(labels, label_path, category_name_to_id, categories, is_obb, is_keypoints, self._schema)
+                categories, category_name_to_id = process_and_save_yolo_annotations(labels, label_path, category_name_to_id, categories, is_obb, is_keypoints, self._schema)
         with open(class_file, "w", encoding="utf8") as f:
             for c in categories:
                 f.write(c["name"] + "\n")
@@ -1092,6 +1272,65 @@ class Converter(object):
                 indent=2,
             )
 
+    @staticmethod
+    def _yolo_label_path(image_path, output_label_dir, labeler_subfolder):
+        filename = os.path.splitext(os.path.basename(image_path))[0]
+        filename = filename[
+            0 : 255 - 4
+        ]  # urls might be too long, use 255 bytes (-4 for .txt) limit for filenames
+        return os.path.join(output_label_dir, labeler_subfolder, filename + ".txt")
+
+    def _export_manifest(self, incremental, output_dir, output_image_dir, **settings):
+        """ExportManifest of an incremental export to use in a with block, a context giving None otherwise"""
+        if not incremental:
+            return nullcontext()
+        return ExportManifest(output_dir, self._manifest_settings(output_image_dir, **settings))
+
+    def _manifest_settings(self, output_image_dir, **settings):
+        """Settings of an incremental export, a change in them converts all tasks again"""
+        return dict(
+            settings,
+            image_dir=os.path.abspath(output_image_dir),
+            download_resources=self.download_resources,
+            schema=repr(self._schema),
+        )
+
+    def _yolo_image_path(self, item, output_dir, output_image_dir, data_key):
+        """Image path of a YOLO item, downloaded if needed, None if there is no usable image"""
+        # get image path(s) and label file path
+        image_paths = item["input"][data_key]
+        image_paths = [image_paths] if isinstance(image_paths, str) else image_paths
+        # download image(s)
+        resolved_image_path = None
+        task_id = item["id"]
+        # TODO: for multi-page annotation, this code won't produce correct relationships between page and annotated shapes
+        # fixing the issue in RND-84
+        for candidate in reversed(image_paths):
+            try:
+                if os.path.exists(candidate):
+                    resolved_image_path = candidate
+                else:
+                    local_path = self._get_local_path(candidate, output_image_dir, task_id)
+                    # make path relative to output_image_dir
+                    resolved_image_path = os.path.relpath(local_path, output_dir)
+                break
+            except Exception:
+                logger.info(
+                    "Unable to download {image_path}. The item {item} will be skipped".format(
+                        image_path=candidate, item=item
+                    ),
+                    exc_info=True,
+                )
+                # FIT-2611: YOLO_*_WITH_IMAGES must not emit orphan labels when cloud
+                # download fails. For label-only YOLO (or non-cloud paths), keep the
+                # legacy fallback so label filenames still derive from the URI/path.
+                if self.download_resources and is_cloud_storage_uri(candidate):
+                    resolved_image_path = None
+                    continue
+                resolved_image_path = candidate
+                break
+        return resolved_image_path
+
     @staticmethod
     def rotated_rectangle(label):
         if not (
@@ -1173,47 +1412,15 @@ class Converter(object):
             parent_node.appendChild(child_node)
 
         data_key = self._data_keys[0]
-        item_iterator = (
-            self.iter_from_dir(input_data)
-            if is_dir
-            else self.iter_from_json_file(input_data)
+        item_iterator = self._iter_items(
+            input_data, is_dir, ("_voc_image", (output_dir, output_image_dir, data_key)),
+            media=(data_key, output_image_dir, True),
         )
-        for item_idx, item in enumerate(item_iterator):
-            image_path = item["input"][data_key]
+        for item_idx, (item, (image_path, channels)) in enumerate(item_iterator):
             annotations_dir = os.path.join(output_dir, "Annotations")
             if not os.path.exists(annotations_dir):
                 os.makedirs(annotations_dir)
-            # Download image (get_local_path: uploads, local storage, and cloud via presign — FIT-2611)
-            channels = 3
             task_id = item["id"]
-            if not os.path.exists(image_path):
-                try:
-                    local_path = get_local_path(
-                        url=image_path,
-                        hostname=self.hostname,
-                        project_dir=self.project_dir,
-                        image_dir=self.upload_dir,
-                        cache_dir=output_image_dir,
-                        download_resources=self.download_resources,
-                        access_token=self.access_token,
-                        task_id=task_id,
-                    )
-                    # make path relative to output_dir (same layout as COCO)
-                    image_path = os.path.relpath(local_path, output_dir)
-                except Exception:
-                    logger.info(
-                        "Unable to download {image_path}. The item {item} will be skipped".format(
-                            image_path=image_path, item=item
-                        ),
-                        exc_info=True,
-                    )
-                else:
-                    full_image_path = os.path.join(output_dir, image_path)
-                    # retrieve number of channels from downloaded image
-                    try:
-                        _, _, channels = get_image_size_and_channels(full_image_path)
-                    except Exception:
-                        logger.warning(f"Can't read channels from image {task_id=}")
 
             # skip tasks without annotations
             if not item["output"]:
@@ -1297,6 +1504,34 @@ class Converter(object):
 
             with io.open(xml_filepath, mode="w", encoding="utf8") as fout:
                 doc.writexml(fout, addindent="" * 4, newl="\n", encoding="utf-8")
+        self._image_sizes.save()
+
+    def _voc_image(self, item, output_dir, output_image_dir, data_key):
+        """Image path of a VOC item and its number of channels"""
+        image_path = item["input"][data_key]
+        # Download image (get_local_path: uploads, local storage, and cloud via presign — FIT-2611)
+        channels = 3
+        task_id = item["id"]
+        if not os.path.exists(image_path):
+            try:
+                local_path = self._get_local_path(image_path, output_image_dir, task_id)
+                # make path relative to output_dir (same layout as COCO)
+                image_path = os.path.relpath(local_path, output_dir)
+            except Exception:
+                logger.info(
+                    "Unable to download {image_path}. The item {item} will be skipped".format(
+                        image_path=image_path, item=item
+                    ),
+                    exc_info=True,
+                )
+            else:
+                full_image_path = os.path.join(output_dir, image_path)
+                # retrieve number of channels from downloaded image
+                try:
+                    _, _, channels = self._image_sizes.get(full_image_path)
+                except Exception:
+                    logger.warning(f"Can't read channels from image {task_id=}")
+        return image_path, channels
 
     def _get_labels(self):
         labels = set()
@@ -1329,3 +1564,29 @@ class Converter(object):
             categories.append({"id": idx, "name": label})
             category_name_to_id[label] = idx
         return categories, category_name_to_id
+
+
+# converter and prepare step of a worker process, see Converter._iter_items_in_pool
+_worker_converter = None
+_worker_prepare = None
+_worker_items = True
+
+
+def _init_worker(converter, prepare, items):
+    global _worker_converter, _worker_prepare, _worker_items
+    _worker_converter = converter
+    _worker_prepare = prepare
+    _worker_items = items
+
+
+def _convert_tasks(work):
+    """Items and prepared values of a json file or a batch of tasks, in a worker process"""
+    if isinstance(work, str):
+        items = _worker_converter.iter_from_json_file(work)
+    else:
+        items = (item for task in work for item in _worker_converter.annotation_result_from_task(task))
+    return [
+        (item if _worker_items else None, _worker_converter._prepare_item(item, _worker_prepare))
+        for item in items
+        if item
+    ]
@@ -0,0 +1,96 @@
+import io
+import logging
+import os
+import shutil
+import tempfile
+
+import ujson as json
+
+logger = logging.getLogger(__name__)
+
+
+class COCOWriter:
+    """Write a COCO result.json without keeping images and annotations in memory
+
+    Images and annotations are serialized as they are added into temporary files next to the output,
+    `write` splices them with the categories and info into the same json that
+    `json.dump({"images": ..., "categories": ..., "annotations": ..., "info": ...}, indent=indent)` produces.
+
+    with COCOWriter("result.json") as writer:
+        writer.add_image({"id": writer.num_images, ...})
+        writer.add_annotation({"id": writer.num_annotations, ...})
+        writer.write(categories, info)
+    """
+
+    def __init__(self, output_file, indent=2):
+        """
+        :param output_file: path of the COCO json
+        :param indent: json indent, 0 writes compact json
+        """
+        self.output_file = output_file
+        self.indent = indent
+        self.num_images = 0
+        self.num_annotations = 0
+        # list to collect ("image" | "annotation", value) of added values in, see ExportManifest
+        self.recorded = None
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        self._images = tempfile.TemporaryFile("w+", encoding="utf8", dir=output_dir)
+        self._annotations = tempfile.TemporaryFile("w+", encoding="utf8", dir=output_dir)
+
+    def add_image(self, image):
+        if self.recorded is not None:
+            self.recorded.append(("image", image))
+        self._add(self._images, image, self.num_images)
+        self.num_images += 1
+
+    def add_annotation(self, annotation):
+        if self.recorded is not None:
+            self.recorded.append(("annotation", annotation))
+        self._add(self._annotations, annotation, self.num_annotations)
+        self.num_annotations += 1
+
+    def write(self, categories, info):
+        """Write the output file, the images and annotations added so far go between categories and info"""
+        logger.debug(f"Write {self.num_images} images and {self.num_annotations} annotations to {self.output_file}")
+        indent = "\n" + " " * self.indent if self.indent else ""
+        key_separator = ": " if self.indent else ":"
+        with io.open(self.output_file, mode="w", encoding="utf8") as fout:
+            fout.write("{" + indent + '"images"' + key_separator)
+            self._copy_array(self._images, self.num_images, fout)
+            fout.write("," + indent + '"categories"' + key_separator + self._dumps(categories))
+            fout.write("," + indent + '"annotations"' + key_separator)
+            self._copy_array(self._annotations, self.num_annotations, fout)
+            fout.write("," + indent + '"info"' + key_separator + self._dumps(info))
+            fout.write(("\n" if self.indent else "") + "}")
+
+    def close(self):
+        self._images.close()
+        self._annotations.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _dumps(self, value):
+        # values are nested one level in the output
+        dumped = json.dumps(value, indent=self.indent)
+        return dumped.replace("\n", "\n" + " " * self.indent) if self.indent else dumped
+
+    def _add(self, array, value, index):
+        # elements are nested two levels in the output
+        indent = "\n" + " " * (2 * self.indent) if self.indent else ""
+        dumped = json.dumps(value, indent=self.indent)
+        if self.indent:
+            dumped = dumped.replace("\n", indent)
+        array.write(("," if index else "") + indent + dumped)
+
+    def _copy_array(self, array, length, fout):
+        if not length:
+            fout.write("[]")
+            return
+        fout.write("[")
+        array.seek(0)
+        shutil.copyfileobj(array, fout)
+        fout.write(("\n" + " " * self.indent if self.indent else "") + "]")
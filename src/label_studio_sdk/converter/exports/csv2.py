@@ -1,7 +1,9 @@
 import os
 import csv
 import time
+import pickle
 import logging
+import tempfile
 import ujson as json
 
 from copy import deepcopy, copy
@@ -12,8 +14,17 @@ from label_studio_sdk.converter.utils import ensure_dir, get_annotator, prettify
 logger = logging.getLogger(__name__)
 logger.setLevel("DEBUG")
 
+# rows pickled together into the spill file of the single pass conversion
+SPILL_BATCH_SIZE = 1000
 
-def convert(item_iterator, input_data, output_dir, **kwargs):
+
+def convert(item_iterator, input_data, output_dir, single_pass=True, **kwargs):
+    """Write the CSV export of the items of item_iterator(input_data)
+
+    The columns and the names of task.data columns colliding with control tags are known only after all items,
+    with single_pass=True items are read once: rows are spilled to a temporary file next to the output while
+    the columns are collected and then copied to the CSV; single_pass=False reads the items three times instead.
+    """
     start_time = time.time()
     logger.debug("Convert CSV started")
     if str(output_dir).endswith(".csv"):
@@ -25,6 +36,59 @@ def convert(item_iterator, input_data, output_dir, **kwargs):
         ensure_dir(output_dir)
         output_file = os.path.join(output_dir, "result.csv")
 
+    if single_pass:
+        _convert_single_pass(item_iterator(input_data), output_file, kwargs["sep"])
+    else:
+        _convert_three_passes(item_iterator, input_data, output_file, kwargs["sep"])
+
+    logger.debug(f"CSV conversion finished in {time.time()-start_time:0.2f} sec")
+
+
+def _convert_single_pass(items, output_file, sep):
+    # these keys are always presented
+    keys = {"annotator", "annotation_id", "created_at", "updated_at", "lead_time"}
+    input_keys = set()
+    output_keys = set()
+
+    logger.debug("Prepare CSV rows and discover columns ...")
+    with tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(output_file))) as spill:
+        batch = []
+        for item in items:
+            input_keys.update(item["input"].keys())
+            output_keys.update(item["output"].keys())
+            # task.data columns by their own names, the colliding ones are renamed below
+            keys.update(prepare_annotation_keys(item, colliding_keys=()))
+            batch.append(_prepare_annotation_parts(item))
+            if len(batch) == SPILL_BATCH_SIZE:
+                pickle.dump(batch, spill, protocol=pickle.HIGHEST_PROTOCOL)
+                batch = []
+        if batch:
+            pickle.dump(batch, spill, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # a colliding key is also an annotation column, so only the renamed column is missing
+        colliding_keys = input_keys & output_keys
+        keys.update(_input_column_name(name, colliding_keys) for name in colliding_keys)
+
+        logger.debug(f"Write {spill.tell() / 2**20:0.1f} MiB of spilled CSV rows ...")
+        spill.seek(0)
+        with open(output_file, "w", encoding="utf8") as outfile:
+            writer = csv.DictWriter(
+                outfile,
+                fieldnames=sorted(list(keys)),
+                quoting=csv.QUOTE_NONNUMERIC,
+                delimiter=sep,
+            )
+            writer.writeheader()
+            while True:
+                try:
+                    batch = pickle.load(spill)
+                except EOFError:
+                    break
+                writer.writerows(_join_annotation_parts(parts, colliding_keys) for parts in batch)
+
+
+def _convert_three_passes(item_iterator, input_data, output_file, sep):
+    start_time = time.time()
     # these keys are always presented
     keys = {"annotator", "annotation_id", "created_at", "updated_at", "lead_time"}
 
@@ -52,7 +116,7 @@ def convert(item_iterator, input_data, output_dir, **kwargs):
             outfile,
             fieldnames=sorted(list(keys)),
             quoting=csv.QUOTE_NONNUMERIC,
-            delimiter=kwargs["sep"],
+            delimiter=sep,
         )
         writer.writeheader()
 
@@ -60,8 +124,6 @@ def convert(item_iterator, input_data, output_dir, **kwargs):
             record = prepare_annotation(item, colliding_keys)
             writer.writerow(record)
 
-    logger.debug(f"CSV conversion finished in {time.time()-start_time:0.2f} sec")
-
 
 def generate_chat_transcript(pretty_value):
     """Generate a human-readable transcript from Chat messages.
@@ -101,9 +163,16 @@ def _input_column_name(name, colliding_keys):
 
 
 def prepare_annotation(item, colliding_keys=None):
-    record = {}
     if colliding_keys is None:
         colliding_keys = _colliding_keys(item)
+    return _join_annotation_parts(_prepare_annotation_parts(item), colliding_keys)
+
+
+def _prepare_annotation_parts(item):
+    """CSV record of an item split in annotation columns, task.data columns by key and metadata columns,
+    task.data columns are named once the colliding keys are known, see _join_annotation_parts
+    """
+    record = {}
     if item.get("id") is not None:
         record["id"] = item["id"]
 
@@ -123,26 +192,35 @@ def prepare_annotation(item, colliding_keys=None):
         ):
             record[f"{name}_transcript"] = generate_chat_transcript(pretty_value)
 
+    data = {}
     for name, value in item["input"].items():
-        column_name = _input_column_name(name, colliding_keys)
         if isinstance(value, dict) or isinstance(value, list):
             # flat dicts and arrays from task.data to json strings
-            record[column_name] = json.dumps(value, ensure_ascii=False)
+            data[name] = json.dumps(value, ensure_ascii=False)
         else:
-            record[column_name] = value
+            data[name] = value
 
-    record["annotator"] = get_annotator(item)
-    record["annotation_id"] = item["annotation_id"]
-    record["created_at"] = item["created_at"]
-    record["updated_at"] = item["updated_at"]
-    record["lead_time"] = item["lead_time"]
+    metadata = {}
+    metadata["annotator"] = get_annotator(item)
+    metadata["annotation_id"] = item["annotation_id"]
+    metadata["created_at"] = item["created_at"]
+    metadata["updated_at"] = item["updated_at"]
+    metadata["lead_time"] = item["lead_time"]
 
     if "agreement" in item:
-        record["agreement"] = item["agreement"]
+        metadata["agreement"] = item["agreement"]
 
     if "history" in item and item["history"]:
-        record["history"] = json.dumps(item["history"], ensure_ascii=False)
+        metadata["history"] = json.dumps(item["history"], ensure_ascii=False)
+
+    return record, data, metadata
+
 
+def _join_annotation_parts(parts, colliding_keys):
+    record, data, metadata = parts
+    for name, value in data.items():
+        record[_input_column_name(name, colliding_keys)] = value
+    record.update(metadata)
     return record
 
 
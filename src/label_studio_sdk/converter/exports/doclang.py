@@ -40,6 +40,7 @@ import os
 import posixpath
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
 from typing import Iterable, Iterator, Mapping, NamedTuple, Optional
@@ -49,7 +50,7 @@ import ijson
 from doclang import pack
 from lxml import etree
 
-from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_local_path
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_download_session, get_local_path
 from label_studio_sdk.converter.utils import download, ensure_dir, get_json_root_type
 
 logger = logging.getLogger(__name__)
@@ -59,6 +60,8 @@ _ASSET_EXTS = _IMAGE_EXTS | {".svg"}
 _DOCLANG_NAMESPACE_PREFIX = "https://www.doclang.ai/ns/"
 _MAX_VALUE_DEPTH = 32
 _MAX_VALUE_NODES = 10_000
+# concurrent page image downloads of one task, through the shared download session
+_PAGE_DOWNLOAD_WORKERS = 8
 
 # These built-in result types have well-defined non-document payloads. Custom
 # Interfaces that use a custom type fall through to content-based detection.
@@ -343,6 +346,7 @@ def _fetch_page_image(
     hostname: Optional[str],
     access_token: Optional[str],
     task_id: Optional[int],
+    session=None,
 ) -> Optional[str]:
     data_url_path = _write_data_url_page(url, destination_dir, page_number)
     if data_url_path is not None:
@@ -358,6 +362,7 @@ def _fetch_page_image(
             access_token=access_token,
             download_resources=True,
             task_id=task_id,
+            session=session,
         )
         if not local_path or not os.path.exists(local_path):
             logger.warning("Downloaded image not found on disk for %s", url)
@@ -385,18 +390,42 @@ def _fetch_page_images(
     access_token: Optional[str],
     task_id: Optional[int],
 ) -> dict[int, str]:
-    pages: dict[int, str] = {}
+    # pages with the same URL share one cached download and are fetched one after the other,
+    # different URLs are fetched concurrently
+    page_numbers_by_url: dict[str, list[int]] = {}
     for page_number, url in enumerate(urls, start=1):
-        page_path = _fetch_page_image(
-            url,
-            destination_dir,
-            page_number,
-            project_dir,
-            upload_dir,
-            hostname,
-            access_token,
-            task_id,
-        )
+        page_numbers_by_url.setdefault(url, []).append(page_number)
+
+    session = get_download_session()
+
+    def fetch(url: str, page_numbers: list[int]) -> list[tuple[int, Optional[str]]]:
+        return [
+            (
+                page_number,
+                _fetch_page_image(
+                    url,
+                    destination_dir,
+                    page_number,
+                    project_dir,
+                    upload_dir,
+                    hostname,
+                    access_token,
+                    task_id,
+                    session=session,
+                ),
+            )
+            for page_number in page_numbers
+        ]
+
+    workers = min(_PAGE_DOWNLOAD_WORKERS, len(page_numbers_by_url))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="doclang-page") as pool:
+            fetched = list(pool.map(fetch, page_numbers_by_url.keys(), page_numbers_by_url.values()))
+    else:
+        fetched = [fetch(url, page_numbers) for url, page_numbers in page_numbers_by_url.items()]
+
+    pages: dict[int, str] = {}
+    for page_number, page_path in sorted(pair for pairs in fetched for pair in pairs):
         if page_path:
             pages[page_number] = page_path
     return pages
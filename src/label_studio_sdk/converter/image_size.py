@@ -0,0 +1,227 @@
+import logging
+import os
+import struct
+import threading
+
+import ujson as json
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# sizes of segments skipped while looking for the JPEG frame header (EXIF, ICC profiles, ...)
+_JPEG_MAX_HEADER = 1 << 20
+# JPEG start-of-frame markers, C4 (DHT), C8 (JPG) and CC (DAC) are not frames
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# number of bands of the image Pillow opens for a PNG color type
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# TIFF tags
+_TIFF_WIDTH, _TIFF_HEIGHT, _TIFF_PHOTOMETRIC, _TIFF_SAMPLES_PER_PIXEL, _TIFF_EXTRA_SAMPLES = 256, 257, 262, 277, 338
+# images kept in a persistent ImageSizeCache, the least recently measured are dropped first
+DEFAULT_IMAGE_SIZE_CACHE_ENTRIES = 100_000
+
+
+def read_image_header(image_path):
+    """Width, height and number of channels (bands of the Pillow image) of a JPEG, PNG, WebP or TIFF file
+    read from its header bytes only, None if the format is not recognized or the header is unusual
+    """
+    with open(image_path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return _png_header(head)
+        if head.startswith(b"\xff\xd8"):
+            return _jpeg_header(f)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _webp_header(head)
+        if head[:4] in (b"II*\x00", b"MM\x00*"):
+            return _tiff_header(f, head)
+    return None
+
+
+def _png_header(head):
+    if head[12:16] != b"IHDR" or len(head) < 26:
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    channels = _PNG_CHANNELS.get(head[25])
+    return (width, height, channels) if channels else None
+
+
+def _jpeg_header(f):
+    f.seek(2)
+    while f.tell() < _JPEG_MAX_HEADER:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+        marker = marker[0]
+        # markers without a segment
+        if marker in (0x00, 0x01) or 0xD0 <= marker <= 0xD8:
+            continue
+        if marker == 0xD9:
+            return None
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        length = struct.unpack(">H", segment)[0]
+        if marker in _JPEG_SOF_MARKERS:
+            frame = f.read(6)
+            if len(frame) < 6:
+                return None
+            _, height, width, components = struct.unpack(">BHHB", frame)
+            if not width or not height or components not in (1, 3, 4):
+                return None
+            return width, height, components
+        f.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def _webp_header(head):
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        if head[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF, 3
+    if chunk == b"VP8L":
+        if head[20] != 0x2F:
+            return None
+        bits = struct.unpack("<I", head[21:25])[0]
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        return width, height, 4 if bits >> 28 & 1 else 3
+    if chunk == b"VP8X":
+        flags = head[20]
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return width, height, 4 if flags & 0x10 else 3
+    return None
+
+
+def _tiff_header(f, head):
+    order = "<" if head[:2] == b"II" else ">"
+    f.seek(struct.unpack(order + "I", head[4:8])[0])
+    count = f.read(2)
+    if len(count) < 2:
+        return None
+    count = struct.unpack(order + "H", count)[0]
+    entries = f.read(12 * count)
+    if len(entries) < 12 * count:
+        return None
+    tags = {}
+    for i in range(count):
+        tag, type_, _ = struct.unpack(order + "HHI", entries[12 * i : 12 * i + 8])
+        # SHORT or LONG values stored inline
+        if type_ == 3:
+            tags[tag] = struct.unpack(order + "H", entries[12 * i + 8 : 12 * i + 10])[0]
+        elif type_ == 4:
+            tags[tag] = struct.unpack(order + "I", entries[12 * i + 8 : 12 * i + 12])[0]
+    if _TIFF_EXTRA_SAMPLES in tags:
+        # alpha or other extra samples change the bands Pillow reports (e.g. 2 for a palette image with alpha)
+        return None
+    width, height = tags.get(_TIFF_WIDTH), tags.get(_TIFF_HEIGHT)
+    channels = 1 if tags.get(_TIFF_PHOTOMETRIC) == 3 else tags.get(_TIFF_SAMPLES_PER_PIXEL, 1)
+    if not width or not height or channels not in (1, 2, 3, 4):
+        return None
+    return width, height, channels
+
+
+def get_image_size_and_channels(image_path):
+    """Width, height and number of channels of an image, from its header when possible"""
+    size = read_image_header(image_path)
+    if size is not None:
+        return size
+
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        width, height = image.size
+        return width, height, len(image.getbands())
+
+
+class ImageSizeCache:
+    """Sizes of image files kept between exports, keyed by path and invalidated by file size and mtime
+
+    cache = ImageSizeCache("image_sizes.json")
+    width, height, channels = cache.get("images/1.jpg")  # reads the header once
+    cache.save()  # next exports of the same files don't touch them
+    """
+
+    def __init__(self, path=None, persistent=True, max_entries=DEFAULT_IMAGE_SIZE_CACHE_ENTRIES):
+        """
+        :param path: json file with the cached sizes, by default image_sizes.json in the SDK cache dir
+        :param persistent: False keeps the sizes in memory only
+        :param max_entries: images kept in the cache file, files that no longer exist are dropped on save
+        """
+        self.path = path
+        self.persistent = persistent
+        self.max_entries = max_entries
+        self._sizes = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def get(self, image_path):
+        """(width, height, channels) of image_path, raises if it can't be read as an image"""
+        image_path = os.path.abspath(image_path)
+        stat = os.stat(image_path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        sizes = self._load()
+        cached = sizes.get(image_path)
+        if cached is not None and cached[:2] == key:
+            return tuple(cached[2:])
+
+        size = get_image_size_and_channels(image_path)
+        with self._lock:
+            # the most recently measured images are kept when the cache is trimmed
+            sizes.pop(image_path, None)
+            sizes[image_path] = key + list(size)
+            self._changed = True
+        return size
+
+    def save(self):
+        """Write the cache file if new sizes were measured, without deleted images and up to max_entries"""
+        if not self.persistent or not self._changed:
+            return
+        path = self._path()
+        with self._lock:
+            kept = [(image_path, size) for image_path, size in self._sizes.items() if os.path.exists(image_path)]
+            self._sizes.clear()
+            self._sizes.update(kept[-self.max_entries :] if self.max_entries else [])
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(self._sizes, f)
+                os.replace(tmp_path, path)
+                self._changed = False
+            except OSError:
+                logger.warning(f"Can't save image size cache to {path}", exc_info=True)
+
+    def _path(self):
+        return self.path or os.path.join(get_cache_dir(), "image_sizes.json")
+
+    def _load(self):
+        if self._sizes is None:
+            sizes = {}
+            if self.persistent:
+                try:
+                    with open(self._path()) as f:
+                        sizes = json.load(f)
+                except (OSError, ValueError):
+                    pass
+            with self._lock:
+                if self._sizes is None:
+                    self._sizes = sizes
+        return self._sizes
+
+    def __getstate__(self):
+        # sent to worker processes without the lock and the sizes, workers read the cache file themselves
+        return {"path": self.path, "persistent": self.persistent, "max_entries": self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
@@ -0,0 +1,282 @@
+import hashlib
+import itertools
+import logging
+import os
+import sqlite3
+
+import ujson as json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".export_manifest.sqlite3"
+# bump when exported files or cached task data change, manifests of other versions are rebuilt from scratch
+MANIFEST_VERSION = 1
+
+
+class CategoryLookups(dict):
+    """Category name -> id mapping of an export that records the names looked up with `in`
+
+    Exporters register a category the first time `name not in category_name_to_id`, so the recorded names,
+    replayed in the same order with `register`, give the same ids without converting the task again.
+    """
+
+    recorded = None
+
+    def __contains__(self, name):
+        if self.recorded is not None:
+            self.recorded.append(name)
+        return super().__contains__(name)
+
+    def register(self, names, categories):
+        for name in names:
+            if not super().__contains__(name):
+                self[name] = len(categories)
+                categories.append({"id": self[name], "name": name})
+
+
+class ExportManifest:
+    """Manifest of an incremental export in its output dir: for every task the fingerprint of its items,
+    the files written for it and the data needed to rebuild aggregate files (COCO json, classes.txt) without it
+
+    with ExportManifest(output_dir, settings={"format": "YOLO", ...}) as manifest:
+        for item, prepared in manifest.changed_items(item_iterator, tasks):
+            ...  # convert only the items of new and changed tasks
+    # on exit files of deleted tasks are removed and the manifest is saved, or discarded if the export failed
+    """
+
+    def __init__(self, output_dir, settings):
+        """
+        :param output_dir: export output dir, the manifest is stored there
+        :param settings: json serializable export settings, a manifest written with other settings is discarded
+        """
+        self.output_dir = os.path.abspath(output_dir)
+        self.path = os.path.join(output_dir, MANIFEST_FILENAME)
+        self.converted = 0
+        self.skipped = 0
+        self._stale_files = set()
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY, fingerprint TEXT, files TEXT, data TEXT, run INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS files (path TEXT, task_id TEXT);
+            CREATE INDEX IF NOT EXISTS files_path ON files (path);
+            CREATE INDEX IF NOT EXISTS files_task_id ON files (task_id);
+            """
+        )
+        settings = json.dumps({"version": MANIFEST_VERSION, "settings": settings}, sort_keys=True)
+        if self._meta("settings") != settings:
+            if self._meta("settings") is not None:
+                logger.info(f"Export settings changed, {self.path} is rebuilt")
+            self._stale_files.update(path for path, in self._db.execute("SELECT path FROM files"))
+            self._db.execute("DELETE FROM tasks")
+            self._db.execute("DELETE FROM files")
+            self._set_meta("settings", settings)
+        self.run = int(self._meta("run") or 0) + 1
+        self._set_meta("run", str(self.run))
+
+    def changed_items(self, pairs, tasks):
+        """(item, prepared) pairs of the tasks that changed since the last export, the pairs of one task in a row
+
+        Unchanged tasks are replayed with `tasks.replay(data)` instead, it returns False if the task
+        must be converted again anyway. Before the pairs of a task are yielded `tasks.begin()` is called,
+        after they are converted `tasks.collect(pairs)` returns (files, data) to keep for the task.
+        """
+        for task_id, group in itertools.groupby(pairs, key=lambda pair: pair[0]["id"]):
+            group = list(group)
+            task_id = str(task_id)
+            fingerprint = self.fingerprint(group)
+            row = self._db.execute(
+                "SELECT fingerprint, files, data FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            if row is not None and row[0] == fingerprint:
+                files = json.loads(row[1])
+                exist = all(os.path.exists(os.path.join(self.output_dir, path)) for path in files)
+                if exist and tasks.replay(json.loads(row[2])):
+                    self._db.execute("UPDATE tasks SET run = ? WHERE task_id = ?", (self.run, task_id))
+                    self.skipped += 1
+                    continue
+
+            tasks.begin()
+            yield from group
+            files, data = tasks.collect(group)
+            self._put(task_id, fingerprint, files, data)
+            self.converted += 1
+
+    @staticmethod
+    def fingerprint(values):
+        digest = hashlib.md5(usedforsecurity=False)
+        for value in values:
+            digest.update(json.dumps(value, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def close(self):
+        """Forget the tasks missing in this export, remove files nothing refers to anymore and save the manifest"""
+        try:
+            removed = self._db.execute("SELECT task_id FROM tasks WHERE run != ?", (self.run,)).fetchall()
+            for (task_id,) in removed:
+                self._forget(task_id)
+            self._db.execute("DELETE FROM tasks WHERE run != ?", (self.run,))
+            for path in self._stale_files:
+                if self._db.execute("SELECT 1 FROM files WHERE path = ? LIMIT 1", (path,)).fetchone() is None:
+                    path = os.path.join(self.output_dir, path)
+                    if os.path.exists(path):
+                        logger.debug(f"Remove {path}, its task was changed or deleted")
+                        os.remove(path)
+            self._stale_files.clear()
+            self._db.commit()
+        finally:
+            # closing without the commit rolls the changes back
+            self._db.close()
+        logger.info(
+            f"Incremental export: {self.converted} tasks converted, {self.skipped} unchanged, {len(removed)} removed"
+        )
+
+    def abort(self):
+        """Discard the changes of a failed export and close the manifest, the next export starts from the last one"""
+        self._db.rollback()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _put(self, task_id, fingerprint, files, data):
+        self._forget(task_id)
+        # relative to the output dir, so the export can be moved
+        files = sorted({os.path.relpath(os.path.abspath(path), self.output_dir) for path in files})
+        self._db.execute(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?)",
+            (task_id, fingerprint, json.dumps(files), json.dumps(data), self.run),
+        )
+        self._db.executemany("INSERT INTO files VALUES (?, ?)", [(path, task_id) for path in files])
+
+    def _forget(self, task_id):
+        self._stale_files.update(
+            path for path, in self._db.execute("SELECT path FROM files WHERE task_id = ?", (task_id,))
+        )
+        self._db.execute("DELETE FROM files WHERE task_id = ?", (task_id,))
+
+    def _meta(self, key):
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+
+def _files_inside(paths, directory):
+    directory = os.path.abspath(directory) + os.sep
+    return [path for path in paths if os.path.abspath(path).startswith(directory) and os.path.exists(path)]
+
+
+class YOLOTasks:
+    """Tasks of a YOLO export for `ExportManifest.changed_items`: a task keeps its label files,
+    downloaded images and the categories it used, replaying it registers them again
+    """
+
+    def __init__(self, categories, category_name_to_id, output_dir, output_image_dir, output_label_dir, label_path):
+        """
+        :param categories: categories of the export, new ones are appended
+        :param category_name_to_id: CategoryLookups of the export
+        :param label_path: function (item, image_path) -> label file path of the item
+        """
+        self.categories = categories
+        self.category_name_to_id = category_name_to_id
+        self.output_dir = output_dir
+        self.output_image_dir = output_image_dir
+        self.output_label_dir = output_label_dir
+        self.label_path = label_path
+
+    def begin(self):
+        self.category_name_to_id.recorded = []
+
+    def collect(self, pairs):
+        names = list(dict.fromkeys(self.category_name_to_id.recorded))
+        self.category_name_to_id.recorded = None
+        images, labels = [], []
+        for item, image_path in pairs:
+            if image_path:
+                images.append(os.path.join(self.output_dir, image_path))
+                labels.append(self.label_path(item, image_path))
+        files = _files_inside(images, self.output_image_dir) + _files_inside(labels, self.output_label_dir)
+        # label files refer to categories by id, they are reused only while the ids stay the same
+        classes = [[name, self.category_name_to_id[name]] for name in names if name in self.category_name_to_id]
+        return files, {"names": names, "classes": classes}
+
+    def replay(self, data):
+        self.category_name_to_id.register(data["names"], self.categories)
+        return all(self.category_name_to_id.get(name) == category_id for name, category_id in data["classes"])
+
+
+class COCOTasks:
+    """Tasks of a COCO export for `ExportManifest.changed_items`: a task keeps its downloaded images and
+    the images and annotations it added to the COCOWriter, replaying it adds them again with new ids
+    """
+
+    def __init__(self, writer, categories, category_name_to_id, output_dir, output_image_dir):
+        """
+        :param writer: COCOWriter of the export
+        :param categories: categories of the export, new ones are appended
+        :param category_name_to_id: CategoryLookups of the export
+        """
+        self.writer = writer
+        self.categories = categories
+        self.category_name_to_id = category_name_to_id
+        self.output_dir = output_dir
+        self.output_image_dir = output_image_dir
+        self._first_image = 0
+        self._first_annotation = 0
+
+    def begin(self):
+        self.category_name_to_id.recorded = []
+        self.writer.recorded = []
+        self._first_image = self.writer.num_images
+        self._first_annotation = self.writer.num_annotations
+
+    def collect(self, pairs):
+        names = list(dict.fromkeys(self.category_name_to_id.recorded))
+        records = self.writer.recorded
+        self.category_name_to_id.recorded = None
+        self.writer.recorded = None
+        # ids are stored relative to the task, categories by name
+        category_names = {category["id"]: category["name"] for category in self.categories}
+        used_categories = {}
+        for kind, value in records:
+            if kind == "image":
+                value["id"] -= self._first_image
+            else:
+                value["id"] -= self._first_annotation
+                value["image_id"] -= self._first_image
+                if value["category_id"] in category_names:
+                    used_categories[value["category_id"]] = category_names[value["category_id"]]
+        images = [os.path.join(self.output_dir, image_path) for _, (image_path, _) in pairs]
+        data = {"names": names, "categories": list(used_categories.items()), "records": records}
+        return _files_inside(images, self.output_image_dir), data
+
+    def replay(self, data):
+        self.category_name_to_id.register(data["names"], self.categories)
+        category_ids = {
+            category_id: self.category_name_to_id.get(name, category_id) for category_id, name in data["categories"]
+        }
+        first_image, first_annotation = self.writer.num_images, self.writer.num_annotations
+        for kind, value in data["records"]:
+            if kind == "image":
+                self.writer.add_image(dict(value, id=value["id"] + first_image))
+            else:
+                self.writer.add_annotation(
+                    dict(
+                        value,
+                        id=value["id"] + first_annotation,
+                        image_id=value["image_id"] + first_image,
+                        category_id=category_ids.get(value["category_id"], value["category_id"]),
+                    )
+                )
+        return True
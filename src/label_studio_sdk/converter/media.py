@@ -0,0 +1,76 @@
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import (
+    create_download_session,
+    get_local_path,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MediaDownloader:
+    """Download media files of an export ahead of time in a bounded thread pool
+
+    Every URL is resolved once with `get_local_path` through a pooled requests session with retries,
+    later requests for the same URL get the same result (or the same error) while it is one of the `max_urls`
+    most recently submitted ones. Older URLs are forgotten to keep memory bounded on large exports,
+    submitting them again calls `get_local_path` again, which finds the file in its cache.
+
+    with MediaDownloader(max_workers=8, cache_dir="images", hostname=..., access_token=...) as downloader:
+        for url, task_id in media:
+            downloader.submit(url, task_id)  # starts downloading in the background
+        ...
+        path = downloader.get_local_path(url, task_id)  # waits for that download only
+    """
+
+    def __init__(self, max_workers=8, fetch=get_local_path, max_urls=None, **local_path_kwargs):
+        """
+        :param max_workers: number of concurrent downloads
+        :param fetch: function downloading one file, called like `get_local_path` with url, task_id and session
+        :param max_urls: number of recently submitted URLs whose results are kept, 4 * max_workers by default;
+                         it must cover the URLs submitted ahead and not read yet
+        :param local_path_kwargs: arguments of `fetch` shared by all downloads
+                                  (cache_dir, project_dir, hostname, image_dir, access_token, download_resources)
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="media-download")
+        self._session = create_download_session(pool_size=max_workers)
+        self._fetch = fetch
+        self._local_path_kwargs = local_path_kwargs
+        self._max_urls = max_urls or 4 * max_workers
+        self._futures = OrderedDict()
+
+    def submit(self, url, task_id=None):
+        """Start downloading url unless it is already queued, return the future of its local path"""
+        future = self._futures.get(url)
+        if future is not None:
+            self._futures.move_to_end(url)
+        else:
+            logger.debug(f"Queue media download: {url}")
+            future = self._pool.submit(
+                self._fetch,
+                url=url,
+                task_id=task_id,
+                session=self._session,
+                **self._local_path_kwargs,
+            )
+            self._futures[url] = future
+            if len(self._futures) > self._max_urls:
+                # a forgotten download still runs to completion, only its result isn't shared anymore
+                self._futures.popitem(last=False)
+        return future
+
+    def get_local_path(self, url, task_id=None):
+        """Local path of url, downloaded now if it wasn't submitted before"""
+        return self.submit(url, task_id).result()
+
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,7 +1,7 @@
 import argparse
 import datetime
+import functools
 import hashlib
-import io
 import logging
 import math
 import os
@@ -11,18 +11,14 @@ import urllib
 import posixpath
 import wave
 from collections import defaultdict
-from copy import deepcopy
 from operator import itemgetter
 from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlsplit, urlunsplit
 
-import numpy as np
-import requests
-from PIL import Image
 from lxml import etree
-from nltk.tokenize.treebank import TreebankWordTokenizer
 
 from label_studio_sdk._extensions.label_studio_tools.core.utils.params import get_env
 from label_studio_sdk._extensions.label_studio_tools.core.utils.io import safe_build_path
+from label_studio_sdk.converter.image_size import get_image_size_and_channels
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +30,7 @@ LOCAL_FILES_DOCUMENT_ROOT = get_env(
     "LOCAL_FILES_DOCUMENT_ROOT", default=os.path.abspath(os.sep)
 )
 
-TreebankWordTokenizer.PUNCTUATION = [
+_TREEBANK_PUNCTUATION = [
     (re.compile(r"([:,])([^\d])"), r" \1 \2"),
     (re.compile(r"([:,])$"), r" \1 "),
     (re.compile(r"\.\.\."), r" ... "),
@@ -48,6 +44,15 @@ TreebankWordTokenizer.PUNCTUATION = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_word_tokenizer():
+    # nltk takes a noticeable time to import, so it's loaded on the first tokenization only
+    from nltk.tokenize.treebank import TreebankWordTokenizer
+
+    TreebankWordTokenizer.PUNCTUATION = _TREEBANK_PUNCTUATION
+    return TreebankWordTokenizer()
+
+
 class ExpandFullPath(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
         setattr(namespace, self.dest, os.path.abspath(os.path.expanduser(values)))
@@ -68,7 +73,7 @@ def tokenize(text):
 def create_tokens_and_tags(text, spans):
     # tokens_and_idx = tokenize(text) # This function doesn't work properly if text contains multiple whitespaces...
     token_index_tuples = [
-        token for token in TreebankWordTokenizer().span_tokenize(text)
+        token for token in _get_word_tokenizer().span_tokenize(text)
     ]
     tokens_and_idx = [(text[start:end], start) for start, end in token_index_tuples]
     if spans and all(
@@ -195,6 +200,7 @@ def download(
     hostname=None,
     access_token=None,
     task_id=None,
+    session=None,
 ):
     """Download a resource into ``output_dir``.
 
@@ -206,10 +212,16 @@ def download(
     For cloud schemes (``s3://``, ``gs://``, ``azure-blob://``), when task context
     is provided, delegates to ``get_local_path`` (FIT-2611). Without task context,
     cloud URIs raise ``ValueError`` instead of a silent HTTP GET failure.
+
+    HTTP(S) resources are streamed to disk through ``session``, the shared download session by default.
     """
     from label_studio_sdk._extensions.label_studio_tools.core.utils.io import (
+        VERIFY_SSL,
+        _build_headers,
+        get_download_session,
         get_local_path,
         is_cloud_storage_uri,
+        save_response,
     )
 
     if is_cloud_storage_uri(url):
@@ -228,6 +240,7 @@ def download(
             download_resources=download_resources,
             access_token=access_token,
             task_id=task_id,
+            session=session,
         )
         ensure_dir(output_dir)
         if download_resources and local_path and os.path.exists(local_path):
@@ -288,24 +301,18 @@ def download(
     if not os.path.exists(filepath):
         logger.info("Download {url} to {filepath}".format(url=url, filepath=filepath))
         if download_resources:
-            r = requests.get(url)
+            http = session or get_download_session()
+            r = http.get(url, stream=True, headers=_build_headers(url, hostname, access_token), verify=VERIFY_SSL)
             r.raise_for_status()
-            with io.open(filepath, mode="wb") as fout:
-                fout.write(r.content)
+            with r:
+                save_response(r, filepath)
     if return_relative_path:
         return os.path.join(os.path.basename(output_dir), os.path.basename(filename))
     return filepath
 
 
 def get_image_size(image_path):
-    return Image.open(image_path).size
-
-
-def get_image_size_and_channels(image_path):
-    i = Image.open(image_path)
-    w, h = i.size
-    c = len(i.getbands())
-    return w, h, c
+    return get_image_size_and_channels(image_path)[:2]
 
 
 def get_audio_duration(audio_path):
@@ -420,6 +427,8 @@ def parse_config(config_string):
 def get_polygon_area(x, y):
     """https://en.wikipedia.org/wiki/Shoelace_formula"""
 
+    import numpy as np
+
     assert len(x) == len(y)
 
     return float(0.5 * np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1))))
@@ -479,7 +488,8 @@ def prettify_result(v):
     out = []
     tag_type = None
     for i in v:
-        j = deepcopy(i)
+        # a shallow copy is enough to drop the type
+        j = dict(i)
         tag_type = j.pop("type")
         if tag_type == "Choices" and len(j["choices"]) == 1:
             out.append(j["choices"][0])
@@ -602,6 +612,8 @@ def convert_yolo_obb_to_annotation(xyxyxyxy, original_width, original_height):
               - height: Height of the bounding box in percentage.
               - rotation: Rotation angle of the bounding box in degrees.
     """
+    import numpy as np
+
     # Reshape the coordinates into a 4x2 matrix
     coords = np.array(xyxyxyxy, dtype=np.float64).reshape((4, 2))
 
@@ -3,8 +3,9 @@ import platform
 import typing
 
 import httpx
-from .http_client import AsyncHttpClient, HttpClient
+from .http_client_ext import AsyncHttpClientExt, HttpClientExt
 from .logging import LogConfig, Logger, create_logger
+from .request_coalescing import RequestCoalescer
 
 try:
     VERSION = importlib.metadata.version("label-studio-sdk")
@@ -32,8 +33,13 @@ class BaseClientWrapper:
         self._max_stream_reconnection_attempts = max_stream_reconnection_attempts
         self._headers = headers
         self._logger = create_logger(logging)
+        # "model" builds response models, "raw" hands back the decoded JSON (see ResponseModeRequestOptions)
+        self._response_mode = "model"
+        # shares in-flight GET responses between concurrent identical requests of the async client
+        self._request_coalescer: typing.Optional[RequestCoalescer] = None
 
-        # even in the async case, refreshing access token (when the existing one is expired) should be sync
+        # the async client refreshes an expired access token through async_get_headers,
+        # sync callers of get_headers (and the sync client) refresh it synchronously
         from ..tokens.client_ext import TokensClientExt
 
         self._tokens_client = TokensClientExt(base_url=base_url, api_key=api_key, client_wrapper=self)
@@ -50,6 +56,12 @@ class BaseClientWrapper:
     def get_max_stream_reconnection_attempts(self) -> typing.Optional[int]:
         return self._max_stream_reconnection_attempts
 
+    def get_response_mode(self) -> str:
+        return self._response_mode
+
+    def get_request_coalescer(self) -> typing.Optional[RequestCoalescer]:
+        return self._request_coalescer
+
     def get_base_url(self) -> str:
         return self._base_url
 
@@ -65,8 +77,8 @@ class BaseClientWrapper:
             if key.lower() == "x-api-key":
                 headers[key] = self._tokens_client.resolve_x_api_key_header_value(headers[key])
 
-    def get_headers(self) -> typing.Dict[str, str]:
-        headers: typing.Dict[str, str] = {
+    def _get_base_headers(self) -> typing.Dict[str, str]:
+        return {
             "User-Agent": f"label_studio_sdk/{VERSION}",
             "X-Fern-Language": "Python",
             "X-Fern-SDK-Name": "label-studio-sdk",
@@ -75,6 +87,9 @@ class BaseClientWrapper:
             "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
             **(self.get_custom_headers() or {}),
         }
+
+    def get_headers(self) -> typing.Dict[str, str]:
+        headers = self._get_base_headers()
         if self._uses_x_api_key():
             self._normalize_x_api_key_headers(headers)
             return headers
@@ -84,6 +99,20 @@ class BaseClientWrapper:
             headers["Authorization"] = f"Bearer {self._tokens_client.api_key}"
         return headers
 
+    async def async_get_headers(self) -> typing.Dict[str, str]:
+        """Same as get_headers, but refreshes an expired access token without blocking the event loop."""
+        headers = self._get_base_headers()
+        if self._uses_x_api_key():
+            for key in list(headers):
+                if key.lower() == "x-api-key":
+                    headers[key] = await self._tokens_client.async_resolve_x_api_key_header_value(headers[key])
+            return headers
+        if self._tokens_client._use_legacy_token:
+            headers["Authorization"] = f"Token {self._tokens_client.api_key}"
+        else:
+            headers["Authorization"] = f"Bearer {await self._tokens_client.async_api_key()}"
+        return headers
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
@@ -109,12 +138,13 @@ class SyncClientWrapper(BaseClientWrapper):
             max_stream_reconnection_attempts=max_stream_reconnection_attempts,
             logging=logging,
         )
-        self.httpx_client = HttpClient(
+        self.httpx_client = HttpClientExt(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
             base_max_retries=self.get_max_retries(),
+            base_response_mode=self.get_response_mode,
         )
 
 
@@ -142,10 +172,13 @@ class AsyncClientWrapper(BaseClientWrapper):
             max_stream_reconnection_attempts=max_stream_reconnection_attempts,
             logging=logging,
         )
-        self.httpx_client = AsyncHttpClient(
+        self.httpx_client = AsyncHttpClientExt(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
+            async_base_headers=self.async_get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
             base_max_retries=self.get_max_retries(),
+            base_response_mode=self.get_response_mode,
+            base_request_coalescer=self.get_request_coalescer,
         )
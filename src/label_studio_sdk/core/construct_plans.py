@@ -0,0 +1,560 @@
+"""
+Compiled `construct_type`.
+
+The generated `construct_type` (unchecked_base_model.py) reflects on the target type at every call: origins, args,
+forward refs and issubclass checks, and UncheckedBaseModel.construct walks the model fields for every instance.
+Here that reflection is done once per type and compiled into a closure ("plan") that only performs the
+value-dependent part of the coercion, with the same lenient semantics: values that can't be coerced are returned
+as is. The branches mirror the generated `construct_type` one to one, port generator changes to it here.
+
+unchecked_base_model.py hooks this module in with its last line, which rebinds its `construct_type` to the one
+below; tests/custom/test_construct_type.py checks the hook is in place.
+"""
+
+import datetime as dt
+import enum
+import inspect
+import threading
+import typing
+import uuid
+
+import pydantic
+import typing_extensions
+from .raw_response import RawJsonArray, RawJsonObject
+
+
+# Defined before the generated module is imported: unchecked_base_model.py imports it from here
+# at the end of its own import, whichever of the two modules is imported first
+def construct_type(
+    *,
+    type_: typing.Type[typing.Any],
+    object_: typing.Any,
+    host: typing.Optional[typing.Type[typing.Any]] = None,
+) -> typing.Any:
+    """
+    Coerce object_ to type_ (recursively) like the generated `construct_type`, through the compiled plan of type_.
+    """
+    # Short circuit when dealing with optionals, don't try to coerces None to a type
+    if object_ is None:
+        return None
+
+    # Responses read in the "raw" response mode are handed back as decoded JSON
+    if type(object_) is RawJsonObject or type(object_) is RawJsonArray:
+        return object_
+
+    return _get_construct_plan(type_, host)(object_)
+
+
+from .pydantic_utilities import (  # noqa: E402  # type: ignore[attr-defined]
+    IS_PYDANTIC_V2,
+    get_args,
+    get_origin,
+    is_literal_type,
+    is_union,
+    parse_date,
+    parse_datetime,
+    parse_obj_as,
+)
+from .serialization import get_field_to_alias_mapping  # noqa: E402
+from .unchecked_base_model import (  # noqa: E402
+    Model,
+    PydanticField,
+    UncheckedBaseModel,
+    _convert_undiscriminated_union_type,
+    _convert_union_type,
+    _get_field_default,
+    _get_is_populate_by_name,
+    _get_literal_field_value,
+    _get_model_fields,
+    _maybe_resolve_forward_ref,
+)
+from pydantic_core import PydanticUndefined  # noqa: E402
+
+
+ConstructPlan = typing.Callable[[typing.Any], typing.Any]
+
+# Compiled construction plans keyed by (type_, host), see `_compile_construct_plan`
+_construct_plan_cache: typing.Dict[typing.Tuple[typing.Any, typing.Any], ConstructPlan] = {}
+# Plans are compiled by one thread at a time, so the in-progress keys are always the compiling thread's own;
+# another thread asking for a plan waits for it instead of deferring to a plan that isn't in the cache yet
+_construct_plan_lock = threading.RLock()
+_construct_plans_in_progress: typing.Set[typing.Tuple[typing.Any, typing.Any]] = set()
+
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+def _get_construct_plan(type_: typing.Any, host: typing.Optional[typing.Type[typing.Any]] = None) -> ConstructPlan:
+    key = (type_, host)
+    try:
+        plan = _construct_plan_cache.get(key)
+    except TypeError:
+        # Unhashable type; compile without caching.
+        return _compile_construct_plan(type_, host)
+    if plan is not None:
+        return plan
+    with _construct_plan_lock:
+        plan = _construct_plan_cache.get(key)
+        if plan is not None:
+            return plan
+        if key in _construct_plans_in_progress:
+            # Recursive type alias: defer to the plan this thread is compiling right now
+            return lambda object_: _get_construct_plan(type_, host)(object_)
+        _construct_plans_in_progress.add(key)
+        try:
+            plan = _compile_construct_plan(type_, host)
+        finally:
+            _construct_plans_in_progress.discard(key)
+        _construct_plan_cache[key] = plan
+    return plan
+
+
+def _get_resolved_construct_plan(type_: typing.Any, host: typing.Optional[typing.Type[typing.Any]]) -> ConstructPlan:
+    resolved = _maybe_resolve_forward_ref(type_, host)
+    if isinstance(resolved, typing.ForwardRef):
+        # Not resolvable yet, so keep resolving on every call like the reflective implementation did
+        return lambda object_: construct_type(object_=object_, type_=_maybe_resolve_forward_ref(type_, host), host=host)
+    return _get_construct_plan(resolved, host)
+
+
+def _is_model_class(type_: typing.Any) -> bool:
+    return inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel)
+
+
+def _compile_construct_plan(type_: typing.Any, host: typing.Optional[typing.Type[typing.Any]]) -> ConstructPlan:
+    """
+    Compile `construct_type` for a given type into a closure. The branches mirror `construct_type` one to one,
+    the closures keep its lenient semantics: values that can't be coerced are returned as is.
+    """
+    base_type = get_origin(type_) or type_
+    is_annotated = base_type == typing_extensions.Annotated  # type: ignore[comparison-overlap]
+    maybe_annotation_members = get_args(type_)
+    is_annotated_union = is_annotated and is_union(get_origin(maybe_annotation_members[0]))
+
+    if base_type == typing.Any:  # type: ignore[comparison-overlap]
+        return _identity
+
+    if base_type == dict:
+        type_args = get_args(type_)
+        if not type_args:
+            return _identity
+        key_type, items_type = type_args
+        key_plan = _get_resolved_construct_plan(key_type, host)
+        items_plan = _get_resolved_construct_plan(items_type, host)
+
+        if key_plan is _identity and items_plan is _identity:
+
+            def _construct_dict_copy(object_: typing.Any) -> typing.Any:
+                if not isinstance(object_, typing.Mapping):
+                    return object_
+                return dict(object_.items())
+
+            return _construct_dict_copy
+
+        def _construct_dict(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, typing.Mapping):
+                return object_
+            return {key_plan(key): items_plan(item) for key, item in object_.items()}
+
+        return _construct_dict
+
+    if base_type == list:
+        type_args = get_args(type_)
+        if not type_args:
+            return _identity
+        list_item_plan = _get_resolved_construct_plan(type_args[0], host)
+
+        if list_item_plan is _identity:
+
+            def _construct_list_copy(object_: typing.Any) -> typing.Any:
+                if not isinstance(object_, list):
+                    return object_
+                return list(object_)
+
+            return _construct_list_copy
+
+        def _construct_list(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, list):
+                return object_
+            return [list_item_plan(entry) for entry in object_]
+
+        return _construct_list
+
+    if base_type == set:
+        type_args = get_args(type_)
+        if not type_args:
+            return _identity
+        set_item_plan = _get_resolved_construct_plan(type_args[0], host)
+
+        def _construct_set(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, set) and not isinstance(object_, list):
+                return object_
+            return {set_item_plan(entry) for entry in object_}
+
+        return _construct_set
+
+    if is_union(base_type) or is_annotated_union:
+        if is_annotated_union:
+            # Discriminated unions are rare and depend on the value, so they stay on the reflective path
+            def _construct_annotated_union(object_: typing.Any) -> typing.Any:
+                if object_ is None:
+                    return None
+                return _convert_union_type(type_, object_, host)
+
+            return _construct_annotated_union
+        return _compile_undiscriminated_union_plan(type_, host)
+
+    # Cannot do an `issubclass` with a literal type, let's also just confirm we have a class before this call
+    if not is_literal_type(type_) and (
+        _is_model_class(base_type) or (is_annotated and _is_model_class(maybe_annotation_members[0]))
+    ):
+
+        model = base_type if _is_model_class(base_type) else maybe_annotation_members[0]
+        if _has_generated_construct(model):
+
+            def _construct_unchecked_model(object_: typing.Any) -> typing.Any:
+                if object_ is None:
+                    return None
+                return _get_model_construct_plan(model)(object_, None)
+
+            return _construct_unchecked_model
+
+        def _construct_model(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            if IS_PYDANTIC_V2:
+                return type_.model_construct(**object_)
+            else:
+                return type_.construct(**object_)
+
+        return _construct_model
+
+    if base_type == dt.datetime:
+
+        def _construct_datetime(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                return parse_datetime(object_)
+            except Exception:
+                return object_
+
+        return _construct_datetime
+
+    if base_type == dt.date:
+
+        def _construct_date(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                return parse_date(object_)
+            except Exception:
+                return object_
+
+        return _construct_date
+
+    if base_type == uuid.UUID:
+
+        def _construct_uuid(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                return uuid.UUID(object_)
+            except Exception:
+                return object_
+
+        return _construct_uuid
+
+    if base_type == int:
+
+        def _construct_int(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                return int(object_)
+            except Exception:
+                return object_
+
+        return _construct_int
+
+    if base_type == bool:
+
+        def _construct_bool(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                if isinstance(object_, str):
+                    stringified_object = object_.lower()
+                    return stringified_object == "true" or stringified_object == "1"
+
+                return bool(object_)
+            except Exception:
+                return object_
+
+        return _construct_bool
+
+    if inspect.isclass(base_type) and issubclass(base_type, enum.Enum):
+
+        def _construct_enum(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            try:
+                return base_type(object_)
+            except (ValueError, KeyError):
+                return object_
+
+        return _construct_enum
+
+    return _identity
+
+
+def _get_literal_fields(model: typing.Type[typing.Any]) -> typing.List[typing.Tuple[str, typing.Any, typing.Any]]:
+    """(field name, field, declared default) of every Literal-typed field of *model*."""
+    literal_fields = []
+    for field_name, field in _get_model_fields(model).items():
+        if IS_PYDANTIC_V2:
+            field_type = field.annotation  # type: ignore # Pydantic v2
+        else:
+            field_type = field.outer_type_  # type: ignore # Pydantic v1
+        if is_literal_type(field_type):  # type: ignore[arg-type]
+            literal_fields.append((field_name, field, _get_field_default(field)))
+    return literal_fields
+
+
+def _compile_undiscriminated_union_plan(
+    union_type: typing.Any, host: typing.Optional[typing.Type[typing.Any]]
+) -> ConstructPlan:
+    """Compiled counterpart of `_convert_undiscriminated_union_type`, the passes are kept in the same order."""
+    inner_types = get_args(union_type)
+    if typing.Any in inner_types:
+        return _identity
+
+    # (inner type, its plan, whether it's a model, its Literal fields, the model of List[Model] members)
+    members = []
+    for inner_type in inner_types:
+        list_model = None
+        if get_origin(inner_type) is list:
+            list_args = get_args(inner_type)
+            if not list_args:
+                return _reflective_union_plan(union_type, host)
+            list_inner_type = _maybe_resolve_forward_ref(list_args[0], host)
+            if isinstance(list_inner_type, typing.ForwardRef):
+                return _reflective_union_plan(union_type, host)
+            if _is_model_class(list_inner_type):
+                list_model = list_inner_type
+        is_model = _is_model_class(inner_type)
+        literal_fields = _get_literal_fields(inner_type) if is_model else []
+        members.append((inner_type, _get_construct_plan(inner_type, host), is_model, literal_fields, list_model))
+
+    has_literal_discriminant = any(literal_fields for _, _, _, literal_fields, _ in members)
+
+    if not any(is_model or list_model is not None for _, _, is_model, _, list_model in members):
+        # No pydantic models involved (e.g. Optional[int]): only the last pass of the union conversion applies
+        member_plans = [plan for _, plan, _, _, _ in members]
+
+        def _construct_simple_union(object_: typing.Any) -> typing.Any:
+            if object_ is None:
+                return None
+            for member_plan in member_plans:
+                try:
+                    return member_plan(object_)
+                except Exception:
+                    continue
+            return None
+
+        return _construct_simple_union
+
+    def _literal_fields_match(
+        inner_type: typing.Any, literal_fields: typing.List[typing.Tuple[str, typing.Any, typing.Any]], object_: typing.Any, strict: bool
+    ) -> bool:
+        for field_name, field, field_default in literal_fields:
+            object_value = _get_literal_field_value(inner_type, field_name, field, object_)
+            if (strict or object_value is not None) and field_default != object_value:
+                return False
+        return True
+
+    def _construct_union(object_: typing.Any) -> typing.Any:
+        if object_ is None:
+            return None
+
+        for inner_type, _, is_model, literal_fields, list_model in members:
+            # Handle lists of objects that need parsing
+            if list_model is not None and isinstance(object_, list):
+                try:
+                    parsed_list = _parse_model_list(object_, list_model)
+                    if parsed_list is not None:
+                        return parsed_list
+                except Exception:
+                    pass
+
+            if is_model:
+                try:
+                    if has_literal_discriminant and not _literal_fields_match(inner_type, literal_fields, object_, True):
+                        continue
+                    # Attempt a validated parse until one works
+                    return parse_obj_as(inner_type, object_)
+                except Exception:
+                    continue
+
+        # First pass: try types where all literal fields match the object's values.
+        for inner_type, inner_plan, is_model, literal_fields, _ in members:
+            if is_model:
+                if not _literal_fields_match(inner_type, literal_fields, object_, has_literal_discriminant):
+                    continue
+                try:
+                    return inner_plan(object_)
+                except Exception:
+                    continue
+
+        # Second pass: if no literal matches, return the first successful cast.
+        for inner_type, inner_plan, is_model, literal_fields, _ in members:
+            try:
+                if has_literal_discriminant and is_model:
+                    if not _literal_fields_match(inner_type, literal_fields, object_, True):
+                        continue
+                return inner_plan(object_)
+            except Exception:
+                continue
+        return None
+
+    return _construct_union
+
+
+def _reflective_union_plan(union_type: typing.Any, host: typing.Optional[typing.Type[typing.Any]]) -> ConstructPlan:
+    def _construct_union(object_: typing.Any) -> typing.Any:
+        if object_ is None:
+            return None
+        return _convert_undiscriminated_union_type(union_type, object_, host)
+
+    return _construct_union
+
+
+def _parse_model_list(collection: typing.List[typing.Any], model: typing.Type[typing.Any]) -> typing.Optional[typing.List[typing.Any]]:
+    """
+    Validated parse of every item, or None if an item is neither a dict nor a *model* instance.
+    Same outcome as `_validate_collection_items_compatible` followed by parsing each item, with a single parse.
+    """
+    parsed = []
+    for item in collection:
+        if not isinstance(item, dict) and not isinstance(item, model):
+            return None
+        parsed.append(parse_obj_as(object_=item, type_=model))
+    return parsed
+
+
+ModelConstructPlan = typing.Callable[[typing.Dict[str, typing.Any], typing.Optional[typing.Set[str]]], typing.Any]
+
+# Compiled UncheckedBaseModel.construct per model class, together with the fields mapping it was compiled from
+_model_construct_plan_cache: typing.Dict[type, typing.Tuple[typing.Any, ModelConstructPlan]] = {}
+
+# Defaults of these types are returned as is by `_get_field_default`, so they can be computed once
+_IMMUTABLE_DEFAULT_TYPES = (str, int, float, bool, bytes, enum.Enum)
+
+
+def _has_generated_construct(model: typing.Type[typing.Any]) -> bool:
+    # the compiled plan stands in for UncheckedBaseModel.construct, models overriding it keep their own
+    return (
+        issubclass(model, UncheckedBaseModel)
+        and model.construct.__func__ is UncheckedBaseModel.construct.__func__  # type: ignore[attr-defined]
+        and model.model_construct.__func__ is UncheckedBaseModel.model_construct.__func__  # type: ignore[attr-defined]
+    )
+
+
+def _get_model_construct_plan(cls: typing.Type["Model"]) -> ModelConstructPlan:
+    fields = _get_model_fields(cls)
+    cached = _model_construct_plan_cache.get(cls)
+    # model_rebuild() replaces the fields mapping, in which case the plan has to be compiled again
+    if cached is not None and cached[0] is fields:
+        return cached[1]
+    plan = _compile_model_construct_plan(cls, fields)
+    _model_construct_plan_cache[cls] = (fields, plan)
+    return plan
+
+
+def _compile_model_construct_plan(
+    cls: typing.Type["Model"], fields: typing.Mapping[str, "PydanticField"]
+) -> ModelConstructPlan:
+    populate_by_name = _get_is_populate_by_name(cls)
+    field_aliases = get_field_to_alias_mapping(cls)
+
+    field_plans = []
+    for name, field in fields.items():
+        # Key here is only used to pull data from the values dict
+        # you should always use the NAME of the field to for field_values, etc.
+        # because that's how the object is constructed from a pydantic perspective
+        key = field.alias
+        if (key is None or field.alias == name) and name in field_aliases:
+            key = field_aliases[name]
+        if key is None:
+            key = name
+        # Added this to allow population by field name
+        fallback_to_name = populate_by_name and key != name
+
+        if IS_PYDANTIC_V2:
+            type_ = field.annotation  # type: ignore # Pydantic v2
+        else:
+            type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
+        value_plan = _get_construct_plan(type_, cls) if type_ is not None else _identity
+
+        # Mutable defaults and default factories must produce a fresh value for every instance
+        static_default = getattr(field, "default_factory", None) is None
+        default = _get_field_default(field) if static_default else None
+        if default is not None and not isinstance(default, _IMMUTABLE_DEFAULT_TYPES):
+            static_default = False
+        # If the default values are non-null act like they've been set
+        # This effectively allows exclude_unset to work like exclude_none where
+        # the latter passes through intentionally set none values.
+        default_is_set = static_default and default != None and default != PydanticUndefined
+
+        field_plans.append((name, key, fallback_to_name, value_plan, field, static_default, default, default_is_set))
+
+    known_keys = {field.alias for field in fields.values()} | set(field_aliases.values()) | set(fields)
+
+    def _construct(values: typing.Dict[str, typing.Any], _fields_set: typing.Optional[typing.Set[str]]) -> typing.Any:
+        m = cls.__new__(cls)
+        fields_values = {}
+
+        if _fields_set is None:
+            _fields_set = set(values.keys())
+
+        for name, key, fallback_to_name, value_plan, field, static_default, default, default_is_set in field_plans:
+            if fallback_to_name and key not in values:
+                key = name
+
+            if key in values:
+                fields_values[name] = value_plan(values[key])
+                _fields_set.add(name)
+            elif static_default:
+                fields_values[name] = default
+                if default_is_set:
+                    _fields_set.add(name)
+            else:
+                default = _get_field_default(field)
+                fields_values[name] = default
+                if default != None and default != PydanticUndefined:
+                    _fields_set.add(name)
+
+        # Add extras back in
+        extras = {}
+        for key, value in values.items():
+            # If the key is not a field by name, nor an alias to a field, then it's extra
+            if key not in known_keys:
+                if IS_PYDANTIC_V2:
+                    extras[key] = value
+                else:
+                    _fields_set.add(key)
+                    fields_values[key] = value
+
+        object.__setattr__(m, "__dict__", fields_values)
+
+        if IS_PYDANTIC_V2:
+            object.__setattr__(m, "__pydantic_private__", None)
+            object.__setattr__(m, "__pydantic_extra__", extras)
+            object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
+        else:
+            object.__setattr__(m, "__fields_set__", _fields_set)
+            m._init_private_attributes()  # type: ignore # Pydantic v1
+        return m
+
+    return _construct
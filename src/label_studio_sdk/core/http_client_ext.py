@@ -0,0 +1,164 @@
+import json as json_module
+import typing
+
+import httpx
+from .http_client import AsyncHttpClient, HttpClient
+from .raw_response import get_response_mode, use_raw_json
+from .request_coalescing import RequestCoalescer
+from .request_options import RequestOptions
+
+
+def _reject_non_json_native(obj: typing.Any) -> typing.Any:
+    raise TypeError(f"{type(obj).__name__} needs jsonable_encoder")
+
+
+def get_json_content(
+    *,
+    json: typing.Optional[typing.Any],
+    data: typing.Optional[typing.Any],
+    content: typing.Optional[typing.Any],
+    files: typing.Optional[typing.Any],
+    request_options: typing.Optional[RequestOptions],
+    force_multipart: typing.Optional[bool] = None,
+) -> typing.Optional[bytes]:
+    """
+    Serialize a JSON request body made only of JSON-native values (dicts, lists, str, int, float, bool, None)
+    straight to bytes, the way httpx would serialize the output of jsonable_encoder.
+
+    Returns None if the body is anything else (models, datetimes, enums, OMIT, NaN...), or is combined with
+    form data, files or additional body parameters, in which case the request goes through get_request_body.
+    The C encoder gives up at the first value that is not JSON-native, so the fallback costs little.
+    """
+    if json is None or data is not None or content is not None or files is not None or force_multipart:
+        return None
+    if request_options is not None and request_options.get("additional_body_parameters"):
+        return None
+    if type(json) is not dict and type(json) is not list:
+        return None
+    try:
+        # same settings as httpx uses for `json=`
+        return json_module.dumps(
+            json, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_reject_non_json_native
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_json_content(kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """
+    Arguments of HttpClient.request/stream with a JSON-native `json` body sent as pre-serialized `content`,
+    which skips the recursive jsonable_encoder walk of get_request_body
+    """
+    request_options = kwargs.get("request_options")
+    json_content = get_json_content(
+        json=kwargs.get("json"),
+        data=kwargs.get("data"),
+        content=kwargs.get("content"),
+        files=kwargs.get("files"),
+        request_options=request_options,
+        force_multipart=kwargs.get("force_multipart"),
+    )
+    if json_content is None:
+        return kwargs
+    headers = dict(kwargs.get("headers") or {})
+    additional_headers = (request_options or {}).get("additional_headers") or {}
+    if not any(key.lower() == "content-type" for key in [*headers, *additional_headers]):
+        headers["content-type"] = "application/json"
+    return {**kwargs, "json": None, "content": json_content, "headers": headers}
+
+
+class HttpClientExt(HttpClient):
+    """
+    HttpClient with the SDK's hand-written request hooks (JSON body fast path, raw response mode), kept out of
+    the generated http_client.py so Fern can keep regenerating it. SyncClientWrapper creates this class
+    instead of HttpClient.
+    """
+
+    def __init__(
+        self, *, base_response_mode: typing.Optional[typing.Callable[[], str]] = None, **kwargs: typing.Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.base_response_mode = base_response_mode
+
+    def request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Response:
+        response = super().request(*args, **_with_json_content(kwargs))
+        # retries call request again, the outermost call applies the hooks once
+        if not kwargs.get("retries"):
+            if get_response_mode(kwargs.get("request_options"), self.base_response_mode) == "raw":
+                use_raw_json(response)
+        return response
+
+    def stream(self, *args: typing.Any, **kwargs: typing.Any) -> typing.ContextManager[httpx.Response]:
+        return super().stream(*args, **_with_json_content(kwargs))
+
+
+class AsyncHttpClientExt(AsyncHttpClient):
+    """AsyncHttpClient with the hooks of HttpClientExt and request coalescing, created by AsyncClientWrapper"""
+
+    def __init__(
+        self,
+        *,
+        base_response_mode: typing.Optional[typing.Callable[[], str]] = None,
+        base_request_coalescer: typing.Optional[typing.Callable[[], typing.Optional[RequestCoalescer]]] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.base_response_mode = base_response_mode
+        self.base_request_coalescer = base_request_coalescer
+
+    async def request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Response:
+        kwargs = _with_json_content(kwargs)
+        coalescer = self.base_request_coalescer() if self.base_request_coalescer is not None else None
+        key = None
+        if coalescer is not None and not kwargs.get("retries"):
+            key = await self._coalescing_key(coalescer, *args, **kwargs)
+        if key is not None:
+            # concurrent identical requests share one response (retries included), each caller gets its own copy
+            response = await coalescer.request(  # type: ignore[union-attr]
+                key, lambda: super(AsyncHttpClientExt, self).request(*args, **kwargs)
+            )
+        else:
+            response = await super().request(*args, **kwargs)
+        if not kwargs.get("retries"):
+            if get_response_mode(kwargs.get("request_options"), self.base_response_mode) == "raw":
+                use_raw_json(response)
+        return response
+
+    def stream(self, *args: typing.Any, **kwargs: typing.Any) -> typing.AsyncContextManager[httpx.Response]:
+        return super().stream(*args, **_with_json_content(kwargs))
+
+    async def _coalescing_key(
+        self,
+        coalescer: RequestCoalescer,
+        path: typing.Optional[str] = None,
+        *,
+        method: str,
+        base_url: typing.Optional[str] = None,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **body: typing.Any,
+    ) -> typing.Optional[str]:
+        """Key of a bodiless request the coalescer allows, None if the request must be sent on its own"""
+        if any(value is not None for name, value in body.items() if name in ("json", "data", "content", "files")):
+            return None
+        if body.get("force_multipart") or (request_options or {}).get("additional_body_parameters"):
+            return None
+        if not coalescer.allows(method, path):
+            return None
+        try:
+            return json_module.dumps(
+                [
+                    method.upper(),
+                    self.get_base_url(base_url),
+                    path,
+                    params,
+                    # auth headers included, so clients of different users never share a response
+                    {**(await self._get_headers()), **(headers or {})},
+                    request_options,
+                ],
+                sort_keys=True,
+                default=str,
+            )
+        except TypeError:
+            return None
@@ -0,0 +1,36 @@
+import typing
+
+
+def iter_json_items(chunks: typing.Iterable[bytes], prefix: str) -> typing.Iterator[typing.Any]:
+    """
+    Incrementally parse the JSON values found at `prefix` (ijson syntax, e.g. "tasks.item") out of a byte stream,
+    such as `response.iter_bytes()` of `HttpClient.stream`, yielding each one as soon as it has been read.
+    Only the values completed by the current chunk are held in memory, never the whole document.
+    """
+    # ijson is only needed by the streaming readers, keep it off the import path of the client
+    import ijson
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
+
+
+async def aiter_json_items(chunks: typing.AsyncIterable[bytes], prefix: str) -> typing.AsyncIterator[typing.Any]:
+    """Same as iter_json_items, for `response.aiter_bytes()` of `AsyncHttpClient.stream`."""
+    import ijson
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
@@ -0,0 +1,76 @@
+import json
+import typing
+
+import httpx
+from .request_options import RequestOptions
+
+try:
+    from typing import NotRequired  # type: ignore
+except ImportError:
+    from typing_extensions import NotRequired
+
+ResponseMode = typing.Literal["model", "raw"]
+
+
+class ResponseModeRequestOptions(RequestOptions):
+    """
+    RequestOptions with the SDK's `response_mode` key, which the generated RequestOptions doesn't declare.
+
+    - response_mode: "model" (default) builds response models, "raw" returns the decoded JSON as
+    RawJsonObject/RawJsonArray. Overrides the client-level `response_mode` for this request.
+    """
+
+    response_mode: NotRequired[ResponseMode]
+
+
+class RawJsonObject(typing.Dict[str, typing.Any]):
+    """
+    A decoded JSON object returned as-is in the "raw" response mode.
+
+    It is a plain dict, but top-level keys can also be read as attributes (missing keys read as None,
+    like unset optional model fields), so the generated pagers can keep reading `response.results`.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get(name)
+
+
+class RawJsonArray(typing.List[typing.Any]):
+    """A decoded JSON array returned as-is in the "raw" response mode."""
+
+    __slots__ = ()
+
+
+def get_response_mode(
+    request_options: typing.Optional[ResponseModeRequestOptions], base_response_mode: typing.Optional[typing.Callable[[], str]]
+) -> str:
+    if request_options is not None and request_options.get("response_mode") is not None:
+        return request_options["response_mode"]
+    return base_response_mode() if base_response_mode is not None else "model"
+
+
+def use_raw_json(response: httpx.Response) -> httpx.Response:
+    """
+    Make `response.json()` return the decoded body wrapped in RawJsonObject/RawJsonArray,
+    which construct_type passes through instead of building models.
+    """
+    decoded: typing.List[typing.Any] = []
+
+    def _json(**kwargs: typing.Any) -> typing.Any:
+        if kwargs:
+            return json.loads(response.content, **kwargs)
+        if not decoded:
+            value = json.loads(response.content)
+            if isinstance(value, dict):
+                value = RawJsonObject(value)
+            elif isinstance(value, list):
+                value = RawJsonArray(value)
+            decoded.append(value)
+        return decoded[0]
+
+    response.json = _json  # type: ignore[method-assign]
+    return response
@@ -0,0 +1,74 @@
+import asyncio
+import copy
+import fnmatch
+import typing
+import weakref
+
+import httpx
+
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+_InflightTasks = typing.Dict[typing.Hashable, "asyncio.Task[httpx.Response]"]
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight response between concurrent identical requests of an AsyncHttpClient.
+
+    Requests are identical when the method, URL, query parameters, headers (including auth) and request options
+    are the same, and only bodiless GET/HEAD requests to allowed endpoints are coalesced. The shared request
+    includes its retries. Every caller gets its own copy of the response, or the same exception if the request
+    fails; later requests aren't served from a cache. Requests are only shared within one event loop.
+    """
+
+    def __init__(self, endpoints: typing.Optional[typing.Sequence[str]] = None):
+        """
+        endpoints: fnmatch patterns of the request paths to coalesce, e.g. ["api/projects/*/", "api/version/"].
+            None allows every path.
+        """
+        self.endpoints = None if endpoints is None else [pattern.lstrip("/") for pattern in endpoints]
+        # coalescable requests, and those of them answered by another caller's request
+        self.requests = 0
+        self.coalesced = 0
+        # in-flight tasks by event loop, a task can only be awaited on the loop running it
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _InflightTasks]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def allows(self, method: str, path: typing.Optional[str]) -> bool:
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        if self.endpoints is None:
+            return True
+        path = (path or "").lstrip("/")
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.endpoints)
+
+    async def request(
+        self, key: typing.Hashable, send: typing.Callable[[], typing.Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Response of send(), shared with the concurrent callers passing the same key"""
+        self.requests += 1
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(send())
+            inflight[key] = task
+            task.add_done_callback(lambda done: self._done(inflight, key, done))
+        else:
+            self.coalesced += 1
+        # a cancelled caller doesn't cancel the request the others wait for
+        response = await asyncio.shield(task)
+        # response.json can be replaced per caller (raw response mode), the body is shared
+        return copy.copy(response)
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Coalescable requests, how many of them were saved and how many are in flight"""
+        in_flight = sum(len(inflight) for inflight in self._inflight.values())
+        return {"requests": self.requests, "coalesced": self.coalesced, "in_flight": in_flight}
+
+    def _done(self, inflight: _InflightTasks, key: typing.Hashable, task: "asyncio.Task[httpx.Response]") -> None:
+        if inflight.get(key) is task:
+            del inflight[key]
+        if not task.cancelled():
+            # retrieved, even if every caller was cancelled
+            task.exception()
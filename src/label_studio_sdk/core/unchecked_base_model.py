@@ -492,3 +492,7 @@ def _get_field_default(field: PydanticField) -> typing.Any:
             return None
         return value
     return value
+
+
+# Hand-maintained hook, re-add it when Fern regenerates this file: compiled construct_type, see construct_plans.py
+from .construct_plans import construct_type  # noqa: E402, F811
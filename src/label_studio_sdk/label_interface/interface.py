@@ -26,7 +26,6 @@ from .control_tags import (
 from .label_tags import LabelTag
 from .object_tags import ObjectTag
 from .objects import AnnotationValue, PredictionValue, Region, TaskValue
-from jsf import JSF
 from lxml import etree
 from pydantic import BaseModel
 
@@ -1245,6 +1244,9 @@ class LabelInterface:
 
     def _generate_sample_regions(self):
         """ Generate an example of each control tag's JSON schema and validate it as a region"""
+        # jsf brings faker and smart_open with it, so it's imported only when samples are generated
+        from jsf import JSF
+
         generated_data = {}
         for control in self.controls:
             schema = control.to_json_schema()
@@ -1,8 +1,13 @@
 import typing
 from .client import ProjectsClient, AsyncProjectsClient
 from label_studio_sdk._extensions.pager_ext import SyncPagerExt, AsyncPagerExt, T
+from label_studio_sdk._extensions.bulk_import import (
+    AsyncBulkImporter,
+    BulkImporter,
+    BulkImportResult,
+)
+from label_studio_sdk.tasks.client import TasksClient, AsyncTasksClient
 from label_studio_sdk.types.lse_project_response import LseProjectResponse
-from label_studio_sdk.label_interface import LabelInterface
 from .exports.client_ext import ExportsClientExt, AsyncExportsClientExt
 from ..core.unchecked_base_model import construct_type
 from ..core import RequestOptions
@@ -11,6 +16,9 @@ from ..core import RequestOptions
 class ProjectExt(LseProjectResponse):
 
     def get_label_interface(self):
+        # label_interface pulls in lxml, jsonschema and friends, so it's loaded on first use only
+        from label_studio_sdk.label_interface import LabelInterface
+
         return LabelInterface(self.label_config)
 
 
@@ -28,22 +36,92 @@ class ProjectsClientExt(ProjectsClient):
             self._exports_ext = ExportsClientExt(client_wrapper=self._client_wrapper)
         return self._exports_ext
 
-    def list(self, **kwargs) -> SyncPagerExt[T]:
-        return SyncPagerExt.from_sync_pager(super().list(**kwargs))
+    def list(self, *, prefetch: int = 0, **kwargs) -> SyncPagerExt[T]:
+        return SyncPagerExt.from_sync_pager(super().list(**kwargs), prefetch=prefetch)
 
     list.__doc__ = ProjectsClient.list.__doc__
 
     def get(self, id: int, *, request_options: typing.Optional[RequestOptions] = None) -> ProjectExt:
+        project = super().get(id, request_options=request_options)
+        if isinstance(project, dict):
+            # "raw" response mode, hand back the decoded JSON
+            return project
         return typing.cast(
             ProjectExt,
             construct_type(
                 type_=ProjectExt,  # type: ignore
-                object_=super().get(id, request_options=request_options).model_dump(),
+                object_=project.model_dump(),
             ),
         )
 
     get.__doc__ = ProjectsClient.get.__doc__
 
+    def bulk_import(
+        self,
+        project_id: int,
+        source: typing.Union[str, typing.Iterable[dict]],
+        *,
+        chunk_size: int = 5000,
+        max_chunk_bytes: int = 67108864,
+        concurrency: int = 4,
+        checkpoint: typing.Optional[str] = None,
+        poll_interval: float = 1.0,
+        poll_timeout: typing.Optional[float] = None,
+        **import_kwargs,
+    ) -> BulkImportResult:
+        """
+        Import any number of tasks into a project, in size-bounded chunks uploaded concurrently.
+
+        Parameters
+        ----------
+        project_id : int
+            Project ID
+
+        source : typing.Union[str, typing.Iterable[dict]]
+            Path to a JSON array, NDJSON (.ndjson/.jsonl), CSV or TSV file, or any iterable of tasks.
+            Tasks are read lazily, so the source never has to fit in memory.
+
+        chunk_size : int
+            Maximum number of tasks per import request.
+
+        max_chunk_bytes : int
+            Approximate maximum size of the JSON body of an import request, 64 MiB by default.
+
+        concurrency : int
+            Number of import requests in flight at once.
+
+        checkpoint : typing.Optional[str]
+            Path of a file where the progress is recorded. Running the same import again with the same
+            checkpoint skips the chunks that were already imported and waits for the pending ones.
+
+        poll_interval : float
+            Seconds between two status checks of the imports processed asynchronously by the server.
+            A failed status check is logged and retried on the next one.
+
+        poll_timeout : typing.Optional[float]
+            Seconds to wait for the imports still pending once every chunk is uploaded. When it expires,
+            `BulkImportFailedError` is raised and the imports stay pending in the checkpoint. Waits forever by default.
+
+        **import_kwargs
+            Passed to `import_tasks` for every chunk, e.g. `commit_to_project` or `preannotated_from_fields`.
+
+        Returns
+        -------
+        BulkImportResult
+            Chunk and task counts, and the IDs of the asynchronous imports.
+        """
+        return BulkImporter(self, TasksClient(client_wrapper=self._client_wrapper)).run(
+            project_id,
+            source,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            poll_interval=poll_interval,
+            poll_timeout=poll_timeout,
+            **import_kwargs,
+        )
+
 
 class AsyncProjectsClientExt(AsyncProjectsClient):
 
@@ -58,17 +136,47 @@ class AsyncProjectsClientExt(AsyncProjectsClient):
         return self._exports_ext
 
     async def get(self, id: int, *, request_options: typing.Optional[RequestOptions] = None) -> ProjectExt:
+        project = await super().get(id, request_options=request_options)
+        if isinstance(project, dict):
+            return project
         return typing.cast(
             ProjectExt,
             construct_type(
                 type_=ProjectExt,  # type: ignore
-                object_=(await super().get(id, request_options=request_options)).model_dump(),
+                object_=project.model_dump(),
             ),
         )
 
     get.__doc__ = AsyncProjectsClient.get.__doc__
 
-    async def list(self, **kwargs):
-        return await AsyncPagerExt.from_async_pager(await super().list(**kwargs))
+    async def bulk_import(
+        self,
+        project_id: int,
+        source: typing.Union[str, typing.Iterable[dict]],
+        *,
+        chunk_size: int = 5000,
+        max_chunk_bytes: int = 67108864,
+        concurrency: int = 4,
+        checkpoint: typing.Optional[str] = None,
+        poll_interval: float = 1.0,
+        poll_timeout: typing.Optional[float] = None,
+        **import_kwargs,
+    ) -> BulkImportResult:
+        return await AsyncBulkImporter(self, AsyncTasksClient(client_wrapper=self._client_wrapper)).run(
+            project_id,
+            source,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            poll_interval=poll_interval,
+            poll_timeout=poll_timeout,
+            **import_kwargs,
+        )
+
+    bulk_import.__doc__ = ProjectsClientExt.bulk_import.__doc__
+
+    async def list(self, *, prefetch: int = 0, **kwargs):
+        return await AsyncPagerExt.from_async_pager(await super().list(**kwargs), prefetch=prefetch)
 
     list.__doc__ = AsyncProjectsClient.list.__doc__
@@ -1,14 +1,20 @@
 import json
+import os
 import time
 import asyncio
+import tempfile
 import typing
-import pandas as pd
+from pathlib import Path
 from .client import ExportsClient, AsyncExportsClient
 from io import BytesIO
+from label_studio_sdk.core.json_stream import aiter_json_items, iter_json_items
 from label_studio_sdk.versions.client import VersionsClient, AsyncVersionsClient
 from label_studio_sdk.core.api_error import ApiError
 from label_studio_sdk.core.client_wrapper import SyncClientWrapper, AsyncClientWrapper
 
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
 
 class ExportTimeoutError(ApiError):
 
@@ -44,6 +50,30 @@ def _check_status(export_snapshot, converted_format_id, status):
     return False
 
 
+# bytes read from the download response at a time; large reads keep multi-GB exports fast
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def _download_options(kwargs: typing.Optional[typing.Dict[str, typing.Any]], chunk_size: int) -> typing.Dict[str, typing.Any]:
+    kwargs = dict(kwargs or {})
+    kwargs["request_options"] = {"chunk_size": chunk_size, **(kwargs.get("request_options") or {})}
+    return kwargs
+
+
+def _temporary_path(path: Path) -> Path:
+    # next to the destination, so the final rename stays on the same filesystem and is atomic
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    os.close(fd)
+    return Path(tmp_path)
+
+
+def _model_response(kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Dict[str, typing.Any]:
+    # export snapshots and versions are read as models below, even when the client uses the "raw" response mode
+    kwargs = dict(kwargs or {})
+    kwargs["request_options"] = {**(kwargs.get("request_options") or {}), "response_mode": "model"}
+    return kwargs
+
+
 class ExportsClientExt(ExportsClient):
 
     def __init__(self, *, client_wrapper: SyncClientWrapper):
@@ -70,14 +100,17 @@ class ExportsClientExt(ExportsClient):
         fileobj = self._bytestream_to_fileobj(bytestream)
         return json.load(fileobj)
 
-    def _bytestream_to_pandas(self, bytestream: typing.Iterable[bytes]) -> pd.DataFrame:
+    def _bytestream_to_pandas(self, bytestream: typing.Iterable[bytes]) -> "pd.DataFrame":
+        # pandas is heavy to import, so only load it when a DataFrame is actually requested
+        import pandas as pd
+
         fileobj = self._bytestream_to_fileobj(bytestream)
         return pd.read_csv(fileobj)
 
     def _poll_export(self, project_id, export_snapshot, converted_format_id, timeout):
         start_time = time.time()
         while not _check_status(export_snapshot, None, 'completed'):
-            export_snapshot = self.get(id=project_id, export_pk=export_snapshot.id)
+            export_snapshot = self.get(id=project_id, export_pk=export_snapshot.id, **_model_response())
             if _check_status(export_snapshot, None, 'failed'):
                 raise ExportFailedError(export_snapshot)
             if time.time() - start_time > timeout:
@@ -92,29 +125,55 @@ class ExportsClientExt(ExportsClient):
         create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
         convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
         download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
-        version = VersionsClient(client_wrapper=self._client_wrapper).get()
+        version = VersionsClient(client_wrapper=self._client_wrapper).get(**_model_response())
 
         if version.edition == "Enterprise":
             # Enterprise edition exports are async, so we need to wait for the export job to complete
-            export_snapshot = self.create(project_id, **(create_kwargs or {}))
+            export_snapshot = self.create(project_id, **_model_response(create_kwargs))
             # Poll for base (JSON) export to complete
             self._poll_export(project_id, export_snapshot, None, timeout)
             # Convert to requested format if not JSON
             if export_type != "JSON":
-                converted_proc = self.convert(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **(convert_kwargs or {}))
+                converted_proc = self.convert(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **_model_response(convert_kwargs))
                 self._poll_export(project_id, export_snapshot, converted_proc.converted_format, timeout)
 
-            bytestream = self.download(id=project_id, export_pk=export_snapshot.id, export_type=export_type, request_options={'chunk_size': 1024}, **(download_kwargs or {}))
+            bytestream = self.download(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **_download_options(download_kwargs, chunk_size))
         else:
             # Community edition exports are sync, so we can download the file immediately
-            bytestream = self.download_sync(project_id, export_type=export_type, download_all_tasks=True, download_resources=True)
+            bytestream = self.download_sync(project_id, export_type=export_type, download_all_tasks=True, download_resources=True, **_download_options(None, chunk_size))
         return bytestream
 
-    def as_file(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None):
-        bytestream = self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs)
+    def _bytestream_to_path(self, bytestream: typing.Iterable[bytes] | bytes, path: typing.Union[str, os.PathLike]) -> Path:
+        path = Path(path)
+        tmp_path = _temporary_path(path)
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in [bytestream] if isinstance(bytestream, bytes) else bytestream:
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path
+
+    def as_file(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, path: typing.Optional[str] = None, chunk_size: int = 1048576):
+        """
+        Export the project and return the export file. Without `path`, the export is loaded in a BytesIO.
+        With `path`, it is streamed to that local file instead (written next to it and renamed into place once
+        complete, so `path` never holds a partial export) and the Path is returned.
+        """
+        bytestream = self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs, chunk_size)
+        if path is not None:
+            return self._bytestream_to_path(bytestream, path)
         return self._bytestream_to_fileobj(bytestream)
 
+    def iter_tasks(self, project_id: int, timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, chunk_size: int = 1048576) -> typing.Iterator[dict]:
+        """Export the project as JSON and yield its tasks one at a time, parsed while the export downloads."""
+        bytestream = self._get_bytestream(project_id, "JSON", timeout, create_kwargs, convert_kwargs, download_kwargs, chunk_size)
+        return iter_json_items([bytestream] if isinstance(bytestream, bytes) else bytestream, "item")
+
     def as_binary(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None):
         bytestream = self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs)
         return self._bytestream_to_binary(bytestream)
@@ -156,13 +215,15 @@ class AsyncExportsClientExt(AsyncExportsClient):
 
     async def _bytestream_to_pandas(self, bytestream):
         """Convert bytestream to pandas DataFrame"""
+        import pandas as pd
+
         fileobj = await self._bytestream_to_fileobj(bytestream)
         return pd.read_csv(fileobj)
 
     async def _poll_export(self, project_id, export_snapshot, converted_format_id, timeout):
         start_time = time.time()
         while not _check_status(export_snapshot, None, 'completed'):
-            export_snapshot = await self.get(id=project_id, export_pk=export_snapshot.id)
+            export_snapshot = await self.get(id=project_id, export_pk=export_snapshot.id, **_model_response())
             if _check_status(export_snapshot, None, 'failed'):
                 raise ExportFailedError(export_snapshot)
             if time.time() - start_time > timeout:
@@ -177,27 +238,58 @@ class AsyncExportsClientExt(AsyncExportsClient):
         create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
         convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
         download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
-        version = await AsyncVersionsClient(client_wrapper=self._client_wrapper).get()
+        version = await AsyncVersionsClient(client_wrapper=self._client_wrapper).get(**_model_response())
         if version.edition == "Enterprise":
             # Enterprise edition exports are async, so we need to wait for the export job to complete
-            export_snapshot = await self.create(project_id, **(create_kwargs or {}))
+            export_snapshot = await self.create(project_id, **_model_response(create_kwargs))
             # Poll for base (JSON) export to complete
             await self._poll_export(project_id, export_snapshot, None, timeout)
             # Convert to requested format if not JSON
             if export_type != "JSON":
-                converted_proc = await self.convert(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **(convert_kwargs or {}))
+                converted_proc = await self.convert(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **_model_response(convert_kwargs))
                 await self._poll_export(project_id, export_snapshot, converted_proc.converted_format, timeout)
 
-            bytestream = self.download(id=project_id, export_pk=export_snapshot.id, export_type=export_type, request_options={'chunk_size': 1024}, **(download_kwargs or {}))
+            bytestream = self.download(id=project_id, export_pk=export_snapshot.id, export_type=export_type, **_download_options(download_kwargs, chunk_size))
         else:
-            bytestream = self.download_sync(project_id, export_type=export_type, download_all_tasks=True, download_resources=True)
+            bytestream = self.download_sync(project_id, export_type=export_type, download_all_tasks=True, download_resources=True, **_download_options(None, chunk_size))
         return bytestream
 
-    async def as_file(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None):
-        bytestream = await self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs)
+    async def _bytestream_to_path(self, bytestream: typing.AsyncGenerator[bytes, None] | bytes, path: typing.Union[str, os.PathLike]) -> Path:
+        path = Path(path)
+        tmp_path = _temporary_path(path)
+        try:
+            with open(tmp_path, "wb") as f:
+                if isinstance(bytestream, bytes):
+                    f.write(bytestream)
+                else:
+                    async for chunk in bytestream:
+                        f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path
+
+    async def as_file(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, path: typing.Optional[str] = None, chunk_size: int = 1048576):
+        bytestream = await self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs, chunk_size)
+        if path is not None:
+            return await self._bytestream_to_path(bytestream, path)
         return await self._bytestream_to_fileobj(bytestream)
 
+    as_file.__doc__ = ExportsClientExt.as_file.__doc__
+
+    async def iter_tasks(self, project_id: int, timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, chunk_size: int = 1048576) -> typing.AsyncIterator[dict]:
+        """Export the project as JSON and yield its tasks one at a time, parsed while the export downloads."""
+        bytestream = await self._get_bytestream(project_id, "JSON", timeout, create_kwargs, convert_kwargs, download_kwargs, chunk_size)
+        if isinstance(bytestream, bytes):
+            for task in iter_json_items([bytestream], "item"):
+                yield task
+        else:
+            async for task in aiter_json_items(bytestream, "item"):
+                yield task
+
     async def as_binary(self, project_id: int, export_type: str = "JSON", timeout: int = 60, create_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, convert_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None, download_kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None):
         bytestream = await self._get_bytestream(project_id, export_type, timeout, create_kwargs, convert_kwargs, download_kwargs)
         return await self._bytestream_to_binary(bytestream)
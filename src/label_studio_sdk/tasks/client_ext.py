@@ -1,22 +1,224 @@
+from __future__ import annotations
+
+import typing
+from json.decoder import JSONDecodeError
+
+import httpx
+
 from .client import TasksClient, AsyncTasksClient
-from label_studio_sdk._extensions.pager_ext import SyncPagerExt, AsyncPagerExt, T
+from label_studio_sdk._extensions.pager_ext import (
+    SyncPagerExt,
+    AsyncPagerExt,
+    SyncConcurrentPagerExt,
+    AsyncConcurrentPagerExt,
+    T,
+)
+from ..core.api_error import ApiError
+from ..core.json_stream import aiter_json_items, iter_json_items
+from ..core.raw_response import get_response_mode
+from ..core.request_options import RequestOptions
+from ..core.unchecked_base_model import construct_type
+from ..errors.bad_request_error import BadRequestError
+from ..errors.forbidden_error import ForbiddenError
+from ..errors.unauthorized_error import UnauthorizedError
+from ..types.role_based_task import RoleBasedTask
+
+# python argument names of `tasks.list` that differ from their query parameter names
+_QUERY_PARAMETER_NAMES = {"selected_items": "selectedItems"}
+
+# query parameters of `tasks.list`, the other arguments `stream=True` accepts aren't sent to the server
+_LIST_QUERY_PARAMETERS = (
+    "fields",
+    "include",
+    "only_annotated",
+    "page_size",
+    "project",
+    "query",
+    "resolve_uri",
+    "review",
+    "selected_items",
+    "view",
+)
+
+_ERRORS_BY_STATUS_CODE = {400: BadRequestError, 401: UnauthorizedError, 403: ForbiddenError}
+
+
+def _check_paging_options(prefetch: int, concurrency: int, ordered: bool) -> None:
+    # `prefetch` applies to sequential paging and `ordered` to the concurrent fan-out, reject the mixes
+    # instead of silently ignoring one of the options
+    if concurrency > 1 and prefetch > 0:
+        raise ValueError("`concurrency` fetches pages in parallel and can't be combined with `prefetch`")
+    if concurrency <= 1 and not ordered:
+        raise ValueError("`ordered=False` only applies to concurrent paging, set `concurrency` > 1")
+
+
+def _stream_params(kwargs: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+    if kwargs.get('concurrency', 0) > 1 or kwargs.get('prefetch', 0) > 0 or not kwargs.get('ordered', True):
+        raise ValueError(
+            "`stream=True` reads pages one at a time and can't be combined with `concurrency`, `prefetch` or `ordered`"
+        )
+    params = {}
+    for name, value in kwargs.items():
+        if name in _LIST_QUERY_PARAMETERS:
+            params[_QUERY_PARAMETER_NAMES.get(name, name)] = value
+        elif name not in ('page', 'request_options', 'concurrency', 'prefetch', 'ordered'):
+            raise TypeError(f"list() got an unexpected keyword argument '{name}'")
+    return kwargs.get('page') or 1, params
+
+
+def _raise_for_streamed_status(response: httpx.Response) -> None:
+    try:
+        body = response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=response.text)
+    error = _ERRORS_BY_STATUS_CODE.get(response.status_code)
+    if error is not None:
+        raise error(headers=dict(response.headers), body=body)
+    raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=body)
+
+
+def _construct_task(item: typing.Any, response_mode: str) -> typing.Any:
+    if response_mode == "raw":
+        return item
+    return construct_type(type_=RoleBasedTask, object_=item)  # type: ignore
 
 
 class TasksClientExt(TasksClient):
 
-    def list(self, **kwargs) -> SyncPagerExt[T]:
+    @typing.overload
+    def list(
+        self,
+        *,
+        prefetch: int = 0,
+        concurrency: int = 0,
+        ordered: bool = True,
+        stream: typing.Literal[False] = False,
+        **kwargs,
+    ) -> SyncPagerExt[T]: ...
+
+    @typing.overload
+    def list(
+        self, *, prefetch: int = 0, concurrency: int = 0, ordered: bool = True, stream: typing.Literal[True], **kwargs
+    ) -> typing.Iterator[RoleBasedTask]: ...
+
+    def list(
+        self, *, prefetch: int = 0, concurrency: int = 0, ordered: bool = True, stream: bool = False, **kwargs
+    ) -> typing.Union[SyncPagerExt[T], typing.Iterator[RoleBasedTask]]:
         # use `fields: all` by default and return the full data
         kwargs['fields'] = kwargs.get('fields', 'all')
-        return SyncPagerExt.from_sync_pager(super().list(**kwargs))
+        if stream:
+            # parse tasks out of the response body while it downloads, instead of buffering whole pages
+            return self._iter_streamed(**kwargs, prefetch=prefetch, concurrency=concurrency, ordered=ordered)
+        _check_paging_options(prefetch, concurrency, ordered)
+        first = super().list(**kwargs)
+        if concurrency > 1:
+            # /api/tasks is page-number paginated and reports a total,
+            # so all remaining pages are known once the first one is back
+            fetch_page = lambda number: super(TasksClientExt, self).list(**{**kwargs, 'page': number})
+            return SyncConcurrentPagerExt.from_first_page(
+                first,
+                fetch_page,
+                page=kwargs.get('page') or 1,
+                page_size=kwargs.get('page_size'),
+                concurrency=concurrency,
+                ordered=ordered,
+            )
+        return SyncPagerExt.from_sync_pager(first, prefetch=prefetch)
 
     list.__doc__ = TasksClient.list.__doc__
 
+    def _iter_streamed(self, **kwargs) -> typing.Iterator[RoleBasedTask]:
+        # validate the arguments right away, not on the first iteration
+        page, params = _stream_params(kwargs)
+        return self._iter_streamed_pages(page, params, kwargs.get('request_options'))
+
+    def _iter_streamed_pages(
+        self, page: int, params: typing.Dict[str, typing.Any], request_options: typing.Optional[RequestOptions]
+    ) -> typing.Iterator[RoleBasedTask]:
+        response_mode = get_response_mode(request_options, self._client_wrapper.get_response_mode)
+        http_client = self._client_wrapper.httpx_client
+        while True:
+            with http_client.stream(
+                "api/tasks/", method="GET", params={**params, 'page': page}, request_options=request_options
+            ) as response:
+                # the page past the last one answers 404, which ends the pagination
+                if response.status_code == 404:
+                    return
+                if not 200 <= response.status_code < 300:
+                    response.read()
+                    _raise_for_streamed_status(response)
+                count = 0
+                for item in iter_json_items(response.iter_bytes(), "tasks.item"):
+                    count += 1
+                    yield _construct_task(item, response_mode)
+            if count == 0:
+                return
+            page += 1
+
 
 class AsyncTasksClientExt(AsyncTasksClient):
 
-    async def list(self, **kwargs):
+    @typing.overload
+    async def list(
+        self,
+        *,
+        prefetch: int = 0,
+        concurrency: int = 0,
+        ordered: bool = True,
+        stream: typing.Literal[False] = False,
+        **kwargs,
+    ) -> AsyncPagerExt[T]: ...
+
+    @typing.overload
+    async def list(
+        self, *, prefetch: int = 0, concurrency: int = 0, ordered: bool = True, stream: typing.Literal[True], **kwargs
+    ) -> typing.AsyncIterator[RoleBasedTask]: ...
+
+    async def list(
+        self, *, prefetch: int = 0, concurrency: int = 0, ordered: bool = True, stream: bool = False, **kwargs
+    ) -> typing.Union[AsyncPagerExt[T], typing.AsyncIterator[RoleBasedTask]]:
         # use `fields: all` by default and return the full data
         kwargs['fields'] = kwargs.get('fields', 'all')
-        return await AsyncPagerExt.from_async_pager(await super().list(**kwargs))
+        if stream:
+            return self._iter_streamed(**kwargs, prefetch=prefetch, concurrency=concurrency, ordered=ordered)
+        _check_paging_options(prefetch, concurrency, ordered)
+        first = await super().list(**kwargs)
+        if concurrency > 1:
+            fetch_page = lambda number: super(AsyncTasksClientExt, self).list(**{**kwargs, 'page': number})
+            return await AsyncConcurrentPagerExt.from_first_page(
+                first,
+                fetch_page,
+                page=kwargs.get('page') or 1,
+                page_size=kwargs.get('page_size'),
+                concurrency=concurrency,
+                ordered=ordered,
+            )
+        return await AsyncPagerExt.from_async_pager(first, prefetch=prefetch)
 
     list.__doc__ = AsyncTasksClient.list.__doc__
+
+    def _iter_streamed(self, **kwargs) -> typing.AsyncIterator[RoleBasedTask]:
+        page, params = _stream_params(kwargs)
+        return self._iter_streamed_pages(page, params, kwargs.get('request_options'))
+
+    async def _iter_streamed_pages(
+        self, page: int, params: typing.Dict[str, typing.Any], request_options: typing.Optional[RequestOptions]
+    ) -> typing.AsyncIterator[RoleBasedTask]:
+        response_mode = get_response_mode(request_options, self._client_wrapper.get_response_mode)
+        http_client = self._client_wrapper.httpx_client
+        while True:
+            async with http_client.stream(
+                "api/tasks/", method="GET", params={**params, 'page': page}, request_options=request_options
+            ) as response:
+                if response.status_code == 404:
+                    return
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    _raise_for_streamed_status(response)
+                count = 0
+                async for item in aiter_json_items(response.aiter_bytes(), "tasks.item"):
+                    count += 1
+                    yield _construct_task(item, response_mode)
+            if count == 0:
+                return
+            page += 1
@@ -1,4 +1,7 @@
+import asyncio
+import math
 import threading
+import time
 import urllib.parse
 import typing
 from datetime import datetime, timezone
@@ -10,29 +13,53 @@ import jwt
 from ..core.api_error import ApiError
 from ..types.token_refresh_response import TokenRefreshResponse
 
+# Access tokens are refreshed this many seconds before they actually expire (at most half their lifetime),
+# so that a request started right before the expiration doesn't fail with 401
+DEFAULT_REFRESH_WINDOW_SECONDS = 30.0
+
+
+def _decode_unverified(token: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+
 
 class TokensClientExt:
     """Client for managing authentication tokens."""
 
-    def __init__(self, base_url: str, api_key: str, client_wrapper=None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        client_wrapper=None,
+        refresh_window: float = DEFAULT_REFRESH_WINDOW_SECONDS,
+    ):
         self._base_url = base_url
         self._api_key = api_key
         self._client_wrapper = client_wrapper
+        self._refresh_window = refresh_window
+        # claims of the api_key never change, decode them once instead of on every X-API-Key request
+        self._api_key_claims = _decode_unverified(api_key)
         self._use_legacy_token = not self._is_valid_jwt_token(api_key, raise_if_expired=True)
 
         # cache state for access token when using jwt-based api_key
         self._access_token: typing.Optional[str] = None
         self._access_token_expiration: typing.Optional[datetime] = None
+        # time.monotonic() deadline after which the cached access token must be refreshed,
+        # computed once in _set_access_token so that requests don't decode the JWT again
+        self._access_token_refresh_at: float = -math.inf
         # Used to keep simultaneous refresh requests from spamming refresh endpoint
         self._token_refresh_lock = threading.Lock()
+        # Same for the async clients, created lazily to bind to the running event loop
+        self._async_token_refresh_lock: typing.Optional[asyncio.Lock] = None
 
 
     def _decode_jwt_payload(self, token: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
         """Decode JWT claims without verification, or None if not a JWT."""
-        try:
-            return jwt.decode(token, options={"verify_signature": False})
-        except jwt.InvalidTokenError:
-            return None
+        if token == self._api_key:
+            return self._api_key_claims
+        return _decode_unverified(token)
 
     def _is_valid_jwt_token(self, token: str, raise_if_expired: bool = False) -> bool:
         """Check if a token is a valid JWT token by attempting to decode its header and check expiration."""
@@ -45,8 +72,7 @@ class TokensClientExt:
                 status_code=401,
                 body={"detail": "API key does not have an expiration set, and is not valid. Please obtain a new refresh token."}
             )
-        expiration_time = datetime.fromtimestamp(expiration, timezone.utc)
-        if expiration_time < datetime.now(timezone.utc):
+        if expiration < time.time():
             if raise_if_expired:
                 raise ApiError(
                     status_code=401,
@@ -75,15 +101,33 @@ class TokensClientExt:
             return self.api_key
         return self.refresh(refresh_token=value).access
 
+    async def async_resolve_x_api_key_header_value(self, value: str) -> str:
+        """Async version of :meth:`resolve_x_api_key_header_value` that never blocks the event loop."""
+        if self.jwt_token_type(value) != "refresh":
+            return value
+        if value == self._api_key:
+            return await self.async_api_key()
+        return (await self.async_refresh(refresh_token=value)).access
+
     def _set_access_token(self, token: str) -> None:
         """Set the access token and cache its expiration time."""
+        self._access_token_refresh_at = -math.inf
         decoded = self._decode_jwt_payload(token)
         if decoded is not None:
             expiration = decoded.get("exp")
             if expiration is not None:
                 self._access_token_expiration = datetime.fromtimestamp(expiration, timezone.utc)
+                # translate the wall-clock expiration into a monotonic deadline once,
+                # so that wall-clock jumps don't matter and checks are a single comparison
+                expires_in = expiration - time.time()
+                # a short-lived token would otherwise be stored already inside its window and refreshed on every request
+                refresh_window = min(self._refresh_window, expires_in / 2)
+                self._access_token_refresh_at = time.monotonic() + expires_in - refresh_window
         self._access_token = token
 
+    def _access_token_needs_refresh(self) -> bool:
+        return (not self._access_token) or time.monotonic() >= self._access_token_refresh_at
+
     @property
     def api_key(self) -> str:
         """Get the current access token, refreshing if necessary."""
@@ -92,15 +136,30 @@ class TokensClientExt:
             return self._api_key
 
         # JWT tokens: handle refresh if needed
-        if (not self._access_token) or (not self._is_valid_jwt_token(self._access_token)):
+        if self._access_token_needs_refresh():
             with self._token_refresh_lock:
                 # Check again after acquiring lock, in case another invocation already refreshed
-                if (not self._access_token) or (not self._is_valid_jwt_token(self._access_token)):
+                if self._access_token_needs_refresh():
                     token_response = self.refresh()
                     self._set_access_token(token_response.access)
         
         return self._access_token
 
+    async def async_api_key(self) -> str:
+        """Get the current access token, refreshing it without blocking the event loop if necessary."""
+        if self._use_legacy_token:
+            return self._api_key
+
+        if self._access_token_needs_refresh():
+            if self._async_token_refresh_lock is None:
+                self._async_token_refresh_lock = asyncio.Lock()
+            async with self._async_token_refresh_lock:
+                if self._access_token_needs_refresh():
+                    token_response = await self.async_refresh()
+                    self._set_access_token(token_response.access)
+
+        return self._access_token
+
     def _get_client_params(self, existing_client: httpx.AsyncClient) -> dict:
         """Extract parameters from an existing client to create a new one.
 
@@ -161,3 +220,23 @@ class TokensClientExt:
             return TokenRefreshResponse.parse_obj(response.json())
         else:
             raise ApiError(status_code=response.status_code, body=response.json())
+
+    async def async_refresh(self, refresh_token: typing.Optional[str] = None) -> TokenRefreshResponse:
+        """Refresh the access token with the async client and return the token response."""
+        token = self._api_key if refresh_token is None else refresh_token
+        existing_client = self._client_wrapper.httpx_client.httpx_client
+
+        # A sync client can't be awaited, so fall back to the blocking refresh in a worker thread
+        if not isinstance(existing_client, httpx.AsyncClient):
+            return await asyncio.to_thread(self.refresh, refresh_token)
+
+        response = await existing_client.request(
+            method="POST",
+            url=urllib.parse.urljoin(f"{self._base_url}/", "api/token/refresh/"),
+            json={"refresh": token},
+            headers={"Content-Type": "application/json"},
+        )
+        if response.status_code == 200:
+            return TokenRefreshResponse.parse_obj(response.json())
+        else:
+            raise ApiError(status_code=response.status_code, body=response.json())
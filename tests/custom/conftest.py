@@ -0,0 +1,39 @@
+import typing
+
+import httpx
+
+from label_studio_sdk import AsyncLabelStudio, LabelStudio
+
+
+def mock_client(
+    handler: typing.Callable[[httpx.Request], typing.Any], is_async: bool = False, **kwargs: typing.Any
+) -> typing.Union[LabelStudio, AsyncLabelStudio]:
+    """LabelStudio (or AsyncLabelStudio) client whose requests are answered by handler through httpx.MockTransport"""
+    transport = httpx.MockTransport(handler)
+    if is_async:
+        return AsyncLabelStudio(
+            base_url="http://ls.example.com",
+            api_key="legacy-token",
+            httpx_client=httpx.AsyncClient(transport=transport),
+            **kwargs,
+        )
+    return LabelStudio(
+        base_url="http://ls.example.com",
+        api_key="legacy-token",
+        httpx_client=httpx.Client(transport=transport),
+        **kwargs,
+    )
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body sent in the given chunks, for sync and async clients"""
+
+    def __init__(self, chunks: typing.Iterable[bytes]):
+        self._chunks = chunks
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        yield from self._chunks
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
@@ -93,3 +93,77 @@ def test_rle_encoding():
         56,
         32,
     ]
+
+
+def _bit_stream(num, word_size, rle_sizes, blocks):
+    """Build an RLE stream by hand: blocks are (is_run, size_index, count, words)"""
+    bits = f"{num:032b}{word_size - 1:05b}" + "".join(f"{size - 1:04b}" for size in rle_sizes)
+    for is_run, size_index, count, words in blocks:
+        bits += f"{int(is_run)}{size_index:02b}{count - 1:0{rle_sizes[size_index]}b}"
+        bits += "".join(f"{word:0{word_size}b}" for word in words)
+    bits += "0" * (-len(bits) % 8)
+    return [int(bits[i : i + 8], 2) for i in range(0, len(bits), 8)]
+
+
+def test_decode_rle_matches_bit_string_decoder():
+    import numpy as np
+
+    from label_studio_sdk.converter.brush import _decode_rle_bit_string, decode_rle
+
+    rng = np.random.default_rng(0)
+    noisy = np.where(rng.random(5000) < 0.3, rng.integers(0, 256, 5000), 0)
+    noisy[1000:3000] = 255
+    streams = [encode_rle(noisy), bytes(encode_rle(noisy))]
+    for word_size in range(1, 9):
+        words = [int(word) for word in rng.integers(0, 2**word_size, 40)]
+        blocks = [(True, 2, 30, words[:1]), (False, 3, 40, words), (False, 0, 3, words[:3]), (True, 1, 5, words[:1])]
+        streams.append(_bit_stream(78, word_size, [3, 4, 8, 16], blocks))
+
+    for rle in streams:
+        expected = _decode_rle_bit_string(rle)
+        decoded = decode_rle(rle)
+        assert decoded.dtype == expected.dtype == np.uint8
+        assert np.array_equal(decoded, expected)
+
+
+def test_decode_rle_malformed_streams_fail_like_bit_string_decoder():
+    import pytest
+
+    from label_studio_sdk.converter.brush import _decode_rle_bit_string, decode_rle
+
+    rle = encode_rle([1, 1, 1, 1, 2, 3, 5, 6, 7, 8, 4, 4, 4, 4, 4, 4, 4, 4])
+    # a literal block running past the number of values
+    overflowing = _bit_stream(2, 8, [3, 4, 8, 16], [(False, 0, 4, [1, 2, 3, 4])])
+    for malformed in [rle[:12], rle[:3], overflowing]:
+        try:
+            expected = _decode_rle_bit_string(malformed)
+        except Exception as e:
+            with pytest.raises(type(e)):
+                decode_rle(malformed)
+        else:
+            assert list(decode_rle(malformed)) == list(expected)
+
+
+def test_encode_rle_matches_bit_string_encoder():
+    import numpy as np
+
+    from label_studio_sdk.converter.brush import _encode_rle_bit_string, decode_rle, encode_rle_batch
+
+    rng = np.random.default_rng(0)
+    noisy = np.where(rng.random(5000) < 0.3, rng.integers(0, 256, 5000), 0)
+    arrays = [
+        noisy,
+        noisy.astype(np.uint8),
+        [1, 1, 2],
+        np.array([True, False, False]),
+        # runs in every size class, longer than 2**16 and ending exactly on a byte boundary
+        np.repeat([0, 1, 2, 3, 4, 5], [1, 8, 16, 256, 2**16, 2**17 + 300]),
+        [0] * 11,
+    ]
+    for arr in arrays:
+        rle = encode_rle(arr)
+        assert rle == _encode_rle_bit_string(arr)
+        assert np.array_equal(decode_rle(rle), np.asarray(arr).astype(np.uint8))
+    assert encode_rle_batch(arrays) == [_encode_rle_bit_string(arr) for arr in arrays]
+    # values that do not fit in a byte keep the old behaviour
+    assert encode_rle([300, 1]) == _encode_rle_bit_string([300, 1])
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from label_studio_sdk.converter import Converter
+
+LABEL_CONFIG = """<View>
+  <Image name="image" value="$image"/>
+  <RectangleLabels name="label" toName="image">
+    <Label value="Cat"/>
+    <Label value="Dog"/>
+  </RectangleLabels>
+  <Choices name="quality" toName="image">
+    <Choice value="good"/>
+  </Choices>
+</View>"""
+
+
+def _write_tasks(tmp_path, count):
+    tasks = []
+    for i in range(count):
+        image = tmp_path / f"image{i}.png"
+        Image.new("RGB", (20 + i, 10 + i)).save(image)
+        result = [
+            {
+                "from_name": "label",
+                "to_name": "image",
+                "type": "rectanglelabels",
+                "original_width": 20 + i,
+                "original_height": 10 + i,
+                # labels outside of the config get category ids in order of appearance
+                "value": {"x": 10, "y": 10, "width": 50, "height": 50, "rectanglelabels": [f"New{i % 3}"]},
+            },
+            {"from_name": "quality", "to_name": "image", "type": "choices", "value": {"choices": ["good"]}},
+        ]
+        annotations = [] if i % 5 == 4 else [{"id": 100 + i, "completed_by": 1, "result": result}]
+        tasks.append({"id": i, "data": {"image": str(image)}, "annotations": annotations})
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps(tasks))
+    task_dir = tmp_path / "tasks"
+    task_dir.mkdir()
+    for task in tasks:
+        (task_dir / f"{task['id']}.json").write_text(json.dumps(task))
+    return str(path), str(task_dir)
+
+
+@pytest.mark.parametrize("is_dir", [False, True])
+@pytest.mark.parametrize("format", ["COCO", "YOLO", "VOC", "JSON_MIN", "CSV", "CONLL2003"])
+def test_convert_with_workers_matches_serial(tmp_path, monkeypatch, format, is_dir):
+    # several batches per worker
+    monkeypatch.setattr(Converter, "_WORKER_BATCH_SIZE", 3)
+    input_json, input_dir = _write_tasks(tmp_path, 23)
+
+    outputs = {}
+    for workers in (1, 3):
+        output_dir = tmp_path / f"out{workers}"
+        converter = Converter(config=LABEL_CONFIG, project_dir=str(tmp_path), download_resources=False)
+        input_data = input_dir if is_dir else input_json
+        converter.convert(input_data, str(output_dir), format, is_dir=is_dir, workers=workers)
+        assert converter._workers == 1
+        outputs[workers] = {}
+        for root, _, files in os.walk(output_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                content = open(path, encoding="utf8").read()
+                if name == "result.json" and format == "COCO":
+                    content = json.loads(content)
+                    content.pop("info")
+                outputs[workers][os.path.relpath(path, output_dir)] = content
+
+    assert outputs[1] and outputs[3] == outputs[1]
@@ -235,3 +235,18 @@ def test_convert_to_coco_preserves_explicit_category_ids(temp_out_dir: Path):
 
     annotation_category_ids = {ann["category_id"] for ann in coco["annotations"]}
     assert annotation_category_ids == {10, 7}
+
+
+def test_convert_to_coco_without_pretty_print(temp_out_dir: Path):
+    coco = _run_converter(temp_out_dir / "pretty")
+    conv = Converter(config=str(LABEL_CONFIG_PATH), project_dir=PROJECT_DIR, download_resources=False)
+    conv.convert_to_coco(str(INPUT_JSON_PATH), str(temp_out_dir / "compact"), is_dir=False, pretty_print=False)
+
+    compact = (temp_out_dir / "compact" / "result.json").read_text()
+    assert "\n" not in compact
+    compact = json.loads(compact)
+    compact["info"].pop("date_created")
+    coco["info"].pop("date_created")
+    assert compact == coco
+    # temporary files of the streamed images and annotations are removed
+    assert sorted(p.name for p in (temp_out_dir / "compact").iterdir()) == ["images", "result.json"]
@@ -1,8 +1,10 @@
 import json
 import os
 
+import pytest
 
 from label_studio_sdk.converter import Converter
+from label_studio_sdk.converter.exports import csv2
 from label_studio_sdk.converter.exports.csv2 import prepare_annotation, prepare_annotation_keys
 from pandas import read_csv
 
@@ -201,3 +203,34 @@ def test_chat_csv_export():
         "professional can make a big difference."
     )
     assert transcript == expected_transcript
+
+
+@pytest.mark.parametrize(
+    "data_file",
+    ["csv_test.json", "csv_test2.json", "csv_test_colliding_keys.json", "csv_test_colliding_keys_mixed.json", "csv_test_history.json"],
+)
+def test_csv_single_pass_matches_three_passes(tmp_path, monkeypatch, data_file):
+    # spill in several batches
+    monkeypatch.setattr(csv2, "SPILL_BATCH_SIZE", 1)
+    schema = {
+        "text": {
+            "type": "Choices",
+            "to_name": ["text"],
+            "inputs": [{"type": "Text", "value": "text"}],
+            "labels": ["positive", "negative"],
+            "labels_attrs": {},
+        },
+        **CHAT_SCHEMA,
+    }
+    converter = Converter(schema, "/tmp")
+    input_data = os.path.join(os.path.abspath(os.path.dirname(__file__)), "data", "test_export_csv", data_file)
+
+    def item_iterator(input_data):
+        return converter.iter_from_json_file(input_data)
+
+    csv2.convert(item_iterator, input_data, str(tmp_path / "single"), sep=",")
+    csv2.convert(item_iterator, input_data, str(tmp_path / "three"), single_pass=False, sep=",")
+    result = (tmp_path / "single" / "result.csv").read_text()
+    assert result == (tmp_path / "three" / "result.csv").read_text()
+    # the spill file is removed
+    assert os.listdir(tmp_path / "single") == ["result.csv"]
@@ -1,3 +1,4 @@
+import copy
 from label_studio_sdk.converter import Converter
 import json
 import os
@@ -72,3 +73,61 @@ def test_chat_json_min():
     assert messages[1]["content"].startswith("Hello! How can I assist you today?")
     assert "tool_calls" in messages[1]
     assert messages[1]["tool_calls"] is None
+
+
+def test_matching_tag_from_schema_prefers_exact_then_longest_pattern():
+    repeated = {"regex": {"{{idx}}": ".*"}, "to_name": ["text"], "inputs": [{"type": "Text", "value": "text"}]}
+    schema = {
+        "label_{{idx}}": {"type": "Choices", **repeated},
+        "label_{{idx}}_extra": {"type": "Choices", **repeated},
+        "other_{{idx}}": {"type": "Choices", **repeated},
+        "same_{{idx}}": {"type": "Choices", **repeated},
+        "same_{{jdx}}": {"type": "Choices", **repeated, "regex": {"{{jdx}}": ".*"}},
+        "label_3": {"type": "TextArea", "to_name": ["text"], "inputs": [{"type": "Text", "value": "text"}]},
+    }
+    converter = Converter(config=schema, project_dir=None)
+    for _ in range(2):  # second round is answered from the memo
+        assert converter._maybe_matching_tag_from_schema("label_3") == "label_3"
+        assert converter._maybe_matching_tag_from_schema("label_1_extra") == "label_{{idx}}_extra"
+        assert converter._maybe_matching_tag_from_schema("label_1") == "label_{{idx}}"
+        assert converter._maybe_matching_tag_from_schema("same_1") == "same_{{idx}}"
+        assert converter._maybe_matching_tag_from_schema("unknown") is None
+
+
+def test_json_min_records_share_nested_values_without_changing_the_task():
+    task = {
+        "id": 1,
+        "data": {"image": "1.jpg", "meta": {"tags": ["a", "b"]}},
+        "annotations": [
+            {
+                "id": 10,
+                "completed_by": 3,
+                "result": [
+                    {
+                        "from_name": "label",
+                        "to_name": "text",
+                        "type": "labels",
+                        "original_width": 100,
+                        "value": {"start": 0, "end": 4, "labels": ["PER"]},
+                    }
+                ],
+            }
+        ],
+    }
+    expected_task = copy.deepcopy(task)
+    converter = Converter(
+        {"label": {"type": "Labels", "to_name": ["text"], "inputs": [], "labels": ["PER"], "labels_attrs": {}}},
+        "/tmp",
+    )
+
+    (item,) = converter.annotation_result_from_task(task)
+    record = converter._json_min_record(item)
+
+    value = task["annotations"][0]["result"][0]["value"]
+    assert item["output"]["label"] == [{**value, "type": "Labels", "original_width": 100}]
+    assert item["output"]["label"][0]["labels"] is value["labels"]
+    assert record["label"] == [{**value, "original_width": 100}]
+    assert record["meta"] is task["data"]["meta"]
+    assert record["id"] == 1 and record["annotator"] == 3
+    # results and task data are shallow copied before keys are added
+    assert task == expected_task
@@ -0,0 +1,134 @@
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from label_studio_sdk.converter import Converter
+from label_studio_sdk.converter.image_size import ImageSizeCache, get_image_size_and_channels, read_image_header
+
+LABEL_CONFIG = """<View>
+  <Image name="image" value="$image"/>
+  <RectangleLabels name="label" toName="image"><Label value="Cat"/></RectangleLabels>
+</View>"""
+
+
+@pytest.mark.parametrize(
+    "format, mode, params",
+    [
+        ("PNG", "1", {}),
+        ("PNG", "LA", {}),
+        ("PNG", "P", {}),
+        ("PNG", "RGBA", {}),
+        ("PNG", "I;16", {}),
+        ("JPEG", "L", {}),
+        ("JPEG", "RGB", {"progressive": True}),
+        ("JPEG", "CMYK", {}),
+        ("JPEG", "RGB", {"exif": b"Exif\x00\x00" + b"\x00" * 1000, "icc_profile": b"\x00" * 70000}),
+        ("WEBP", "RGB", {}),
+        ("WEBP", "RGBA", {}),
+        ("WEBP", "RGBA", {"lossless": True}),
+        ("TIFF", "P", {}),
+        ("TIFF", "RGB", {"compression": "tiff_lzw"}),
+        ("TIFF", "CMYK", {}),
+    ],
+)
+def test_read_image_header_matches_pillow(tmp_path, format, mode, params):
+    path = tmp_path / f"image.{format.lower()}"
+    image = Image.new(mode, (123, 45))
+    if "A" in mode:
+        image.putpixel((0, 0), (1,) * len(mode))
+    image.save(path, format, **params)
+    with Image.open(path) as image:
+        assert read_image_header(path) == (*image.size, len(image.getbands()))
+
+
+@pytest.mark.parametrize("mode", ["PA", "LA", "RGBA"])
+def test_tiff_with_extra_samples_is_measured_by_pillow(tmp_path, mode):
+    path = tmp_path / "image.tiff"
+    Image.new(mode, (123, 45)).save(path)
+    assert read_image_header(path) is None
+    assert get_image_size_and_channels(path) == (123, 45, len(mode))
+
+
+def test_read_image_header_returns_none_for_other_formats(tmp_path):
+    Image.new("P", (10, 20)).save(tmp_path / "image.gif")
+    (tmp_path / "image.txt").write_text("not an image")
+    assert read_image_header(tmp_path / "image.gif") is None
+    assert read_image_header(tmp_path / "image.txt") is None
+
+
+def test_image_size_cache_is_kept_between_exports(tmp_path, monkeypatch):
+    image_path = tmp_path / "image.gif"
+    Image.new("P", (10, 20)).save(image_path)
+    cache_path = str(tmp_path / "cache" / "sizes.json")
+
+    cache = ImageSizeCache(cache_path)
+    assert cache.get(image_path) == (10, 20, 1)
+    cache.save()
+
+    def fail(path):
+        raise AssertionError("the size is read from the cache")
+
+    monkeypatch.setattr("label_studio_sdk.converter.image_size.get_image_size_and_channels", fail)
+    assert ImageSizeCache(cache_path).get(image_path) == (10, 20, 1)
+
+    # a changed file is measured again
+    monkeypatch.undo()
+    Image.new("RGB", (30, 40)).save(image_path)
+    os.utime(image_path, ns=(0, 1))
+    assert ImageSizeCache(cache_path).get(image_path) == (30, 40, 1)
+
+
+def test_image_size_cache_file_drops_deleted_and_oldest_images(tmp_path):
+    paths = [tmp_path / f"{i}.gif" for i in range(4)]
+    for path in paths:
+        Image.new("P", (10, 20)).save(path)
+    cache_path = tmp_path / "sizes.json"
+
+    cache = ImageSizeCache(str(cache_path), max_entries=2)
+    for path in paths:
+        cache.get(path)
+    paths[3].unlink()
+    cache.save()
+
+    assert list(json.loads(cache_path.read_text())) == [str(paths[1]), str(paths[2])]
+
+
+def test_converter_keeps_image_sizes_in_memory_by_default():
+    assert not Converter(LABEL_CONFIG, project_dir=".")._image_sizes.persistent
+
+
+def test_coco_uses_size_from_annotations_and_measures_other_images_once(tmp_path, monkeypatch):
+    Image.new("RGB", (30, 40)).save(tmp_path / "unlabeled.png")
+    Image.new("RGB", (50, 60)).save(tmp_path / "labeled.png")
+    rectangle = {
+        "from_name": "label",
+        "to_name": "image",
+        "type": "rectanglelabels",
+        "original_width": 500,
+        "original_height": 600,
+        "value": {"x": 10, "y": 10, "width": 10, "height": 10, "rectanglelabels": ["Cat"]},
+    }
+    tasks = [
+        {"id": 1, "data": {"image": str(tmp_path / "unlabeled.png")}, "annotations": []},
+        {"id": 2, "data": {"image": str(tmp_path / "labeled.png")}, "annotations": [{"result": [rectangle]}]},
+    ]
+    input_json = tmp_path / "tasks.json"
+    input_json.write_text(json.dumps(tasks))
+
+    measured = []
+    measure = ImageSizeCache.get
+
+    def get(cache, path):
+        measured.append(os.path.basename(path))
+        return measure(cache, path)
+
+    monkeypatch.setattr(ImageSizeCache, "get", get)
+    converter = Converter(LABEL_CONFIG, project_dir=".", image_size_cache=str(tmp_path / "sizes.json"))
+    converter.convert(str(input_json), str(tmp_path / "out"), "COCO", is_dir=False)
+
+    images = json.loads((tmp_path / "out" / "result.json").read_text())["images"]
+    assert [(image["width"], image["height"]) for image in images] == [(30, 40), (500, 600)]
+    assert measured == ["unlabeled.png"]
+    assert list(json.loads((tmp_path / "sizes.json").read_text())) == [str(tmp_path / "unlabeled.png")]
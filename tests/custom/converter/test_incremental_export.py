@@ -0,0 +1,191 @@
+import json
+import logging
+import os
+import sqlite3
+
+import pytest
+from PIL import Image
+
+from label_studio_sdk.converter import Converter
+from label_studio_sdk.converter.converter import FormatNotSupportedError
+from label_studio_sdk.converter.manifest import MANIFEST_FILENAME
+
+LABEL_CONFIG = """<View>
+  <Image name="image" value="$image"/>
+  <RectangleLabels name="label" toName="image">
+    <Label value="Cat"/><Label value="Dog"/>
+  </RectangleLabels>
+</View>"""
+
+
+def make_task(task_id, label, x=10):
+    rectangle = {
+        "from_name": "label",
+        "to_name": "image",
+        "type": "rectanglelabels",
+        "original_width": 40,
+        "original_height": 30,
+        "value": {"x": x, "y": 10, "width": 20, "height": 20, "rectanglelabels": [label]},
+    }
+    return {
+        "id": task_id,
+        "data": {"image": f"http://example.com/{task_id}.png"},
+        "annotations": [{"id": task_id, "completed_by": 1, "result": [rectangle]}],
+    }
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    downloaded = []
+
+    def get_local_path(url, cache_dir=None, **kwargs):
+        path = os.path.join(cache_dir, os.path.basename(url))
+        if not os.path.exists(path):
+            downloaded.append(os.path.basename(url))
+            Image.new("RGB", (40, 30)).save(path)
+        return path
+
+    monkeypatch.setattr("label_studio_sdk.converter.converter.get_local_path", get_local_path)
+    return downloaded
+
+
+def read_tree(output_dir):
+    files = {}
+    for root, _, names in os.walk(output_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            if name == MANIFEST_FILENAME:
+                continue
+            if name == "result.json":
+                coco = json.loads(open(path).read())
+                coco["info"].pop("date_created")
+                files[os.path.relpath(path, output_dir)] = coco
+            else:
+                files[os.path.relpath(path, output_dir)] = open(path, "rb").read()
+    return files
+
+
+@pytest.mark.parametrize("format", ["COCO_WITH_IMAGES", "YOLO_WITH_IMAGES"])
+def test_incremental_export_matches_full_export(tmp_path, downloads, caplog, format):
+    converter = Converter(LABEL_CONFIG, project_dir=".", image_size_cache=False)
+    v1 = tmp_path / "v1.json"
+    v1.write_text(json.dumps([make_task(1, "Cat"), make_task(2, "Dog"), make_task(3, "Cat")]))
+    # task 2 changed to a new category, task 3 deleted, task 4 added
+    v2 = tmp_path / "v2.json"
+    v2.write_text(json.dumps([make_task(1, "Cat"), make_task(2, "Bird", x=50), make_task(4, "Dog")]))
+
+    incremental_dir = str(tmp_path / "incremental")
+    converter.convert(str(v1), incremental_dir, format, is_dir=False, incremental=True)
+    assert os.path.exists(os.path.join(incremental_dir, "images", "3.png"))
+    downloads.clear()
+
+    with caplog.at_level(logging.INFO, logger="label_studio_sdk.converter.manifest"):
+        converter.convert(str(v2), incremental_dir, format, is_dir=False, incremental=True)
+    assert "Incremental export: 2 tasks converted, 1 unchanged, 1 removed" in caplog.text
+    assert downloads == ["4.png"]
+
+    full_dir = str(tmp_path / "full")
+    converter.convert(str(v2), full_dir, format, is_dir=False)
+    assert read_tree(incremental_dir) == read_tree(full_dir)
+    assert not os.path.exists(os.path.join(incremental_dir, "images", "3.png"))
+
+
+def test_incremental_yolo_reconverts_tasks_when_category_ids_move(tmp_path, downloads):
+    converter = Converter(LABEL_CONFIG, project_dir=".", image_size_cache=False)
+    v1 = tmp_path / "v1.json"
+    v1.write_text(json.dumps([make_task(1, "Bird")]))
+    # the new first task takes the id "Bird" had, label file of task 1 must be written again
+    v2 = tmp_path / "v2.json"
+    v2.write_text(json.dumps([make_task(2, "Fish"), make_task(1, "Bird")]))
+
+    incremental_dir = str(tmp_path / "incremental")
+    converter.convert(str(v1), incremental_dir, "YOLO_WITH_IMAGES", is_dir=False, incremental=True)
+    converter.convert(str(v2), incremental_dir, "YOLO_WITH_IMAGES", is_dir=False, incremental=True)
+
+    full_dir = str(tmp_path / "full")
+    converter.convert(str(v2), full_dir, "YOLO_WITH_IMAGES", is_dir=False)
+    assert read_tree(incremental_dir) == read_tree(full_dir)
+
+
+def test_incremental_export_is_not_supported_for_other_formats(tmp_path):
+    converter = Converter(LABEL_CONFIG, project_dir=".")
+    with pytest.raises(FormatNotSupportedError):
+        converter.convert(str(tmp_path / "tasks.json"), str(tmp_path / "out"), "JSON_MIN", incremental=True)
+
+
+@pytest.mark.parametrize("format", ["COCO_WITH_IMAGES", "YOLO_WITH_IMAGES"])
+def test_incremental_export_with_keypoint_labels(tmp_path, downloads, format):
+    data_dir = os.path.join(os.path.dirname(__file__), "data", "test_export_yolo")
+    converter = Converter(os.path.join(data_dir, "label_config_keypoints.xml"), project_dir=".")
+    with open(os.path.join(data_dir, "data_keypoints.json")) as f:
+        task = json.load(f)[0]
+
+    def keypoint_task(task_id, *labels):
+        # the same pose with its keypoints relabeled
+        result = json.loads(json.dumps(task["annotations"][0]["result"]))
+        keypoints = [region for region in result if region["type"] == "keypointlabels"]
+        for region, label in zip(keypoints, labels):
+            region["value"]["keypointlabels"] = [label]
+        annotation = dict(task["annotations"][0], result=result)
+        return dict(task, id=task_id, data={"image": f"http://example.com/{task_id}.png"}, annotations=[annotation])
+
+    v1 = tmp_path / "v1.json"
+    v1.write_text(json.dumps([keypoint_task(1), keypoint_task(2, "left_ear")]))
+    v2 = tmp_path / "v2.json"
+    v2.write_text(json.dumps([keypoint_task(1), keypoint_task(2, "left_knee", "right_knee"), keypoint_task(3)]))
+
+    incremental_dir = str(tmp_path / "incremental")
+    converter.convert(str(v1), incremental_dir, format, is_dir=False, incremental=True)
+    converter.convert(str(v2), incremental_dir, format, is_dir=False, incremental=True)
+
+    full_dir = str(tmp_path / "full")
+    converter.convert(str(v2), full_dir, format, is_dir=False)
+    assert read_tree(incremental_dir) == read_tree(full_dir)
+
+
+def test_failed_incremental_export_keeps_the_previous_manifest(tmp_path, downloads, monkeypatch):
+    converter = Converter(LABEL_CONFIG, project_dir=".")
+    v1 = tmp_path / "v1.json"
+    v1.write_text(json.dumps([make_task(1, "Cat")]))
+    v2 = tmp_path / "v2.json"
+    v2.write_text(json.dumps([make_task(1, "Dog"), make_task(2, "Cat")]))
+    incremental_dir = str(tmp_path / "incremental")
+    converter.convert(str(v1), incremental_dir, "YOLO", is_dir=False, incremental=True)
+
+    closed = []
+    connect = sqlite3.connect
+
+    def tracked_connect(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        return _TrackedConnection(connection, closed)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("conversion failed")
+
+    monkeypatch.setattr("label_studio_sdk.converter.manifest.sqlite3.connect", tracked_connect)
+    monkeypatch.setattr("label_studio_sdk.converter.converter.process_and_save_yolo_annotations", fail)
+    with pytest.raises(RuntimeError):
+        converter.convert(str(v2), incremental_dir, "YOLO", is_dir=False, incremental=True)
+    assert closed == [True]
+
+    # the changes of the failed run are rolled back
+    monkeypatch.undo()
+    db = sqlite3.connect(os.path.join(incremental_dir, MANIFEST_FILENAME))
+    assert db.execute("SELECT value FROM meta WHERE key = 'run'").fetchone() == ("1",)
+    assert db.execute("SELECT task_id FROM tasks").fetchall() == [("1",)]
+    db.close()
+
+
+class _TrackedConnection:
+    """sqlite3 connection recording when it is closed"""
+
+    def __init__(self, connection, closed):
+        self._connection = connection
+        self._closed = closed
+
+    def close(self):
+        self._closed.append(True)
+        self._connection.close()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
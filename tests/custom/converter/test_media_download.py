@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+
+from PIL import Image
+
+from label_studio_sdk.converter import Converter
+from label_studio_sdk.converter.media import MediaDownloader
+
+LABEL_CONFIG = """<View>
+  <Image name="image" value="$image"/>
+  <RectangleLabels name="label" toName="image"><Label value="Cat"/></RectangleLabels>
+</View>"""
+
+
+def test_media_downloader_fetches_each_url_once_and_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+    calls = []
+
+    def fetch(url, task_id, session, cache_dir):
+        calls.append(url)
+        # only passes if the three distinct urls are downloading at the same time
+        barrier.wait()
+        if url.endswith("bad"):
+            raise FileNotFoundError(url)
+        return os.path.join(cache_dir, os.path.basename(url))
+
+    with MediaDownloader(max_workers=3, fetch=fetch, cache_dir="images") as downloader:
+        for url in ["http://x/a.png", "http://x/b.png", "http://x/a.png", "http://x/bad"]:
+            downloader.submit(url, task_id=1)
+        assert downloader.get_local_path("http://x/a.png") == os.path.join("images", "a.png")
+        for _ in range(2):
+            try:
+                downloader.get_local_path("http://x/bad")
+            except FileNotFoundError:
+                pass
+            else:
+                raise AssertionError("the error of the download is raised")
+    assert sorted(calls) == ["http://x/a.png", "http://x/b.png", "http://x/bad"]
+
+
+def test_coco_export_with_download_workers_matches_serial(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_get_local_path(**kwargs):
+        calls.append((kwargs["url"], kwargs["session"] is not None))
+        path = os.path.join(kwargs["cache_dir"], os.path.basename(kwargs["url"]))
+        Image.new("RGB", (10 + len(kwargs["url"]), 10)).save(path)
+        return path
+
+    monkeypatch.setattr("label_studio_sdk.converter.converter.get_local_path", fake_get_local_path)
+    result = {
+        "from_name": "label",
+        "to_name": "image",
+        "type": "rectanglelabels",
+        "original_width": 100,
+        "original_height": 100,
+        "value": {"x": 1, "y": 2, "width": 3, "height": 4, "rectanglelabels": ["Cat"]},
+    }
+    tasks = [
+        {"id": i, "data": {"image": f"https://example.com/{i % 7}.png"}, "annotations": [{"result": [result]}]}
+        for i in range(40)
+    ]
+    input_json = tmp_path / "tasks.json"
+    input_json.write_text(json.dumps(tasks))
+
+    outputs = {}
+    for download_workers in (1, 4):
+        calls.clear()
+        output_dir = tmp_path / f"out{download_workers}"
+        converter = Converter(LABEL_CONFIG, project_dir=".", download_workers=download_workers)
+        converter.convert(str(input_json), str(output_dir), "COCO_WITH_IMAGES", is_dir=False)
+        outputs[download_workers] = json.loads((output_dir / "result.json").read_text())
+        outputs[download_workers].pop("info")
+
+    assert outputs[4] == outputs[1]
+    # 7 distinct images, each downloaded once through the pooled session
+    assert sorted(calls) == sorted((f"https://example.com/{i}.png", True) for i in range(7))
+
+
+def test_media_downloader_keeps_only_recent_urls():
+    calls = []
+
+    def fetch(url, task_id, session, cache_dir):
+        calls.append(url)
+        return os.path.join(cache_dir, os.path.basename(url))
+
+    with MediaDownloader(max_workers=2, fetch=fetch, max_urls=5, cache_dir="images") as downloader:
+        for i in range(100):
+            downloader.submit(f"http://x/{i}.png")
+            assert len(downloader._futures) <= 5
+        # still tracked: shared, forgotten: resolved again (a cache hit in get_local_path)
+        assert downloader.get_local_path("http://x/99.png") == os.path.join("images", "99.png")
+        assert downloader.get_local_path("http://x/0.png") == os.path.join("images", "0.png")
+    assert calls.count("http://x/99.png") == 1 and calls.count("http://x/0.png") == 2
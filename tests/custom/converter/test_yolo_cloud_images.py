@@ -154,12 +154,15 @@ def test_get_local_path_cloud_presign_uses_base64_fileuri(monkeypatch, tmp_path)
         requested.url = u
         response = MagicMock()
         response.content = b"img"
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content = lambda chunk_size: iter([response.content])
         response.raise_for_status = lambda: None
         return response
 
     monkeypatch.setattr(
-        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get",
-        fake_get,
+        "requests.Session.get",
+        lambda session, *args, **kwargs: fake_get(*args, **kwargs),
     )
 
     get_local_path(
@@ -82,13 +82,14 @@ def test_yolo_with_images_storage_proxy(monkeypatch, storage_proxy_task):
         requested.headers = headers or {}
         response = MagicMock()
         response.content = b"\x89PNG\r\n"  # minimal bytes
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content = lambda chunk_size: iter([response.content])
         response.raise_for_status = lambda: None
         return response
 
-    monkeypatch.setattr(
-        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get",
-        fake_get,
-    )
+    # downloads go through a pooled session
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
 
     converter = Converter(
         config=storage_proxy_task.label_config_path,
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils import async_io
+from label_studio_sdk._extensions.label_studio_tools.core.utils.async_io import async_get_local_path
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_local_path
+from label_studio_sdk._extensions.label_studio_tools.core.utils.media_cache import MediaCache
+
+
+def make_client(requested, delay=0.0, statuses=None):
+    active = {"now": 0, "max": 0}
+
+    async def handle(request):
+        requested.append((request.url.path, request.headers.get("Authorization")))
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(delay)
+        active["now"] -= 1
+        status = (statuses or {}).get(request.url.path, 200)
+        return httpx.Response(status, content=request.url.path.encode() if status == 200 else b"")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handle)), active
+
+
+async def test_concurrent_calls_download_once_into_the_cache_shared_with_get_local_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.get_cache_dir", lambda: str(tmp_path)
+    )
+    requested = []
+    client, _ = make_client(requested, delay=0.05)
+
+    paths = await asyncio.gather(
+        *[async_get_local_path("https://example.com/1.jpg", client=client) for _ in range(5)]
+    )
+
+    assert requested == [("/1.jpg", None)]
+    assert len(set(paths)) == 1 and open(paths[0], "rb").read() == b"/1.jpg"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file must be served from the cache")
+
+    monkeypatch.setattr("requests.Session.get", fail)
+    assert get_local_path("https://example.com/1.jpg") == paths[0]
+
+
+async def test_media_cache_is_used_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.get_cache_dir", lambda: str(tmp_path)
+    )
+    threads = []
+    for name in ["get", "add"]:
+        method = getattr(MediaCache, name)
+
+        def record(cache, path, method=method):
+            threads.append(threading.current_thread())
+            return method(cache, path)
+
+        monkeypatch.setattr(MediaCache, name, record)
+    client, _ = make_client([])
+
+    await async_get_local_path("https://example.com/1.jpg", client=client)
+    await async_get_local_path("https://example.com/1.jpg", client=client)
+
+    assert len(threads) == 4
+    assert threading.current_thread() not in threads
+
+
+async def test_upload_falls_back_to_legacy_path_with_auth(tmp_path):
+    requested = []
+    client, _ = make_client(requested, statuses={"/storage-data/uploaded/": 404})
+
+    path = await async_get_local_path(
+        "upload/1/a.png",
+        cache_dir=str(tmp_path),
+        hostname="http://ls.example.com",
+        access_token="legacy-token",
+        client=client,
+    )
+
+    assert requested == [
+        ("/storage-data/uploaded/", "Token legacy-token"),
+        ("/data/upload/1/a.png", "Token legacy-token"),
+    ]
+    assert path.startswith(str(tmp_path)) and open(path, "rb").read() == b"/data/upload/1/a.png"
+
+
+async def test_downloads_are_bounded_per_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_io, "ASYNC_DOWNLOAD_CONCURRENCY", 2)
+    requested = []
+    client, active = make_client(requested, delay=0.02)
+
+    paths = await asyncio.gather(
+        *[async_get_local_path(f"https://example.com/{i}.jpg", cache_dir=str(tmp_path), client=client) for i in range(8)]
+    )
+
+    assert len(set(paths)) == 8 and len(requested) == 8
+    assert active["max"] == 2
+
+
+async def test_http_errors_are_raised(tmp_path):
+    client, _ = make_client([], statuses={"/missing.jpg": 404})
+    with pytest.raises(httpx.HTTPStatusError):
+        await async_get_local_path("https://example.com/missing.jpg", cache_dir=str(tmp_path), client=client)
+    assert list(tmp_path.iterdir()) == []
@@ -8,8 +8,11 @@ import requests
 
 from label_studio_sdk._extensions.label_studio_tools.core.utils.io import (
     _DIR_APP_NAME,
+    IncompleteDownloadError,
     get_base64_content,
+    get_download_session,
     get_local_path,
+    set_download_session,
 )
 
 
@@ -154,10 +157,13 @@ def test_get_local_path_storage_proxy_filename_and_auth(monkeypatch, tmp_path):
         requested.headers = headers or {}
         response = MagicMock()
         response.content = b"imgdata"
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content = lambda chunk_size: iter([response.content])
         response.raise_for_status = lambda: None
         return response
 
-    monkeypatch.setattr("label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
 
     local_path = get_local_path(
         url=url,
@@ -194,7 +200,7 @@ def test_get_base64_content_storage_proxy_rewrite(monkeypatch):
         response.raise_for_status = lambda: None
         return response
 
-    monkeypatch.setattr("label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
 
     content_b64 = get_base64_content(
         url=url,
@@ -228,12 +234,15 @@ def test_get_local_path_upload_is_rewritten_to_storage_proxy(monkeypatch, tmp_pa
         requested.headers = headers or {}
         response = MagicMock()
         response.content = b"imgdata"
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content = lambda chunk_size: iter([response.content])
         response.raise_for_status = lambda: None
         return response
 
     monkeypatch.setattr(
-        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get",
-        fake_get,
+        "requests.Session.get",
+        lambda session, *args, **kwargs: fake_get(*args, **kwargs),
     )
 
     local_path = get_local_path(
@@ -273,10 +282,13 @@ def test_get_local_path_upload_proxy_fallback_to_data_upload(monkeypatch, tmp_pa
         # Second call to data/upload succeeds
         resp = MagicMock()
         resp.content = b"imgdata"
+        resp.status_code = 200
+        resp.headers = {}
+        resp.iter_content = lambda chunk_size: iter([resp.content])
         resp.raise_for_status = lambda: None
         return resp
 
-    monkeypatch.setattr("label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
     with patch("os.path.exists", return_value=False):
         local_path = get_local_path(
             url=url,
@@ -313,7 +325,7 @@ def test_get_base64_content_fallback(monkeypatch):
         resp.raise_for_status = lambda: None
         return resp
 
-    monkeypatch.setattr("label_studio_sdk._extensions.label_studio_tools.core.utils.io.requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
 
     content_b64 = get_base64_content(
         url=url,
@@ -328,3 +340,114 @@ def test_get_base64_content_fallback(monkeypatch):
     assert calls[-1] == fallback_url
 
 
+def make_response(chunks, status_code=200, headers=None, fail_after=None):
+    """Streamed response yielding chunks, raising ConnectionError after fail_after of them"""
+
+    def iter_content(chunk_size):
+        for i, chunk in enumerate(chunks):
+            if i == fail_after:
+                raise requests.exceptions.ConnectionError("connection reset")
+            yield chunk
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content = iter_content
+    response.content = b"".join(chunks)
+    response.raise_for_status = lambda: None
+    return response
+
+
+def test_get_local_path_resumes_interrupted_download(monkeypatch, tmp_path):
+    url = "https://example.com/video.mp4"
+    requests_headers = []
+    responses = [
+        make_response([b"abc", b"def", b"ghi"], headers={"Content-Length": "9", "ETag": '"v1"'}, fail_after=2),
+        make_response([b"ghi"], status_code=206, headers={"Content-Range": "bytes 6-8/9", "ETag": '"v1"'}),
+    ]
+
+    def fake_get(u, stream=False, headers=None, verify=None):
+        assert stream
+        requests_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: fake_get(*args, **kwargs))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_local_path(url=url, cache_dir=str(tmp_path))
+    # nothing a later export would take for a cached file
+    assert [path.name for path in tmp_path.iterdir() if not path.name.endswith((".part", ".validator"))] == []
+
+    local_path = get_local_path(url=url, cache_dir=str(tmp_path))
+    assert open(local_path, "rb").read() == b"abcdefghi"
+    assert requests_headers[1]["Range"] == "bytes=6-"
+    assert requests_headers[1]["If-Range"] == '"v1"'
+    assert [path.name for path in tmp_path.iterdir()] == [local_path.split("/")[-1]]
+
+
+def test_get_local_path_restarts_download_if_file_changed(monkeypatch, tmp_path):
+    url = "https://example.com/video.mp4"
+    responses = [
+        make_response([b"abc", b"def"], headers={"ETag": '"v1"'}, fail_after=1),
+        # If-Range didn't match: the whole new file
+        make_response([b"ABCDEF"], headers={"Content-Length": "6", "ETag": '"v2"'}),
+    ]
+    monkeypatch.setattr(
+        "requests.Session.get",
+        lambda session, url, **kwargs: responses.pop(0),
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_local_path(url=url, cache_dir=str(tmp_path))
+    local_path = get_local_path(url=url, cache_dir=str(tmp_path))
+    assert open(local_path, "rb").read() == b"ABCDEF"
+
+
+def test_get_local_path_rejects_truncated_download(monkeypatch, tmp_path):
+    url = "https://example.com/image.tiff"
+    monkeypatch.setattr(
+        "requests.Session.get",
+        lambda session, url, **kwargs: make_response([b"abc"], headers={"Content-Length": "10"}),
+    )
+
+    with pytest.raises(IncompleteDownloadError):
+        get_local_path(url=url, cache_dir=str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_local_path_verifies_md5_etag(monkeypatch, tmp_path):
+    etag = '"%s"' % hashlib.md5(b"abc").hexdigest()
+    monkeypatch.setattr("label_studio_sdk._extensions.label_studio_tools.core.utils.io.VERIFY_DOWNLOAD_ETAG", True)
+    monkeypatch.setattr(
+        "requests.Session.get",
+        lambda session, url, **kwargs: make_response([b"abd"], headers={"ETag": etag}),
+    )
+    with pytest.raises(IncompleteDownloadError):
+        get_local_path(url="https://example.com/1.jpg", cache_dir=str(tmp_path))
+
+    monkeypatch.setattr(
+        "requests.Session.get",
+        lambda session, url, **kwargs: make_response([b"abc"], headers={"ETag": etag}),
+    )
+    assert open(get_local_path(url="https://example.com/1.jpg", cache_dir=str(tmp_path)), "rb").read() == b"abc"
+
+
+def test_downloads_share_a_pooled_session(tmp_path):
+    assert get_download_session() is get_download_session()
+
+    urls = []
+
+    class RecordingSession:
+        def get(self, url, **kwargs):
+            urls.append(url)
+            return make_response([b"img"])
+
+    set_download_session(RecordingSession())
+    try:
+        get_local_path(url="https://example.com/1.jpg", cache_dir=str(tmp_path))
+        get_base64_content(url="https://example.com/2.jpg")
+    finally:
+        set_download_session(None)
+
+    assert urls == ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+    assert not isinstance(get_download_session(), RecordingSession)
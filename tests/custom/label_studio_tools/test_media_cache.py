@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from label_studio_sdk._extensions.label_studio_tools.core.utils import media_cache
+from label_studio_sdk._extensions.label_studio_tools.core.utils.io import get_local_path, get_media_cache
+from label_studio_sdk._extensions.label_studio_tools.core.utils.media_cache import MediaCache
+
+
+def test_media_cache_evicts_least_recently_used_files(tmp_path):
+    cache = MediaCache(tmp_path, max_bytes=25)
+    (tmp_path / "not-cached.bin").write_bytes(b"x" * 100)
+    for name in ["a", "b"]:
+        (tmp_path / name).write_bytes(b"x" * 10)
+        cache.add(tmp_path / name)
+        time.sleep(0.01)
+    assert cache.get(tmp_path / "a") == tmp_path / "a"
+    time.sleep(0.01)
+
+    (tmp_path / "c").write_bytes(b"x" * 10)
+    cache.add(tmp_path / "c")
+
+    assert sorted(path.name for path in tmp_path.iterdir() if not path.name.startswith(".")) == [
+        "a",
+        "c",
+        "not-cached.bin",
+    ]
+    assert cache.metrics() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "evicted_bytes": 10,
+        "entries": 2,
+        "bytes": 20,
+        "max_bytes": 25,
+    }
+
+
+def test_hit_on_stale_entry_is_seen_by_other_processes(tmp_path):
+    reader, writer = MediaCache(tmp_path, max_bytes=25), MediaCache(tmp_path, max_bytes=25)
+    for name in ["a", "b"]:
+        (tmp_path / name).write_bytes(b"x" * 10)
+        writer.add(tmp_path / name)
+    writer._db.execute("UPDATE entries SET last_access = last_access - 60 WHERE key = 'a'")
+    # a was used a minute ago, the reader's hit makes it more recent than b right away, not on a later flush
+    assert reader.get(tmp_path / "a") == tmp_path / "a"
+
+    (tmp_path / "c").write_bytes(b"x" * 10)
+    writer.add(tmp_path / "c")
+
+    assert sorted(path.name for path in tmp_path.iterdir() if not path.name.startswith(".")) == ["a", "c"]
+
+
+def test_media_cache_removes_abandoned_partial_downloads(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ["old.jpg.part", "old.jpg.part.validator", "sub/old.png.part", "new.jpg.part", "kept.jpg"]:
+        (tmp_path / name).write_bytes(b"x")
+    day_ago = time.time() - 25 * 3600
+    for name in ["old.jpg.part", "old.jpg.part.validator", "sub/old.png.part", "kept.jpg"]:
+        os.utime(tmp_path / name, (day_ago, day_ago))
+
+    MediaCache(tmp_path, max_bytes=0).evict()
+
+    left = sorted(str(path.relative_to(tmp_path)) for path in tmp_path.rglob("*") if path.is_file())
+    assert [name for name in left if not name.startswith(".")] == ["kept.jpg", "new.jpg.part"]
+
+
+def test_pending_hits_are_flushed_at_exit(tmp_path):
+    cache = MediaCache(tmp_path)
+    (tmp_path / "a").write_bytes(b"x" * 10)
+    cache.get(tmp_path / "a")
+
+    media_cache._flush_open_caches()
+
+    assert MediaCache(tmp_path).metrics()["entries"] == 1
+
+
+def test_get_local_path_downloads_each_file_once_into_media_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "label_studio_sdk._extensions.label_studio_tools.core.utils.io.get_cache_dir", lambda: str(tmp_path)
+    )
+    requested = []
+    lock = threading.Lock()
+
+    def fake_get(session, url, **kwargs):
+        with lock:
+            requested.append(url)
+        time.sleep(0.05)
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content = lambda chunk_size: iter([b"img"])
+        response.raise_for_status = lambda: None
+        return response
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(pool.map(lambda _: get_local_path("https://example.com/1.jpg"), range(4)))
+
+    assert requested == ["https://example.com/1.jpg"]
+    assert len(set(paths)) == 1 and open(paths[0], "rb").read() == b"img"
+    metrics = get_media_cache().metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["entries"]) == (3, 1, 1)
@@ -0,0 +1,208 @@
+import json
+import threading
+import typing
+
+import httpx
+import pytest
+from conftest import mock_client
+
+from label_studio_sdk._extensions.bulk_import import BulkImportFailedError, iter_source_tasks, iter_task_chunks
+
+
+class _FakeImportServer:
+    """Import endpoints of a server that imports asynchronously (or synchronously, for Community edition)."""
+
+    def __init__(
+        self,
+        asynchronous: bool = True,
+        fail_first_task_ids: typing.Iterable[int] = (),
+        failing_status_checks: int = 0,
+        stuck: bool = False,
+    ):
+        self.asynchronous = asynchronous
+        self.fail_first_task_ids = set(fail_first_task_ids)
+        # the connection drops on the first status checks, and a stuck server never finishes an import
+        self.failing_status_checks = failing_status_checks
+        self.stuck = stuck
+        self.uploaded: typing.List[typing.List[int]] = []
+        self.imports: typing.Dict[int, int] = {}
+        self.polls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path == "/api/projects/1/import":
+            ids = [task["data"]["id"] for task in json.loads(request.content)]
+            if ids[0] in self.fail_first_task_ids:
+                return httpx.Response(400, json={"detail": "invalid task"})
+            self.uploaded.append(ids)
+            if not self.asynchronous:
+                return httpx.Response(201, json={"task_count": len(ids)})
+            import_id = len(self.imports) + 100
+            self.imports[import_id] = len(ids)
+            return httpx.Response(201, json={"import": import_id})
+        if request.method == "GET" and request.url.path.startswith("/api/projects/1/imports/"):
+            self.polls += 1
+            if self.polls <= self.failing_status_checks:
+                raise httpx.ConnectError("connection reset", request=request)
+            import_id = int(request.url.path.rstrip("/").rsplit("/", 1)[1])
+            status = "in_progress" if self.stuck else "completed"
+            return httpx.Response(200, json={"id": import_id, "status": status, "task_count": self.imports[import_id]})
+        return httpx.Response(404, json={"detail": "Not found."})
+
+
+def _tasks(count: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [{"data": {"id": i, "text": "x" * 10}} for i in range(count)]
+
+
+def test_iter_task_chunks_bounds_count_and_size() -> None:
+    assert [len(chunk) for chunk in iter_task_chunks(_tasks(10), chunk_size=4, max_chunk_bytes=10**6)] == [4, 4, 2]
+    task_bytes = len(json.dumps(_tasks(1)[0], separators=(",", ":"))) + 1
+    by_size = list(iter_task_chunks(_tasks(10), chunk_size=100, max_chunk_bytes=2 + 3 * task_bytes))
+    assert [len(chunk) for chunk in by_size] == [3, 3, 3, 1]
+    # a task larger than the limit still gets a chunk of its own
+    assert [len(chunk) for chunk in iter_task_chunks(_tasks(2), chunk_size=100, max_chunk_bytes=1)] == [1, 1]
+
+
+def test_iter_source_tasks_reads_files(tmp_path) -> None:
+    (tmp_path / "tasks.json").write_text(json.dumps([{"data": {"n": 1.5}}, {"data": {"n": 2}}]))
+    (tmp_path / "tasks.ndjson").write_text('{"data": {"n": 1}}\n\n{"data": {"n": 2}}\n')
+    (tmp_path / "tasks.csv").write_text("text,label\nhello,A\nworld,B\n")
+    assert list(iter_source_tasks(tmp_path / "tasks.json")) == [{"data": {"n": 1.5}}, {"data": {"n": 2}}]
+    assert list(iter_source_tasks(str(tmp_path / "tasks.ndjson"))) == [{"data": {"n": 1}}, {"data": {"n": 2}}]
+    assert list(iter_source_tasks(tmp_path / "tasks.csv")) == [
+        {"text": "hello", "label": "A"},
+        {"text": "world", "label": "B"},
+    ]
+    with pytest.raises(ValueError):
+        list(iter_source_tasks(tmp_path / "tasks.xml"))
+
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_bulk_import_uploads_every_chunk(asynchronous: bool) -> None:
+    server = _FakeImportServer(asynchronous=asynchronous)
+    client = mock_client(server)
+    result = client.projects.bulk_import(1, iter(_tasks(25)), chunk_size=10, concurrency=3, poll_interval=0)
+    assert sorted(task_id for chunk in server.uploaded for task_id in chunk) == list(range(25))
+    assert result.chunks == 3 and result.task_count == 25
+    assert len(result.import_ids) == (3 if asynchronous else 0)
+    assert server.polls == (3 if asynchronous else 0)
+
+
+def test_bulk_import_resumes_from_checkpoint(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    server = _FakeImportServer(fail_first_task_ids=[10])
+    with pytest.raises(BulkImportFailedError) as error:
+        mock_client(server).projects.bulk_import(1, _tasks(30), chunk_size=10, checkpoint=checkpoint, poll_interval=0)
+    assert list(error.value.failed) == [1]
+    assert error.value.status_code is None
+
+    server.fail_first_task_ids.clear()
+    server.uploaded.clear()
+    client = mock_client(server)
+    result = client.projects.bulk_import(1, _tasks(30), chunk_size=10, checkpoint=checkpoint, poll_interval=0)
+    # only the chunk that failed is uploaded again
+    assert server.uploaded == [list(range(10, 20))]
+    assert result.skipped_chunks == 2 and result.task_count == 30
+
+    with pytest.raises(ValueError):
+        mock_client(server).projects.bulk_import(1, _tasks(30), chunk_size=5, checkpoint=checkpoint)
+    # same settings, other tasks
+    with pytest.raises(ValueError):
+        mock_client(server).projects.bulk_import(1, _tasks(31)[1:], chunk_size=10, checkpoint=checkpoint)
+
+
+def test_bulk_import_interrupted_keeps_uploaded_chunks_in_checkpoint(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    server = _FakeImportServer()
+
+    def _interrupted_source() -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        yield from _tasks(3)
+        raise KeyboardInterrupt
+
+    client = mock_client(server)
+    with pytest.raises(KeyboardInterrupt):
+        client.projects.bulk_import(1, _interrupted_source(), chunk_size=1, concurrency=4, checkpoint=checkpoint)
+
+    uploaded = sorted(chunk[0] for chunk in server.uploaded)
+    assert uploaded
+    assert sorted(int(index) for index in json.loads(checkpoint.read_text())["pending"]) == uploaded
+
+
+def test_bulk_import_checkpoint_is_tied_to_the_source_file(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    source = tmp_path / "tasks.ndjson"
+    source.write_text("".join(json.dumps(task) + "\n" for task in _tasks(20)))
+    server = _FakeImportServer()
+    mock_client(server).projects.bulk_import(1, source, chunk_size=10, checkpoint=checkpoint, poll_interval=0)
+
+    # tasks appended to the file after the first run
+    with source.open("a") as f:
+        f.write(json.dumps(_tasks(21)[-1]) + "\n")
+    with pytest.raises(ValueError):
+        mock_client(server).projects.bulk_import(1, source, chunk_size=10, checkpoint=checkpoint)
+
+
+def test_bulk_import_polls_pending_imports_instead_of_uploading_again(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    server = _FakeImportServer()
+    server.imports[7] = 10
+    settings = {"project": 1, "chunk_size": 10, "max_chunk_bytes": 64 * 1024 * 1024, "source": None}
+    checkpoint.write_text(json.dumps({"settings": settings, "completed": {}, "pending": {"0": 7}}))
+
+    client = mock_client(server)
+    result = client.projects.bulk_import(1, _tasks(20), chunk_size=10, checkpoint=checkpoint, poll_interval=0)
+    assert server.uploaded == [list(range(10, 20))]
+    assert result.task_count == 20 and 7 in result.import_ids
+    assert json.loads(checkpoint.read_text())["completed"] == {"0": 10, "1": 10}
+
+
+def test_bulk_import_polls_pending_imports_concurrently(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    server = _FakeImportServer()
+    server.imports.update({7: 10, 8: 10, 9: 10})
+    settings = {"project": 1, "chunk_size": 10, "max_chunk_bytes": 64 * 1024 * 1024, "source": None}
+    checkpoint.write_text(json.dumps({"settings": settings, "completed": {}, "pending": {"0": 7, "1": 8, "2": 9}}))
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        # each status request waits until all three are in flight
+        barrier.wait()
+        return server(request)
+
+    client = mock_client(_handler)
+    result = client.projects.bulk_import(1, _tasks(30), chunk_size=10, concurrency=3, checkpoint=checkpoint)
+    assert server.polls == 3 and result.task_count == 30
+
+
+def test_bulk_import_retries_failed_status_checks() -> None:
+    server = _FakeImportServer(failing_status_checks=2)
+    result = mock_client(server).projects.bulk_import(1, _tasks(30), chunk_size=10, concurrency=3, poll_interval=0)
+    assert result.task_count == 30
+    # two imports were checked again after their status request failed
+    assert server.polls == 5
+
+
+def test_bulk_import_poll_timeout_keeps_imports_pending(tmp_path) -> None:
+    checkpoint = tmp_path / "import.checkpoint"
+    server = _FakeImportServer(stuck=True)
+    with pytest.raises(BulkImportFailedError) as error:
+        mock_client(server).projects.bulk_import(
+            1, _tasks(20), chunk_size=10, checkpoint=checkpoint, poll_interval=0.01, poll_timeout=0.05
+        )
+    assert sorted(error.value.failed) == [0, 1]
+    pending = json.loads(checkpoint.read_text())["pending"]
+    assert sorted(pending) == ["0", "1"] and sorted(pending.values()) == [100, 101]
+
+
+async def test_async_bulk_import_retries_failed_status_checks() -> None:
+    server = _FakeImportServer(failing_status_checks=2)
+    client = mock_client(server, is_async=True)
+    result = await client.projects.bulk_import(1, _tasks(30), chunk_size=10, concurrency=3, poll_interval=0)
+    assert result.task_count == 30 and server.polls == 5
+
+
+async def test_async_bulk_import() -> None:
+    server = _FakeImportServer()
+    client = mock_client(server, is_async=True)
+    result = await client.projects.bulk_import(1, _tasks(25), chunk_size=10, concurrency=2, poll_interval=0)
+    assert sorted(task_id for chunk in server.uploaded for task_id in chunk) == list(range(25))
+    assert result.task_count == 25 and len(result.import_ids) == 3
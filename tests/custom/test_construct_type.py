@@ -0,0 +1,112 @@
+import datetime as dt
+import sys
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from label_studio_sdk.core import construct_plans
+from label_studio_sdk.core.construct_plans import _construct_plan_cache, _get_construct_plan
+from label_studio_sdk.core.unchecked_base_model import UncheckedBaseModel, construct_type
+from label_studio_sdk.tasks import raw_client as tasks_raw_client
+from label_studio_sdk.types.annotation import Annotation
+from label_studio_sdk.types.lse_task import LseTask
+from label_studio_sdk.types.paginated_role_based_task_list import PaginatedRoleBasedTaskList
+
+
+class _Node(UncheckedBaseModel):
+    name: str
+    count: typing.Optional[int] = None
+    label: str = "node"
+    children: typing.Optional[typing.List["_Node"]] = None
+
+
+_Node.model_rebuild()
+
+
+def test_generated_construct_type_is_hooked() -> None:
+    # the last line of the generated unchecked_base_model.py, see the .fernignore entry of construct_plans.py
+    assert construct_type is construct_plans.construct_type
+    assert tasks_raw_client.construct_type is construct_plans.construct_type
+    construct_type(type_=Annotation, object_={"id": 1})
+    assert Annotation in construct_plans._model_construct_plan_cache
+
+
+def test_construct_plan_is_compiled_once_per_type() -> None:
+    type_ = typing.Optional[typing.List[typing.Dict[str, int]]]
+    plan = _get_construct_plan(type_)
+    assert _get_construct_plan(type_) is plan
+    assert (type_, None) in _construct_plan_cache
+
+
+def test_lenient_coercion_is_unchanged() -> None:
+    assert construct_type(type_=typing.Optional[int], object_="12") == 12
+    assert construct_type(type_=typing.Optional[int], object_="not a number") == "not a number"
+    assert construct_type(type_=bool, object_="TRUE") is True
+    assert construct_type(type_=typing.Dict[str, typing.List[int]], object_={"a": ["1", 2]}) == {"a": [1, 2]}
+    assert construct_type(type_=typing.List[int], object_="not a list") == "not a list"
+    assert construct_type(type_=typing.Set[int], object_=["1", "2"]) == {1, 2}
+    assert construct_type(type_=typing.Optional[dt.datetime], object_="2024-01-01T00:00:00Z") == dt.datetime(
+        2024, 1, 1, tzinfo=dt.timezone.utc
+    )
+    assert construct_type(type_=typing.Any, object_=None) is None
+
+
+def test_collections_are_copied() -> None:
+    data = {"key": [1, 2]}
+    constructed = construct_type(type_=typing.Dict[str, typing.Any], object_=data)
+    assert constructed == data and constructed is not data
+
+
+def test_model_construct_keeps_extras_and_fields_set() -> None:
+    annotation = construct_type(type_=Annotation, object_={"id": "1", "completed_by": "7", "custom": {"a": 1}})
+    assert isinstance(annotation, Annotation)
+    assert annotation.id == 1 and annotation.completed_by == 7
+    assert annotation.custom == {"a": 1}  # type: ignore[attr-defined]
+    assert {"id", "completed_by", "custom"} <= annotation.model_fields_set
+    assert annotation.result is None
+
+
+def test_recursive_model_and_defaults() -> None:
+    node = construct_type(type_=_Node, object_={"name": "root", "children": [{"name": "leaf", "count": "3"}]})
+    assert isinstance(node.children[0], _Node)
+    assert node.children[0].count == 3
+    assert node.label == "node"
+
+
+def test_role_based_task_page() -> None:
+    page = construct_type(
+        type_=PaginatedRoleBasedTaskList,
+        object_={
+            "tasks": [{"id": 1, "data": {"text": "a"}, "annotations": [{"id": 5, "result": []}]}],
+            "total": 1,
+            "total_annotations": 1,
+            "total_predictions": 0,
+        },
+    )
+    assert isinstance(page.tasks[0], LseTask)
+    assert page.tasks[0].annotations == [{"id": 5, "result": []}]
+
+
+def test_plans_compiled_concurrently_by_threads() -> None:
+    page = {
+        "tasks": [{"id": 1, "data": {"text": "a"}, "annotations": [{"id": 5, "result": []}]}],
+        "total": 1,
+        "total_annotations": 1,
+        "total_predictions": 0,
+    }
+
+    def construct(barrier: threading.Barrier) -> PaginatedRoleBasedTaskList:
+        barrier.wait()
+        return construct_type(type_=PaginatedRoleBasedTaskList, object_=page)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(100):
+            _construct_plan_cache.clear()
+            barrier = threading.Barrier(8)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                pages = list(pool.map(lambda _: construct(barrier), range(8)))
+            assert all(isinstance(p.tasks[0], LseTask) for p in pages)
+    finally:
+        sys.setswitchinterval(switch_interval)
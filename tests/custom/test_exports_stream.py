@@ -0,0 +1,53 @@
+import json
+
+import httpx
+import pytest
+from conftest import ChunkedStream, mock_client
+
+TASKS = [{"id": i, "data": {"text": f"task {i}"}, "annotations": []} for i in range(50)]
+EXPORT = json.dumps(TASKS).encode()
+
+
+def _handler(fail: bool = False):
+    def _handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/version/":
+            return httpx.Response(200, json={"edition": "Community"})
+        if request.url.path == "/api/projects/1/export":
+            content = EXPORT[: len(EXPORT) // 2] if fail else EXPORT
+            chunks = [content[start : start + 100] for start in range(0, len(content), 100)]
+            return httpx.Response(200, stream=ChunkedStream(chunks))
+        return httpx.Response(404, json={"detail": "Not found."})
+
+    return _handle
+
+
+def test_as_file_streams_to_path(tmp_path) -> None:
+    path = mock_client(_handler()).projects.exports.as_file(1, path=str(tmp_path / "export.json"), chunk_size=64)
+    assert path == tmp_path / "export.json"
+    assert json.loads(path.read_bytes()) == TASKS
+    # no temporary file is left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["export.json"]
+
+
+def test_as_file_without_path_still_returns_a_file_object() -> None:
+    assert json.load(mock_client(_handler()).projects.exports.as_file(1)) == TASKS
+
+
+def test_iter_tasks_yields_tasks_one_by_one() -> None:
+    tasks = mock_client(_handler()).projects.exports.iter_tasks(1)
+    assert next(tasks) == TASKS[0]
+    assert list(tasks) == TASKS[1:]
+
+
+def test_iter_tasks_raises_on_truncated_export() -> None:
+    import ijson
+
+    with pytest.raises(ijson.IncompleteJSONError):
+        list(mock_client(_handler(fail=True)).projects.exports.iter_tasks(1))
+
+
+async def test_async_as_file_and_iter_tasks(tmp_path) -> None:
+    client = mock_client(_handler(), is_async=True)
+    path = await client.projects.exports.as_file(1, path=str(tmp_path / "export.json"))
+    assert json.loads(path.read_bytes()) == TASKS
+    assert [task async for task in client.projects.exports.iter_tasks(1)] == TASKS
@@ -0,0 +1,92 @@
+import datetime as dt
+import decimal
+import enum
+import typing
+
+import httpx
+import pytest
+
+from label_studio_sdk.core.http_client_ext import HttpClientExt, get_json_content
+from label_studio_sdk.core.jsonable_encoder import jsonable_encoder
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Size(str, enum.Enum):
+    SMALL = "small"
+
+
+def _encoded_by_httpx(body: typing.Any) -> bytes:
+    # what the jsonable_encoder path ends up sending
+    return httpx.Request("POST", "http://example.com", json=jsonable_encoder(body)).content
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        [],
+        [{"data": {"text": "é/ü", "n": 1, "x": 0.5, "ok": True, "none": None}}],
+        {"nested": [[1, 2], {"a": (3, 4)}]},
+        {1: "int key"},
+        {True: "bool key", None: "none key", 0.5: "float key"},
+        {"size": _Size.SMALL, _Size.SMALL: 1},
+    ],
+)
+def test_native_bodies_are_encoded_like_the_jsonable_encoder_path(body: typing.Any) -> None:
+    content = get_json_content(json=body, data=None, content=None, files=None, request_options=None)
+    assert content == _encoded_by_httpx(body)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"when": dt.datetime(2024, 1, 1)},
+        [{"color": _Color.RED}],
+        {"amount": decimal.Decimal("1.5")},
+        {"raw": b"bytes"},
+        {"omitted": ...},
+        {"tags": {"a"}},
+        {"score": float("nan")},
+        {_Color.RED: 1},
+    ],
+)
+def test_other_bodies_fall_back_to_jsonable_encoder(body: typing.Any) -> None:
+    assert get_json_content(json=body, data=None, content=None, files=None, request_options=None) is None
+
+
+def test_fast_path_is_skipped_for_additional_body_parameters_and_files() -> None:
+    body = {"a": 1}
+    assert get_json_content(
+        json=body, data=None, content=None, files=None, request_options={"additional_body_parameters": {"b": 2}}
+    ) is None
+    assert get_json_content(json=body, data=None, content=None, files={"file": b""}, request_options=None) is None
+    assert get_json_content(json=body, data={"b": 2}, content=None, files=None, request_options=None) is None
+
+
+def test_http_client_sends_fast_path_body_as_json() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = HttpClientExt(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "http://example.com",
+    )
+    client.request("api/import", method="POST", json=[{"data": {"text": "a"}}])
+    client.request("api/import", method="POST", json={"when": dt.date(2024, 1, 1)})
+    with client.stream("api/import", method="POST", json={"a": 1}, headers={"Content-Type": "application/json+x"}):
+        pass
+
+    assert requests[0].headers["content-type"] == "application/json"
+    assert requests[0].content == b'[{"data":{"text":"a"}}]'
+    assert requests[1].headers["content-type"] == "application/json"
+    assert requests[1].content == b'{"when":"2024-01-01"}'
+    assert requests[2].headers.get_list("content-type") == ["application/json+x"]
+    assert requests[2].content == b'{"a":1}'
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import typing
+
+import pytest
+
+# Heavy optional dependencies that must only be imported when the feature using them is called
+HEAVY_MODULES = ["pandas", "numpy", "cv2", "nltk", "PIL", "jsf", "faker", "smart_open"]
+
+# Opt-in wall-clock budget for `from label_studio_sdk import LabelStudio` (in seconds); timing depends on
+# the machine and on parallel test load, so the check only runs when the budget is set explicitly
+IMPORT_TIME_BUDGET = os.getenv("LABEL_STUDIO_SDK_IMPORT_TIME_BUDGET")
+
+
+def _importtime(statement: str) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """Run `python -X importtime` in a clean interpreter and return {module: (nesting level, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        # nested imports are indented by two spaces per level after the separator's own space
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (level, int(cumulative_us))
+    return modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from label_studio_sdk import LabelStudio",
+        "from label_studio_sdk import AsyncLabelStudio",
+        "from label_studio_sdk.converter import Converter",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(statement: str) -> None:
+    modules = _importtime(statement)
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    assert loaded == [], f"`{statement}` eagerly imports {loaded}"
+
+
+@pytest.mark.skipif(IMPORT_TIME_BUDGET is None, reason="set LABEL_STUDIO_SDK_IMPORT_TIME_BUDGET to check import time")
+def test_client_import_time_budget() -> None:
+    modules = _importtime("from label_studio_sdk import LabelStudio")
+    # top-level entries of the importtime tree add up to the whole import, minus interpreter startup (site)
+    total_seconds = sum(cumulative for name, (level, cumulative) in modules.items() if level == 0 and name != "site") / 1e6
+    assert total_seconds < float(IMPORT_TIME_BUDGET)
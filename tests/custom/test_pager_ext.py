@@ -0,0 +1,121 @@
+import time
+import typing
+
+import httpx
+import pytest
+from conftest import mock_client
+
+from label_studio_sdk._extensions.pager_ext import AsyncPagerExt, SyncPagerExt
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.pagination import AsyncPager, SyncPager
+
+
+def _sync_pages(num_pages: int, page_size: int = 3, fetched: typing.Optional[list] = None) -> SyncPager:
+    # Mimics the raw clients: `has_next` stays true until the server answers 404 past the last page
+    def _page(number: int) -> SyncPager:
+        if fetched is not None:
+            fetched.append(number)
+        if number > num_pages:
+            raise ApiError(status_code=404, body="Invalid page.")
+        items = [(number - 1) * page_size + i for i in range(page_size)]
+        return SyncPager(has_next=True, items=items, get_next=lambda: _page(number + 1), response=None)
+
+    return _page(1)
+
+
+def _async_pages(num_pages: int, page_size: int = 3) -> typing.Awaitable[AsyncPager]:
+    async def _page(number: int) -> AsyncPager:
+        if number > num_pages:
+            raise ApiError(status_code=404, body="Invalid page.")
+        items = [(number - 1) * page_size + i for i in range(page_size)]
+        return AsyncPager(has_next=True, items=items, get_next=lambda: _page(number + 1), response=None)
+
+    return _page(1)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_sync_pager_prefetch_keeps_order_and_stops_on_404(prefetch: int) -> None:
+    pager = SyncPagerExt.from_sync_pager(_sync_pages(5), prefetch=prefetch)
+    assert list(pager) == list(range(15))
+
+
+def test_sync_pager_prefetch_bounds_buffered_pages() -> None:
+    fetched: list = []
+    pager = SyncPagerExt.from_sync_pager(_sync_pages(50, fetched=fetched), prefetch=2)
+    pages = pager.iter_pages()
+    next(pages)
+    # give the background thread a chance to run ahead as far as it is allowed to
+    time.sleep(0.3)
+    # the first page plus at most two prefetched pages
+    assert max(fetched) <= 3
+    pages.close()
+
+
+def test_sync_pager_prefetch_propagates_other_errors() -> None:
+    def _fail() -> SyncPager:
+        raise ApiError(status_code=500, body="boom")
+
+    pager = SyncPagerExt.from_sync_pager(SyncPager(has_next=True, items=[1], get_next=_fail, response=None), prefetch=2)
+    with pytest.raises(ApiError):
+        list(pager)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+async def test_async_pager_prefetch_keeps_order_and_stops_on_404(prefetch: int) -> None:
+    pager = await AsyncPagerExt.from_async_pager(await _async_pages(5), prefetch=prefetch)
+    assert [item async for item in pager] == list(range(15))
+
+
+def _tasks_handler(total: int, page_size: int, requested: list) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        start = (page - 1) * page_size
+        if start >= total:
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        # later pages answer faster, so unordered mode really sees them out of order
+        time.sleep(0.01 * (total // page_size - page + 1))
+        ids = range(start, min(start + page_size, total))
+        return httpx.Response(
+            200,
+            json={
+                "tasks": [{"id": i, "data": {}} for i in ids],
+                "total": total,
+                "total_annotations": 0,
+                "total_predictions": 0,
+            },
+        )
+
+    return _handler
+
+
+def test_tasks_list_concurrent_yields_in_page_order() -> None:
+    requested: list = []
+    client = mock_client(_tasks_handler(95, 10, requested))
+    tasks = client.tasks.list(project=1, page_size=10, concurrency=4)
+    assert [task.id for task in tasks] == list(range(95))
+    # ten pages plus the single 404 that ends the pagination
+    assert sorted(requested) == list(range(1, 12))
+
+
+def test_tasks_list_concurrent_unordered_yields_every_task_once() -> None:
+    client = mock_client(_tasks_handler(95, 10, []))
+    ids = [task.id for task in client.tasks.list(project=1, page_size=10, concurrency=4, ordered=False)]
+    assert sorted(ids) == list(range(95))
+
+
+async def test_async_tasks_list_concurrent_yields_in_page_order() -> None:
+    client = mock_client(_tasks_handler(95, 10, []), is_async=True)
+    tasks = await client.tasks.list(project=1, page_size=10, concurrency=4)
+    assert [task.id async for task in tasks] == list(range(95))
+
+
+@pytest.mark.parametrize(
+    "options", [{"concurrency": 4, "prefetch": 2}, {"ordered": False}, {"ordered": False, "prefetch": 2}]
+)
+def test_tasks_list_rejects_conflicting_paging_options(options: dict) -> None:
+    requested: list = []
+    client = mock_client(_tasks_handler(95, 10, requested))
+    with pytest.raises(ValueError):
+        client.tasks.list(project=1, page_size=10, **options)
+    assert requested == []
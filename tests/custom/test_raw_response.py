@@ -0,0 +1,56 @@
+import httpx
+from conftest import mock_client
+
+from label_studio_sdk.types.annotation import Annotation
+from label_studio_sdk.types.lse_task import LseTask
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/tasks/":
+        if int(request.url.params["page"]) > 2:
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        return httpx.Response(
+            200,
+            json={
+                "tasks": [{"id": int(request.url.params["page"]), "data": {"text": "hello"}}],
+                "total": 2,
+                "total_annotations": 0,
+                "total_predictions": 0,
+            },
+        )
+    if request.url.path == "/api/tasks/1/annotations/":
+        return httpx.Response(200, json=[{"id": 10, "result": [], "completed_by": 1}])
+    if request.url.path == "/api/projects/1/":
+        return httpx.Response(200, json={"id": 1, "title": "Project", "label_config": "<View/>"})
+    return httpx.Response(404, json={"detail": "Not found."})
+
+
+def test_model_mode_is_default() -> None:
+    client = mock_client(_handler)
+    assert all(isinstance(task, LseTask) for task in client.tasks.list(project=1))
+    assert isinstance(client.annotations.list(id=1)[0], Annotation)
+
+
+def test_client_level_raw_mode_returns_plain_dicts() -> None:
+    client = mock_client(_handler, response_mode="raw")
+    tasks = list(client.tasks.list(project=1))
+    assert tasks == [{"id": 1, "data": {"text": "hello"}}, {"id": 2, "data": {"text": "hello"}}]
+    assert type(tasks[0]) is dict
+    assert client.annotations.list(id=1) == [{"id": 10, "result": [], "completed_by": 1}]
+    project = client.projects.get(id=1)
+    assert project["title"] == "Project"
+
+
+def test_request_options_override_client_mode() -> None:
+    raw = list(mock_client(_handler).tasks.list(project=1, request_options={"response_mode": "raw"}))
+    assert type(raw[0]) is dict
+    client = mock_client(_handler, response_mode="raw")
+    models = list(client.tasks.list(project=1, request_options={"response_mode": "model"}))
+    assert isinstance(models[0], LseTask)
+
+
+async def test_async_raw_mode_returns_plain_dicts() -> None:
+    client = mock_client(_handler, is_async=True, response_mode="raw")
+    tasks = await client.tasks.list(project=1)
+    assert [task async for task in tasks] == [{"id": 1, "data": {"text": "hello"}}, {"id": 2, "data": {"text": "hello"}}]
+    assert (await client.annotations.list(id=1))[0]["id"] == 10
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+import pytest
+from conftest import mock_client
+
+from label_studio_sdk import AsyncLabelStudio
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.request_coalescing import RequestCoalescer
+
+
+def _client(requested: typing.List[str], status_code: int = 200, **kwargs: typing.Any) -> AsyncLabelStudio:
+    async def handle(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        await asyncio.sleep(0.02)
+        if request.url.path == "/api/version/":
+            return httpx.Response(status_code, json={"release": "1.0"})
+        project_id = int(request.url.path.split("/")[-2])
+        return httpx.Response(status_code, json={"id": project_id, "title": "Project", "label_config": "<View/>"})
+
+    return mock_client(handle, is_async=True, **kwargs)
+
+
+async def test_concurrent_identical_requests_share_one_response() -> None:
+    requested: typing.List[str] = []
+    client = _client(requested, coalesce_requests=True, response_mode="raw")
+
+    projects = await asyncio.gather(*[client.projects.get(1) for _ in range(10)])
+
+    assert requested == ["/api/projects/1/"]
+    assert all(project == {"id": 1, "title": "Project", "label_config": "<View/>"} for project in projects)
+    # every caller decodes its own copy
+    projects[0]["title"] = "Changed"
+    assert projects[1]["title"] == "Project"
+    assert client.request_coalescer is not None
+    assert client.request_coalescer.stats() == {"requests": 10, "coalesced": 9, "in_flight": 0}
+
+    await client.projects.get(1)
+    assert len(requested) == 2
+
+
+async def test_only_allowed_endpoints_and_identical_requests_are_coalesced() -> None:
+    requested: typing.List[str] = []
+    client = _client(requested, coalesce_requests=["api/projects/*/"])
+
+    await asyncio.gather(
+        *[client.projects.get(1) for _ in range(3)],
+        client.projects.get(2),
+        *[client.versions.get() for _ in range(3)],
+    )
+
+    assert sorted(requested) == ["/api/projects/1/", "/api/projects/2/"] + ["/api/version/"] * 3
+    assert client.request_coalescer.stats()["coalesced"] == 2  # type: ignore[union-attr]
+
+
+async def test_errors_fan_out_to_every_caller() -> None:
+    requested: typing.List[str] = []
+    client = _client(requested, status_code=404, coalesce_requests=True)
+
+    results = await asyncio.gather(*[client.projects.get(1) for _ in range(5)], return_exceptions=True)
+
+    assert requested == ["/api/projects/1/"]
+    assert all(isinstance(result, ApiError) and result.status_code == 404 for result in results)
+
+
+async def test_connection_errors_fan_out_to_every_caller() -> None:
+    calls = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = mock_client(handle, is_async=True, max_retries=0, coalesce_requests=True)
+
+    results = await asyncio.gather(*[client.versions.get() for _ in range(3)], return_exceptions=True)
+
+    assert len(calls) == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+
+async def test_coalescing_is_off_by_default() -> None:
+    requested: typing.List[str] = []
+    client = _client(requested)
+
+    await asyncio.gather(*[client.projects.get(1) for _ in range(3)])
+
+    assert requested == ["/api/projects/1/"] * 3
+    assert client.request_coalescer is None
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH", "DELETE"])
+def test_non_idempotent_methods_are_never_coalesced(method: str) -> None:
+    assert not RequestCoalescer().allows(method, "api/projects/1/")
+    assert RequestCoalescer(endpoints=["/api/projects/*/"]).allows("GET", "api/projects/1/")
+
+
+async def test_every_caller_gets_its_own_response_copy() -> None:
+    coalescer = RequestCoalescer()
+    sent: typing.List[httpx.Response] = []
+
+    async def send() -> httpx.Response:
+        await asyncio.sleep(0.01)
+        sent.append(httpx.Response(200, json={"id": 1}))
+        return sent[-1]
+
+    responses = await asyncio.gather(*[coalescer.request("key", send) for _ in range(3)])
+
+    assert len(sent) == 1
+    assert len({id(response) for response in [*responses, *sent]}) == 4
+    assert all(response.json() == {"id": 1} for response in responses)
+
+
+def test_requests_are_only_shared_within_one_event_loop() -> None:
+    coalescer = RequestCoalescer()
+    barrier = threading.Barrier(2)
+    sent: typing.List[int] = []
+
+    async def send() -> httpx.Response:
+        sent.append(threading.get_ident())
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    async def both_loops_request() -> None:
+        await asyncio.to_thread(barrier.wait)
+        await coalescer.request("key", send)
+
+    threads = [threading.Thread(target=asyncio.run, args=(both_loops_request(),)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(sent)) == 2
+    assert coalescer.stats() == {"requests": 2, "coalesced": 0, "in_flight": 0}
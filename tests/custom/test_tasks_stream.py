@@ -0,0 +1,73 @@
+import json
+import typing
+
+import httpx
+import pytest
+from conftest import ChunkedStream, mock_client
+
+from label_studio_sdk.core.api_error import ApiError
+from label_studio_sdk.core.json_stream import iter_json_items
+from label_studio_sdk.types.lse_task import LseTask
+
+
+def _page_chunks(ids: typing.List[int], sent: typing.List[int]) -> typing.Iterator[bytes]:
+    # one chunk per task, recording how far the "download" got
+    yield b'{"total": 3, "tasks": ['
+    for position, task_id in enumerate(ids):
+        sent.append(task_id)
+        yield (b"," if position else b"") + json.dumps({"id": task_id, "data": {"value": 1.5}}).encode()
+    yield b'], "total_annotations": 0, "total_predictions": 0}'
+
+
+def _tasks_handler(sent: typing.List[int], requested: typing.List[httpx.Request]):
+    pages = {1: [1, 2], 2: [3]}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request)
+        page = int(request.url.params["page"])
+        if page not in pages:
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        return httpx.Response(200, stream=ChunkedStream(_page_chunks(pages[page], sent)))
+
+    return _handler
+
+
+def test_iter_json_items_yields_each_item_as_soon_as_it_is_complete() -> None:
+    sent: typing.List[int] = []
+    items = iter_json_items(_page_chunks([1, 2, 3], sent), "tasks.item")
+    assert next(items) == {"id": 1, "data": {"value": 1.5}}
+    # the rest of the body has not been read yet
+    assert 3 not in sent
+    assert [item["id"] for item in items] == [2, 3]
+
+
+def test_tasks_list_stream_reads_all_pages() -> None:
+    requested: typing.List[httpx.Request] = []
+    client = mock_client(_tasks_handler([], requested))
+    tasks = list(client.tasks.list(project=1, selected_items="[1]", stream=True))
+    assert [task.id for task in tasks] == [1, 2, 3]
+    assert all(isinstance(task, LseTask) for task in tasks)
+    assert requested[0].url.params["selectedItems"] == "[1]"
+    assert requested[0].url.params["fields"] == "all"
+    assert [int(request.url.params["page"]) for request in requested] == [1, 2, 3]
+
+
+def test_tasks_list_stream_raw_mode_and_errors() -> None:
+    client = mock_client(_tasks_handler([], []), response_mode="raw")
+    assert list(client.tasks.list(project=1, stream=True))[0] == {"id": 1, "data": {"value": 1.5}}
+    with pytest.raises(ValueError):
+        client.tasks.list(project=1, stream=True, concurrency=4)
+    # unknown arguments are rejected like in the non-streaming list, not sent as query parameters
+    with pytest.raises(TypeError):
+        client.tasks.list(project=1, stream=True, selectedItems="[1]")
+
+    failing = mock_client(lambda request: httpx.Response(500, json={"detail": "boom"}))
+    with pytest.raises(ApiError) as error:
+        list(failing.tasks.list(project=1, stream=True))
+    assert error.value.status_code == 500
+
+
+async def test_async_tasks_list_stream() -> None:
+    client = mock_client(_tasks_handler([], []), is_async=True)
+    tasks = await client.tasks.list(project=1, stream=True)
+    assert [task.id async for task in tasks] == [1, 2, 3]
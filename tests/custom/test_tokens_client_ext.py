@@ -1,5 +1,7 @@
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import jwt
 import pytest
@@ -60,3 +62,67 @@ def test_jwt_token_type_returns_none_for_legacy(tokens_client: TokensClientExt)
 
 def test_jwt_token_type_returns_claim_for_jwt(tokens_client: TokensClientExt) -> None:
     assert tokens_client.jwt_token_type(_jwt("access")) == "access"
+
+
+def test_api_key_does_not_decode_cached_access_token(tokens_client: TokensClientExt) -> None:
+    access = _jwt("access")
+    with patch.object(tokens_client, "refresh", return_value=TokenRefreshResponse(access=access)) as mock_refresh:
+        assert tokens_client.api_key == access
+        with patch("label_studio_sdk.tokens.client_ext.jwt.decode") as mock_decode:
+            for _ in range(10):
+                assert tokens_client.api_key == access
+    mock_refresh.assert_called_once()
+    mock_decode.assert_not_called()
+
+
+def _short_lived_access(jti: str, seconds: int = 10) -> str:
+    claims = {"token_type": "access", "exp": int(time.time()) + seconds, "jti": jti}
+    return jwt.encode(claims, "secret", algorithm="HS256")
+
+
+def test_api_key_refreshes_inside_refresh_window(tokens_client: TokensClientExt) -> None:
+    # expires in 10 seconds, shorter than the default 30 seconds window, which is clamped to half of it
+    soon = _short_lived_access("soon")
+    later = _jwt("access", jti="later")
+    with patch.object(
+        tokens_client,
+        "refresh",
+        side_effect=[TokenRefreshResponse(access=soon), TokenRefreshResponse(access=later)],
+    ) as mock_refresh:
+        assert tokens_client.api_key == soon
+        assert tokens_client.api_key == soon
+        now = time.monotonic()
+        with patch("label_studio_sdk.tokens.client_ext.time.monotonic", return_value=now + 6):
+            assert tokens_client.api_key == later
+            assert tokens_client.api_key == later
+    assert mock_refresh.call_count == 2
+
+
+def test_short_lived_access_tokens_are_not_refreshed_on_every_request(tokens_client: TokensClientExt) -> None:
+    with patch.object(
+        tokens_client,
+        "refresh",
+        side_effect=lambda: TokenRefreshResponse(access=_short_lived_access("short")),
+    ) as mock_refresh:
+        for _ in range(10):
+            tokens_client.api_key
+    mock_refresh.assert_called_once()
+
+
+def test_api_key_claims_are_decoded_once(tokens_client: TokensClientExt) -> None:
+    with patch.object(type(tokens_client), "api_key", new_callable=PropertyMock, return_value="access"):
+        with patch("label_studio_sdk.tokens.client_ext.jwt.decode") as mock_decode:
+            for _ in range(10):
+                assert tokens_client.resolve_x_api_key_header_value(tokens_client._api_key) == "access"
+    mock_decode.assert_not_called()
+
+
+async def test_async_api_key_uses_async_refresh(tokens_client: TokensClientExt) -> None:
+    access = _jwt("access")
+    with patch.object(tokens_client, "refresh") as mock_refresh, patch.object(
+        tokens_client, "async_refresh", new_callable=AsyncMock, return_value=TokenRefreshResponse(access=access)
+    ) as mock_async_refresh:
+        results = await asyncio.gather(*(tokens_client.async_api_key() for _ in range(5)))
+    assert results == [access] * 5
+    mock_async_refresh.assert_awaited_once()
+    mock_refresh.assert_not_called()